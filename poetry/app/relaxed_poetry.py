@@ -1,6 +1,7 @@
 import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 from poetry.__version__ import __version__
 from poetry.app.relaxed_poetry_updater import RelaxedPoetryUpdater
@@ -17,6 +18,10 @@ from poetry.templates.template_executor import TemplateExecutor
 from poetry.utils.appdirs import user_data_dir
 from poetry.utils.authenticator import Authenticator
 
+if TYPE_CHECKING:
+    from poetry.inspection.build_envs import MetadataBuildEnvs
+    from poetry.puzzle.provider import ProviderCache
+
 
 class RelaxedPoetry:
     _instance: "RelaxedPoetry" = None
@@ -27,6 +32,9 @@ class RelaxedPoetry:
         self._updater = RelaxedPoetryUpdater(self)
         self.artifacts = Artifacts(Path(CACHE_DIR) / "artifacts")
         self._plugin_manager: Optional[PluginManager] = None
+        self._provider_cache: Optional["ProviderCache"] = None
+        self._metadata_build_envs: Optional["MetadataBuildEnvs"] = None
+        self._lock = threading.Lock()
 
     def activate_plugins(self, disable_plugins: bool = False):
         if self._plugin_manager:
@@ -77,6 +85,28 @@ class RelaxedPoetry:
     def authenticator(self) -> Authenticator:
         return Authenticator(self.config, console.io)
 
+    @property
+    def provider_cache(self) -> "ProviderCache":
+        # providers of several projects may be created concurrently, see ManagedProject.run_on_projects_graph
+        with self._lock:
+            if self._provider_cache is None:
+                from poetry.puzzle.provider import ProviderCache
+
+                self._provider_cache = ProviderCache()
+
+            return self._provider_cache
+
+    @property
+    def metadata_build_envs(self) -> "MetadataBuildEnvs":
+        # sources are inspected concurrently by the solver, see VersionPrefetcher
+        with self._lock:
+            if self._metadata_build_envs is None:
+                from poetry.inspection.build_envs import MetadataBuildEnvs
+
+                self._metadata_build_envs = MetadataBuildEnvs(Path(CACHE_DIR) / "build-envs")
+
+            return self._metadata_build_envs
+
     def execute_template(
             self, descriptor: str, out_path: Path,
             args: List[str], kwargs: Dict[str, str],
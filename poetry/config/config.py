@@ -29,6 +29,14 @@ def boolean_normalizer(val: str) -> bool:
     return val in ["true", "1"]
 
 
+def int_validator(val: str) -> bool:
+    return val.isdigit()
+
+
+def int_normalizer(val: str) -> int:
+    return int(val)
+
+
 class Config:
     default_config = {
         "cache-dir": str(CACHE_DIR),
@@ -40,7 +48,15 @@ class Config:
             "options": {"always-copy": False, "system-site-packages": False},
         },
         "experimental": {"new-installer": True},
-        "installer": {"parallel": True},
+        "installer": {
+            "parallel": True,
+            "native": False,
+            "link-mode": "copy",
+            "bytecode": {"compile": False, "workers": 0, "invalidation-mode": "timestamp"},
+        },
+        "solver": {"prefetch": {"workers": 6, "candidates": 3, "depth": 1}, "incremental": True, "override-workers": 4},
+        "workspace": {"workers": 1},
+        "http": {"retries": 5, "retry-backoff-ms": 500, "max-connections-per-host": 16},
     }
 
     def __init__(
@@ -144,9 +160,25 @@ class Config:
             "virtualenvs.options.always-copy",
             "virtualenvs.options.system-site-packages",
             "installer.parallel",
+            "installer.native",
+            "installer.bytecode.compile",
+            "solver.incremental",
         }:
             return boolean_normalizer
 
+        if name in {
+            "solver.prefetch.workers",
+            "solver.prefetch.candidates",
+            "solver.prefetch.depth",
+            "installer.bytecode.workers",
+            "solver.override-workers",
+            "workspace.workers",
+            "http.retries",
+            "http.retry-backoff-ms",
+            "http.max-connections-per-host",
+        }:
+            return int_normalizer
+
         if name == "virtualenvs.path":
             return lambda val: str(Path(val))
 
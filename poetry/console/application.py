@@ -160,7 +160,24 @@ class Application(BaseApplication):
 
         self._load_plugins(io)
 
-        return super()._run(io)
+        try:
+            return super()._run(io)
+        finally:
+            self._print_http_metrics(io)
+
+    @staticmethod
+    def _print_http_metrics(io: IO) -> None:
+        if not io.is_debug():
+            return
+
+        from poetry.utils import http
+
+        metrics = http.metrics()
+        if metrics["requests"]:
+            io.write_line(
+                "<debug>HTTP: {requests} requests, {connections_opened} connections opened, "
+                "{connections_reused} reused, {bytes_read} bytes read</debug>".format(**metrics)
+            )
 
     def _configure_io(self, io: IO) -> None:
         # We need to check if the command being run
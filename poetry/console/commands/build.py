@@ -27,8 +27,7 @@ class BuildCommand(EnvCommand):
         if self.option("format"):
             fmt = self.option("format")
 
-        for poetry in self.poetry.projects_graph():
-            self._build(fmt, poetry)
+        self.poetry.run_on_projects_graph(lambda poetry: self._build(fmt, poetry))
 
     def _build(self, fmt: str, poetry: ManagedProject):
         if poetry.env is None:
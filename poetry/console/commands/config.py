@@ -53,7 +53,11 @@ To remove a repository (repo is a short alias for repositories):
 
         from poetry.config.config import boolean_normalizer
         from poetry.config.config import boolean_validator
+        from poetry.config.config import int_normalizer
+        from poetry.config.config import int_validator
+        from poetry.installation.bytecode_compiler import INVALIDATION_MODES
         from poetry.locations import CACHE_DIR
+        from poetry.utils.helpers import LINK_MODES
 
         unique_config_values = {
             "cache-dir": (
@@ -88,6 +92,36 @@ To remove a repository (repo is a short alias for repositories):
                 boolean_normalizer,
                 True,
             ),
+            "installer.native": (
+                boolean_validator,
+                boolean_normalizer,
+                False,
+            ),
+            "installer.link-mode": (
+                lambda val: val in LINK_MODES,
+                lambda val: val,
+                "copy",
+            ),
+            "installer.bytecode.compile": (
+                boolean_validator,
+                boolean_normalizer,
+                False,
+            ),
+            "installer.bytecode.workers": (int_validator, int_normalizer, 0),
+            "installer.bytecode.invalidation-mode": (
+                lambda val: val in INVALIDATION_MODES,
+                lambda val: val,
+                "timestamp",
+            ),
+            "solver.prefetch.workers": (int_validator, int_normalizer, 6),
+            "solver.prefetch.candidates": (int_validator, int_normalizer, 3),
+            "solver.prefetch.depth": (int_validator, int_normalizer, 1),
+            "solver.incremental": (boolean_validator, boolean_normalizer, True),
+            "solver.override-workers": (int_validator, int_normalizer, 4),
+            "workspace.workers": (int_validator, int_normalizer, 1),
+            "http.retries": (int_validator, int_normalizer, 5),
+            "http.retry-backoff-ms": (int_validator, int_normalizer, 500),
+            "http.max-connections-per-host": (int_validator, int_normalizer, 16),
         }
 
         return unique_config_values
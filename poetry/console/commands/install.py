@@ -1,5 +1,6 @@
 from poetry.console import console
 from poetry.console.commands.command import Command
+from poetry.managed_project import ManagedProject
 
 
 class InstallCommand(Command):
@@ -42,7 +43,7 @@ class InstallCommand(Command):
 
         project = rp.active_project
 
-        for subp in project.projects_graph():
+        def install(subp: ManagedProject) -> int:
             if subp.env:
                 subp.install(
                     self.argument("packages"),
@@ -63,4 +64,6 @@ class InstallCommand(Command):
                     f"<info>Skipping {subp.pyproject.name}, it does not requires python interpreter and therefore cannot have dependencies.</>\n"
                     "To change that, add a python dependency to <c1>pyproject.toml</c1>")
 
-        return 0
+            return 0
+
+        return project.run_on_projects_graph(install)
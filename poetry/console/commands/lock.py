@@ -2,6 +2,7 @@ from cleo.helpers import option
 
 from .installer_command import InstallerCommand
 from .. import console
+from ...managed_project import ManagedProject
 
 
 class LockCommand(InstallerCommand):
@@ -31,22 +32,23 @@ file.
     loggers = ["poetry.repositories.pypi_repository"]
 
     def handle(self) -> int:
+        return self.poetry.run_on_projects_graph(self._lock)
 
-        for poetry in self.poetry.projects_graph():
-            if poetry.env is None:
-                continue
+    def _lock(self, poetry: ManagedProject) -> int:
+        if poetry.env is None:
+            return 0
 
-            console.println(f"locking project: <c1>{poetry.pyproject.name}</c1>")
+        console.println(f"locking project: <c1>{poetry.pyproject.name}</c1>")
 
-            if self.option("check"):
-                if not (poetry.locker.is_locked() and poetry.locker.is_fresh()):
-                    return 1
-            else:
-                poetry.installer.lock(update=not self.option("no-update"))
+        if self.option("check"):
+            if not (poetry.locker.is_locked() and poetry.locker.is_fresh()):
+                return 1
+        else:
+            poetry.installer.lock(update=not self.option("no-update"))
 
-                try:
-                    poetry.installer.run()
-                except ChildProcessError as e:
-                    return int(str(e))
+            try:
+                poetry.installer.run()
+            except ChildProcessError as e:
+                return int(str(e))
 
         return 0
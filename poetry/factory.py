@@ -1,10 +1,14 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import hashlib
+import threading
 from pathlib import Path
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import TYPE_CHECKING
 
 from cleo.io.io import IO
@@ -24,6 +28,7 @@ from .repositories.pypi_repository import PyPiRepository
 
 if TYPE_CHECKING:
     from .repositories.legacy_repository import LegacyRepository
+    from .repositories.repository import Repository
     from .utils.env import Env
 
 
@@ -32,6 +37,11 @@ class Factory(BaseFactory):
     Factory class to create various elements needed by Poetry.
     """
 
+    # repositories are shared by all the projects loaded in this process (e.g., the sub-projects of a workspace),
+    # so that their in-memory caches are shared as well
+    _repositories: Dict[Tuple, "Repository"] = {}
+    _repositories_lock = threading.Lock()
+
     def create_poetry_for_pyproject(
             self, project: Project, *,
             env: Optional["Env"] = None):
@@ -123,7 +133,17 @@ class Factory(BaseFactory):
             cls, poetry: "ManagedProject", sources: List[Dict[str, str]], config: "Config", io: "IO"
     ) -> None:
         for source in sources:
-            repository = cls.create_legacy_repository(source, config)
+            repository = cls._shared_repository(
+                (
+                    "legacy",
+                    source.get("name"),
+                    source.get("url"),
+                    str(config.get(f"certificates.{source.get('name')}")),
+                    # credentials are not kept in the key of the process wide cache, only their digest
+                    hashlib.sha256(str(config.get(f"http-basic.{source.get('name')}")).encode()).hexdigest(),
+                ),
+                lambda: cls.create_legacy_repository(source, config),
+            )
             is_default = source.get("default", False)
             is_secondary = source.get("secondary", False)
             if io.is_debug():
@@ -147,7 +167,16 @@ class Factory(BaseFactory):
                 io.write_line("Deactivating the PyPI repository")
         else:
             default = not poetry.pool.has_primary_repositories()
-            poetry.pool.add_repository(PyPiRepository(), default, not default)
+            poetry.pool.add_repository(cls._shared_repository(("pypi",), PyPiRepository), default, not default)
+
+    @classmethod
+    def _shared_repository(cls, key: Tuple, create: Callable[[], "Repository"]) -> "Repository":
+        with cls._repositories_lock:
+            repository = cls._repositories.get(key)
+            if repository is None:
+                repository = cls._repositories[key] = create()
+
+            return repository
 
     @classmethod
     def create_legacy_repository(
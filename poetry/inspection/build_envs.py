@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from poetry.core.utils import toml
+from poetry.utils.env import EnvManager
+from poetry.utils.env import VirtualEnv
+
+# the packages required by the hook script, on top of the build requirements of the source
+BUILD_ENV_DEPS = ["pep517===0.8.2", "toml==0.10.1"]
+
+# the build system assumed by pep517 for sources without a [build-system] table
+DEFAULT_BUILD_REQUIRES = ["setuptools>=40.8.0", "wheel"]
+
+_HOOK_SCRIPT = """\
+import json
+import sys
+
+from pep517.build import compat_system
+from pep517.wrappers import Pep517HookCaller
+
+hook, source, dest = sys.argv[1:4]
+system = compat_system(source)
+hooks = Pep517HookCaller(source, system["build-backend"], system.get("backend-path"))
+if hook == "requires":
+    result = hooks.get_requires_for_build_wheel()
+else:
+    result = hooks.prepare_metadata_for_build_wheel(dest)
+
+print(json.dumps(result))
+"""
+
+
+class MetadataBuildEnvs:
+    """
+    A pool of virtual environments used to prepare the metadata of source distributions.
+
+    Environments are keyed by the interpreter and the build requirements they were provisioned with and are
+    kept under `root`, so sources with the same build system share a single environment across calls and
+    runs. The `prepare_metadata_for_build_wheel` hook runs directly in the pooled environment and up to
+    `max_workers` hooks may run concurrently.
+    """
+
+    def __init__(self, root: Path, max_workers: Optional[int] = None) -> None:
+        self._root = root
+        self._lock = threading.Lock()
+        self._env_locks: Dict[str, threading.Lock] = {}
+        self._hook_slots = threading.BoundedSemaphore(max_workers or os.cpu_count() or 1)
+
+    def prepare_metadata(self, source: Path, dest: Path) -> Path:
+        """
+        Prepares the metadata of the given source directory into dest, returns the created .dist-info directory.
+        Raises EnvCommandError if the build backend fails.
+        """
+        requires = self.build_requires(source)
+        env = self.get(requires)
+
+        dynamic_requires = [r for r in self._run_hook(env, "requires", source, dest) if r not in requires]
+        if dynamic_requires:
+            env = self.get(requires + dynamic_requires)
+
+        return dest / self._run_hook(env, "metadata", source, dest)
+
+    def get(self, requires: List[str]) -> VirtualEnv:
+        """
+        Returns the pooled environment with the given build requirements, provisioning it if needed.
+        """
+        key = self._key(requires)
+        path = self._root / key
+
+        with self._env_lock(key):
+            if not (path / ".ready").exists():
+                with _file_lock(path.with_name(f"{path.name}.lock")):
+                    # another process may have provisioned it while we waited for the lock
+                    if not (path / ".ready").exists():
+                        self._provision(path, requires)
+
+        return VirtualEnv(path, path)
+
+    @staticmethod
+    def build_requires(source: Path) -> List[str]:
+        pyproject = source / "pyproject.toml"
+        if pyproject.exists():
+            try:
+                data, _ = toml.load(pyproject)
+                requires = data["build-system"]["requires"]
+                if isinstance(requires, list):
+                    return [str(r) for r in requires]
+            except Exception:
+                pass
+
+        return list(DEFAULT_BUILD_REQUIRES)
+
+    def _run_hook(self, env: VirtualEnv, hook: str, source: Path, dest: Path):
+        with self._hook_slots:
+            output = env.run(
+                "python", "-", hook, source.as_posix(), dest.as_posix(), input_=_HOOK_SCRIPT, cwd=source.as_posix()
+            )
+
+        # the backend output precedes the hook result
+        return json.loads(output.strip().splitlines()[-1])
+
+    def _provision(self, path: Path, requires: List[str]) -> None:
+        # provisioned in place since virtual environments cannot be relocated (scripts refer to their interpreter),
+        # the .ready marker is only written once the environment is complete
+        if path.exists():
+            shutil.rmtree(path)
+
+        EnvManager.build_venv(path.as_posix(), with_pip=True, with_wheel=True, with_setuptools=True)
+        env = VirtualEnv(path, path)
+        env.run_pip("install", "--disable-pip-version-check", "--ignore-installed", *BUILD_ENV_DEPS, *requires)
+        (path / ".ready").write_text(json.dumps(requires), encoding="utf-8")
+
+    def _env_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._env_locks.get(key)
+            if lock is None:
+                lock = self._env_locks[key] = threading.Lock()
+
+            return lock
+
+    @staticmethod
+    def _key(requires: List[str]) -> str:
+        executable = Path(sys.executable).resolve()
+        stat = executable.stat()
+        fingerprint = json.dumps(
+            [str(executable), stat.st_mtime_ns, stat.st_size, sorted(set(BUILD_ENV_DEPS + requires))]
+        )
+
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """
+    Holds an exclusive lock on the given file, used to provision an environment from a single process at a time.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after about 10 seconds
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -1,6 +1,5 @@
 import glob
 import logging
-import os
 import tarfile
 import zipfile
 
@@ -22,22 +21,10 @@ from poetry.core.utils.helpers import parse_requires
 from poetry.core.utils.helpers import temporary_directory
 from poetry.core.version.markers import InvalidMarker
 from poetry.utils.env import EnvCommandError
-from poetry.utils.env import ephemeral_environment
 from poetry.utils.setup_reader import SetupReader
 
 logger = logging.getLogger(__name__)
 
-PEP517_META_BUILD = """\
-import pep517.build
-import pep517.meta
-
-path='{source}'
-system=pep517.build.compat_system(path)
-pep517.meta.build(source_dir=path, dest='{dest}', system=system)
-"""
-
-PEP517_META_BUILD_DEPS = ["pep517===0.8.2", "toml==0.10.1"]
-
 
 class PackageInfoError(ValueError):
     def __init__(
@@ -457,28 +444,15 @@ class PackageInfo:
         except PackageInfoError:
             pass
 
-        with ephemeral_environment(
-                with_pip=True, with_wheel=True, with_setuptools=True
-        ) as venv:
-            # TODO: cache PEP 517 build environment corresponding to each project venv
-            dest_dir = venv.path.parent / "dist"
+        from poetry.app.relaxed_poetry import rp
+
+        build_envs = rp.metadata_build_envs
+        with temporary_directory() as tmp_dir:
+            dest_dir = Path(tmp_dir) / "dist"
             dest_dir.mkdir()
 
             try:
-                venv.run_pip(
-                    "install",
-                    "--disable-pip-version-check",
-                    "--ignore-installed",
-                    *PEP517_META_BUILD_DEPS,
-                )
-                venv.run(
-                    "python",
-                    "-",
-                    input_=PEP517_META_BUILD.format(
-                        source=path.as_posix(), dest=dest_dir.as_posix()
-                    ),
-                )
-                return cls.from_metadata(dest_dir)
+                return cls.from_metadata(build_envs.prepare_metadata(path, dest_dir))
             except EnvCommandError as e:
                 # something went wrong while attempting pep517 metadata build
                 # fallback to egg_info if setup.py available
@@ -491,17 +465,14 @@ class PackageInfo:
                         "No fallback setup.py file was found to generate egg_info.",
                     )
 
-                cwd = Path.cwd()
-                os.chdir(path.as_posix())
                 try:
-                    venv.run("python", "setup.py", "egg_info")
+                    venv = build_envs.get(build_envs.build_requires(path))
+                    venv.run("python", "setup.py", "egg_info", cwd=path.as_posix())
                     return cls.from_metadata(path)
                 except EnvCommandError as fbe:
                     raise PackageInfoError(
                         path, "Fallback egg_info generation failed.", fbe
                     )
-                finally:
-                    os.chdir(cwd.as_posix())
 
         if info:
             cls._log(f"Falling back to parsed setup.py file for {path}", "debug")
@@ -570,6 +541,33 @@ class PackageInfo:
         except ValueError:
             return PackageInfo()
 
+    @classmethod
+    def from_wheel_metadata(cls, metadata: bytes, url: str) -> "PackageInfo":
+        """
+        Gather package information from the `METADATA` file of a remote wheel.
+
+        :param metadata: Content of the wheel METADATA file.
+        :param url: Url of the wheel.
+        """
+        dist = pkginfo.Distribution()
+        dist.filename = url
+        dist.parse(metadata)
+
+        # remote wheels do not have a requires.txt, requires_dist is all there is
+        info = cls(
+            name=dist.name,
+            version=dist.version,
+            summary=dist.summary,
+            platform=dist.supported_platforms,
+            requires_dist=list(dist.requires_dist) or None,
+            requires_python=dist.requires_python,
+        )
+
+        info._source_type = "url"
+        info._source_url = url
+
+        return info
+
     @classmethod
     def from_bdist(cls, path: Path) -> "PackageInfo":
         """
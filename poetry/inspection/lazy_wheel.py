@@ -0,0 +1,132 @@
+import io
+import zipfile
+
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Optional
+
+if TYPE_CHECKING:
+    from poetry.utils.authenticator import Authenticator
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class HTTPRangeRequestUnsupported(Exception):
+    pass
+
+
+class LazyZipOverHTTP(io.RawIOBase):
+    """
+    A read-only file over a remote file, which only downloads (using http range requests) the parts being read.
+    Used to read single members of remote zip archives, which only requires the central directory at the end
+    of the archive and the member itself.
+    """
+
+    def __init__(self, url: str, authenticator: "Authenticator", chunk_size: int = _CHUNK_SIZE) -> None:
+        super().__init__()
+
+        head = authenticator.request("head", url)
+        if head.headers.get("Accept-Ranges", "none") != "bytes" or "Content-Length" not in head.headers:
+            raise HTTPRangeRequestUnsupported(f"range requests are not supported by {url}")
+
+        self._url = url
+        self._authenticator = authenticator
+        self._chunk_size = chunk_size
+        self._length = int(head.headers["Content-Length"])
+        self._position = 0
+        self._chunks: Dict[int, bytes] = {}
+
+        # the central directory is at the end of the file, fetch it along with the end of central directory record
+        self._fetch(max(self._length - self._chunk_size, 0), self._length)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._length + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+
+        self._position = min(max(position, 0), self._length)
+        return self._position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        start = self._position
+        end = self._length if size is None or size < 0 else min(start + size, self._length)
+        if start >= end:
+            return b""
+
+        self._fetch(start, end)
+
+        data = bytearray()
+        for index in range(start // self._chunk_size, (end - 1) // self._chunk_size + 1):
+            chunk_start = index * self._chunk_size
+            chunk = self._chunks[index]
+            data += chunk[max(start - chunk_start, 0):end - chunk_start]
+
+        self._position = end
+        return bytes(data)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def _fetch(self, start: int, end: int) -> None:
+        """
+        Downloads the missing chunks of the given byte range, consecutive missing chunks are requested together.
+        """
+        first, last = start // self._chunk_size, (end - 1) // self._chunk_size
+
+        index = first
+        while index <= last:
+            if index in self._chunks:
+                index += 1
+                continue
+
+            missing_end = index
+            while missing_end + 1 <= last and missing_end + 1 not in self._chunks:
+                missing_end += 1
+
+            range_start = index * self._chunk_size
+            range_end = min((missing_end + 1) * self._chunk_size, self._length) - 1
+            response = self._authenticator.request(
+                "get", self._url, headers={"Range": f"bytes={range_start}-{range_end}"}
+            )
+            if response.status_code != 206:
+                raise HTTPRangeRequestUnsupported(f"range requests are not supported by {self._url}")
+
+            content = response.content
+            if len(content) != range_end - range_start + 1:
+                raise HTTPRangeRequestUnsupported(f"unexpected range response from {self._url}")
+
+            for i in range(index, missing_end + 1):
+                offset = (i - index) * self._chunk_size
+                self._chunks[i] = content[offset:offset + self._chunk_size]
+
+            index = missing_end + 1
+
+
+def wheel_metadata(url: str, authenticator: "Authenticator") -> bytes:
+    """
+    Reads the `METADATA` file of the remote wheel at the given url without downloading the whole wheel.
+    Raises HTTPRangeRequestUnsupported if the server does not support range requests.
+    """
+    with zipfile.ZipFile(LazyZipOverHTTP(url, authenticator)) as wheel:
+        for name in wheel.namelist():
+            parts = name.split("/")
+            if len(parts) == 2 and parts[0].endswith(".dist-info") and parts[1] == "METADATA":
+                return wheel.read(name)
+
+    raise zipfile.BadZipFile(f"no METADATA file found in {url}")
@@ -0,0 +1,122 @@
+import json
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from poetry.utils.helpers import temporary_directory
+
+if TYPE_CHECKING:
+    from poetry.utils.env import Env
+
+INVALIDATION_MODES = ("timestamp", "checked-hash", "unchecked-hash")
+
+# executed by the environment interpreter so that the bytecode matches it, the records to compile are read
+# from the json file given as the first argument and the compilation time of each record is printed as json
+_COMPILE_SCRIPT = """\
+import compileall
+import importlib.util
+import json
+import os
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNK_SIZE = 64
+
+
+def compile_chunk(sources, invalidation_mode):
+    kwargs = {}
+    if invalidation_mode is not None:
+        import py_compile
+
+        kwargs["invalidation_mode"] = py_compile.PycInvalidationMode[invalidation_mode.upper().replace("-", "_")]
+
+    start = time.perf_counter()
+    compiled = []
+    for source in sources:
+        if compileall.compile_file(source, quiet=2, **kwargs):
+            compiled.append(importlib.util.cache_from_source(source))
+
+    return compiled, time.perf_counter() - start
+
+
+def main():
+    with open(sys.argv[1], encoding="utf-8") as f:
+        job = json.load(f)
+
+    records = job["records"]
+    invalidation_mode = job["invalidation_mode"]
+    if invalidation_mode is not None and sys.version_info < (3, 7):
+        invalidation_mode = None
+
+    chunks = [
+        (record, sources[i:i + CHUNK_SIZE])
+        for record, sources in records.items()
+        for i in range(0, len(sources), CHUNK_SIZE)
+    ]
+
+    if job["workers"] == 1 or len(chunks) < 2:
+        results = [compile_chunk(sources, invalidation_mode) for _, sources in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=job["workers"] or None) as pool:
+            results = list(pool.map(compile_chunk, [c[1] for c in chunks], [invalidation_mode] * len(chunks)))
+
+    timings = {record: 0.0 for record in records}
+    compiled = {record: [] for record in records}
+    for (record, _), (chunk_compiled, elapsed) in zip(chunks, results):
+        timings[record] += elapsed
+        compiled[record].extend(chunk_compiled)
+
+    for record, pycs in compiled.items():
+        root = os.path.dirname(os.path.dirname(record))
+        with open(record, "a", encoding="utf-8") as f:
+            for pyc in pycs:
+                if os.path.exists(pyc):
+                    f.write(os.path.relpath(pyc, root) + ",,\\n")
+
+    print(json.dumps(timings))
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+class BytecodeCompiler:
+    """
+    Compiles installed python sources using the interpreter of the given environment.
+
+    Sources are grouped by the RECORD file of the distribution that installed them, the generated `.pyc`
+    files are appended to that RECORD so that they are removed with the distribution.
+    With more than one worker the sources are compiled by a process pool of the environment interpreter.
+    """
+
+    def __init__(self, env: "Env", workers: int = 1, invalidation_mode: Optional[str] = None) -> None:
+        self._env = env
+        self._workers = workers
+        self._invalidation_mode = invalidation_mode
+
+    def compile(self, records: Dict[Path, List[Path]]) -> Dict[Path, float]:
+        """
+        Compiles the given sources, returns the compilation time (in seconds) of each record.
+        """
+        job = {
+            "records": {str(record): [str(source) for source in sources] for record, sources in records.items()},
+            "workers": self._workers,
+            "invalidation_mode": self._invalidation_mode,
+        }
+
+        with temporary_directory() as tmp_dir:
+            script = Path(tmp_dir) / "compile.py"
+            script.write_text(_COMPILE_SCRIPT, encoding="utf-8")
+            job_file = Path(tmp_dir) / "job.json"
+            job_file.write_text(json.dumps(job), encoding="utf-8")
+
+            output = self._env.run(self._env.python, "-W", "ignore", str(script), str(job_file))
+
+        timings = json.loads(output.strip().splitlines()[-1])
+        return {Path(record): elapsed for record, elapsed in timings.items()}
@@ -1,8 +1,12 @@
 import re
 
+from functools import lru_cache
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
+from typing import Union
 
 from packaging.tags import Tag
 
@@ -35,13 +39,29 @@ class Wheel:
             Tag(x, y, z) for x in self.pyversions for y in self.abis for z in self.plats
         }
 
-    def get_minimum_supported_index(self, tags: List[Tag]) -> Optional[int]:
-        indexes = [tags.index(t) for t in self.tags if t in tags]
+    def get_minimum_supported_index(self, tags: Union[List[Tag], Dict[Tag, int]]) -> Optional[int]:
+        """
+        Returns the lowest index of the tags of this wheel in the given tags, which may also be given as
+        a tag to index mapping (see `Env.supported_tags_priority`).
+        """
+        if not isinstance(tags, dict):
+            tags = {tag: index for index, tag in reversed(list(enumerate(tags)))}
+
+        indexes = [tags[t] for t in self.tags if t in tags]
 
         return min(indexes) if indexes else None
 
     def is_supported_by_environment(self, env: Env) -> bool:
-        return bool(set(env.supported_tags).intersection(self.tags))
+        priorities = env.supported_tags_priority
+        return any(t in priorities for t in self.tags)
+
+
+@lru_cache(maxsize=4096)
+def parse_wheel(filename: str) -> Wheel:
+    """
+    Returns the (shared) Wheel of the given filename, raises InvalidWheelName if it is not a wheel filename.
+    """
+    return Wheel(filename)
 
 
 class Chooser:
@@ -59,7 +79,7 @@ class Chooser:
         """
         links = []
         for link in self._get_links(package):
-            if link.is_wheel and not Wheel(link.filename).is_supported_by_environment(
+            if link.is_wheel and not parse_wheel(link.filename).is_supported_by_environment(
                 self._env
             ):
                 continue
@@ -73,7 +93,8 @@ class Chooser:
             raise RuntimeError(f"Unable to find installation candidates for {package}")
 
         # Get the best link
-        chosen = max(links, key=lambda link: self._sort_key(package, link))
+        allowed_hashes = {f["hash"] for f in package.files}
+        chosen = max(links, key=lambda link: self._sort_key(package, link, allowed_hashes))
         if not chosen:
             raise RuntimeError(f"Unable to find installation candidates for {package}")
 
@@ -113,7 +134,7 @@ class Chooser:
 
         return selected_links
 
-    def _sort_key(self, package: Package, link: Link) -> Tuple:
+    def _sort_key(self, package: Package, link: Link, allowed_hashes: Optional[Set[str]] = None) -> Tuple:
         """
         Function to pass as the `key` argument to a call to sorted() to sort
         InstallationCandidates by preference.
@@ -141,7 +162,7 @@ class Chooser:
         build_tag = ()
         binary_preference = 0
         if link.is_wheel:
-            wheel = Wheel(link.filename)
+            wheel = parse_wheel(link.filename)
             if not wheel.is_supported_by_environment(self._env):
                 raise RuntimeError(
                     "{} is not a supported wheel for this platform. It "
@@ -149,7 +170,7 @@ class Chooser:
                 )
 
             # TODO: Binary preference
-            pri = -(wheel.get_minimum_supported_index(self._env.supported_tags))
+            pri = -(wheel.get_minimum_supported_index(self._env.supported_tags_priority))
             if wheel.build_tag is not None:
                 match = re.match(r"^(\d+)(.*)$", wheel.build_tag)
                 build_tag_groups = match.groups()
@@ -157,7 +178,7 @@ class Chooser:
         else:  # sdist
             pri = -support_num
 
-        has_allowed_hash = int(self._is_link_hash_allowed_for_package(link, package))
+        has_allowed_hash = int(self._is_link_hash_allowed_for_package(link, package, allowed_hashes))
 
         # TODO: Proper yank value
         yank_value = 0
@@ -171,10 +192,15 @@ class Chooser:
             pri,
         )
 
-    def _is_link_hash_allowed_for_package(self, link: Link, package: Package) -> bool:
+    def _is_link_hash_allowed_for_package(
+            self, link: Link, package: Package, allowed_hashes: Optional[Set[str]] = None
+    ) -> bool:
         if not link.hash:
             return True
 
         h = link.hash_name + ":" + link.hash
 
-        return h in {f["hash"] for f in package.files}
+        if allowed_hashes is None:
+            allowed_hashes = {f["hash"] for f in package.files}
+
+        return h in allowed_hashes
@@ -2,6 +2,9 @@ import csv
 import itertools
 import json
 import os
+import threading
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import wait
 from pathlib import Path
@@ -9,10 +12,13 @@ from subprocess import CalledProcessError
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Set
 from typing import TYPE_CHECKING
 from typing import Union
 
 from cleo.io.null_io import NullIO
+from cleo.io.outputs.output import Verbosity
 from poetry.core.packages.utils.link import Link
 from poetry.core.pyproject.project import Project
 
@@ -20,11 +26,13 @@ from poetry.utils._compat import decode
 from poetry.utils.env import EnvCommandError
 from poetry.utils.helpers import safe_rmtree
 from poetry.utils.pip import pip_editable_install
+from .bytecode_compiler import BytecodeCompiler
 from .chooser import Chooser
 from .operations.install import Install
 from .operations.operation import Operation
 from .operations.uninstall import Uninstall
 from .operations.update import Update
+from .wheel_installer import WheelInstaller
 from ..console import console
 from ..utils.pip import pip_install
 
@@ -67,6 +75,9 @@ class Executor:
             self._max_workers = 1
 
         self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        self._download_executor: Optional[ThreadPoolExecutor] = None
+        self._prepared: Dict[int, Future] = {}
+        self._serial_lock = threading.Lock()
         self._total_operations = 0
         self._executed_operations = 0
         self._executed = {"install": 0, "update": 0, "uninstall": 0}
@@ -77,6 +88,15 @@ class Executor:
         self._hashes: Dict[str, str] = {}
         self._config = project.config
 
+        self._wheel_installer = None
+        if self._config.get("installer.native", False) and WheelInstaller.is_supported():
+            self._wheel_installer = WheelInstaller(self._env, self._config.get("installer.link-mode", "copy"))
+
+        # installed RECORD file -> python sources which were installed without being compiled
+        self._uncompiled: Dict[Path, List[Path]] = {}
+        self._uncompiled_lock = threading.Lock()
+        self._compile_stage = self._config.get("installer.bytecode.compile", False)
+
     @property
     def installations_count(self) -> int:
         return self._executed["install"]
@@ -108,14 +128,13 @@ class Executor:
         return self
 
     def pip_install(
-            self, req: Union[Path, str], upgrade: bool = False, editable: bool = False
+            self, req: Union[Path, str], upgrade: bool = False, editable: bool = False, compile: bool = True
     ) -> int:
-        func = pip_install
-        if editable:
-            func = pip_editable_install
-
         try:
-            func(req, self._env, upgrade=upgrade)
+            if editable:
+                pip_editable_install(req, self._env)
+            else:
+                pip_install(req, self._env, upgrade=upgrade, compile=compile)
         except EnvCommandError as e:
             output = decode(e.e.output)
             if (
@@ -136,55 +155,177 @@ class Executor:
         if operations and (self._enabled or self._dry_run):
             self._display_summary(operations)
 
-        # We group operations by priority
-        groups = itertools.groupby(operations, key=lambda o: -o.priority)
         self._sections = dict()
 
         for operation in operations:
             self._sections[id(operation)] = console.dynamic_line(
                 f"  <fg=blue;options=bold>•</> {self.get_operation_message(operation)}: ")
 
-        for _, group in groups:
-            tasks = []
-            serial_operations = []
-            for operation in group:
-                if self._shutdown:
-                    break
+        # the download threads only live for a single execution
+        self._download_executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        if self._enabled and not self._dry_run:
+            self._prepare_archives(operations)
 
-                # Some operations are unsafe, we must execute them serially in a group
-                # https://github.com/python-poetry/poetry/issues/3086
-                # https://github.com/python-poetry/poetry/issues/2658
-                #
-                # We need to explicitly check source type here, see:
-                # https://github.com/python-poetry/poetry-core/pull/98
-                is_parallel_unsafe = operation.job_type == "uninstall" or (
-                        operation.package.develop
-                        and operation.package.source_type in {"directory", "sibling", "git"}
-                )
-                if not operation.skipped and is_parallel_unsafe:
-                    serial_operations.append(operation)
-                    continue
+        prerequisites = self._prerequisites(operations)
+        dependents: Dict[int, List[int]] = {index: [] for index in range(len(operations))}
+        for index, required in enumerate(prerequisites):
+            for prerequisite in required:
+                dependents[prerequisite].append(index)
 
-                tasks.append(self._executor.submit(self._execute_operation, operation))
+        remaining = [len(required) for required in prerequisites]
+        ready = [index for index, count in enumerate(remaining) if count == 0]
+        running: Dict[Future, int] = {}
 
-            try:
-                wait(tasks)
+        try:
+            while ready or running:
+                for index in ready:
+                    if self._shutdown:
+                        break
 
-                for operation in serial_operations:
-                    wait([self._executor.submit(self._execute_operation, operation)])
+                    running[self._executor.submit(self._execute_scheduled, operations[index])] = index
 
-            except KeyboardInterrupt:
-                self._shutdown = True
+                ready = []
+                if self._shutdown or not running:
+                    break
 
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for task in done:
+                    for dependent in dependents[running.pop(task)]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            ready.append(dependent)
+
+            wait(list(running))
+        except KeyboardInterrupt:
+            self._shutdown = True
+        finally:
             if self._shutdown:
                 # Cancelling further tasks from being executed
-                [task.cancel() for task in tasks]
+                for task in itertools.chain(running, self._prepared.values()):
+                    task.cancel()
                 self._executor.shutdown(wait=True)
 
-                break
+            self._download_executor.shutdown(wait=True)
+
+        self._prepared = {}
+
+        if self._uncompiled and not self._shutdown:
+            self._compile_bytecode()
 
         return 1 if self._shutdown else 0
 
+    @staticmethod
+    def _prerequisites(operations: List["OperationTypes"]) -> List[Set[int]]:
+        """
+        Computes, for every operation, the indices of the operations which must be completed before it starts.
+
+        The operations are expected in the order computed by the transaction, where the dependencies of a
+        package precede it, so only edges to preceding operations are kept, which also guarantees that
+        dependency cycles cannot deadlock the scheduler.
+        """
+        uninstalls: Set[int] = set()
+        by_name: Dict[str, List[int]] = {}
+        result = []
+
+        for index, operation in enumerate(operations):
+            package = operation.package
+            required = set(by_name.get(package.name, []))
+
+            if operation.job_type != "uninstall":
+                # removed distributions may own files of the installed ones (e.g., renamed distributions)
+                required.update(uninstalls)
+                for dependency in package.requires:
+                    required.update(by_name.get(dependency.name, []))
+            else:
+                uninstalls.add(index)
+
+            result.append(required)
+            by_name.setdefault(package.name, []).append(index)
+
+        return result
+
+    def _execute_scheduled(self, operation: "OperationTypes") -> None:
+        # Some operations are unsafe, we must execute them serially
+        # https://github.com/python-poetry/poetry/issues/3086
+        # https://github.com/python-poetry/poetry/issues/2658
+        #
+        # We need to explicitly check source type here, see:
+        # https://github.com/python-poetry/poetry-core/pull/98
+        is_parallel_unsafe = operation.job_type == "uninstall" or (
+                operation.package.develop
+                and operation.package.source_type in {"directory", "sibling", "git"}
+        )
+
+        if not operation.skipped and is_parallel_unsafe:
+            with self._serial_lock:
+                self._execute_operation(operation)
+        else:
+            self._execute_operation(operation)
+
+    def _prepare_archives(self, operations: List["OperationTypes"]) -> None:
+        """
+        Starts downloading the archives of the install operations, so that they are fetched while the
+        operations wait for their prerequisites.
+        """
+        for operation in operations:
+            if operation.skipped or operation.job_type == "uninstall":
+                continue
+
+            if operation.package.source_type in {"directory", "sibling", "git"}:
+                continue
+
+            self._prepared[id(operation)] = self._download_executor.submit(self._prepare_archive, operation)
+
+    def _prepare_archive(self, operation: Union[Install, Update]) -> Path:
+        package = operation.package
+        if package.source_type == "file":
+            return self._prepare_file(operation)
+        elif package.source_type == "url":
+            return self._download_link(operation, Link(package.source_url))
+
+        return self._download(operation)
+
+    def _compile_bytecode(self) -> None:
+        """
+        Compiles the sources installed without bytecode, using a single interpreter process (or process pool)
+        for all of them.
+        """
+        records, self._uncompiled = self._uncompiled, {}
+
+        if self._compile_stage:
+            compiler = BytecodeCompiler(
+                self._env,
+                workers=self._config.get("installer.bytecode.workers", 0),
+                invalidation_mode=self._config.get("installer.bytecode.invalidation-mode", "timestamp"),
+            )
+        else:
+            compiler = BytecodeCompiler(self._env)
+
+        console.println(
+            f"<debug>Compiling bytecode of {len(records)} installed packages</debug>", Verbosity.VERBOSE
+        )
+
+        timings = compiler.compile(records)
+
+        for record, elapsed in sorted(timings.items(), key=lambda item: -item[1]):
+            console.println(
+                f"  <debug>{record.parent.name[:-len('.dist-info')]}: "
+                f"{len(records[record])} files in {elapsed:.2f}s</debug>",
+                Verbosity.VERBOSE,
+            )
+
+    def _collect_uncompiled(self, package: "Package") -> None:
+        distribution = self._env.site_packages.find_distribution(package.name, writable_only=True)
+        if distribution is None or not distribution.files:
+            return
+
+        sources = [
+            Path(distribution.locate_file(file)) for file in distribution.files if file.suffix == ".py"
+        ]
+
+        with self._uncompiled_lock:
+            self._uncompiled[distribution._path / "RECORD"] = sources
+
     def _write(self, operation: "OperationTypes", line: str) -> None:
         if not self.supports_fancy_output() or not self._should_write_operation(
                 operation
@@ -418,15 +559,33 @@ class Executor:
         if package.source_type == "git":
             return self._install_git(operation)
 
-        if package.source_type == "file":
-            archive = self._prepare_file(operation)
-        elif package.source_type == "url":
-            archive = self._download_link(operation, Link(package.source_url))
-        else:
-            archive = self._download(operation)
+        prepared = self._prepared.get(id(operation))
+        archive = prepared.result() if prepared is not None else self._prepare_archive(operation)
 
         self._write(operation, "<info>Installing...</info>")
-        return self.pip_install(str(archive), upgrade=operation.job_type == "update")
+        # distributions which cannot be replaced natively (egg-info, no RECORD) are left to pip
+        if (
+                self._wheel_installer is not None
+                and archive.suffix == ".whl"
+                and self._wheel_installer.can_install(package.name)
+        ):
+            return self._install_wheel(archive)
+
+        if not self._compile_stage:
+            return self.pip_install(str(archive), upgrade=operation.job_type == "update")
+
+        status_code = self.pip_install(str(archive), upgrade=operation.job_type == "update", compile=False)
+        if status_code == 0:
+            self._collect_uncompiled(package)
+
+        return status_code
+
+    def _install_wheel(self, archive: Path) -> int:
+        record, sources = self._wheel_installer.install(archive)
+        with self._uncompiled_lock:
+            self._uncompiled[record] = sources
+
+        return 0
 
     def _update(self, operation: Union[Install, Update]) -> int:
         return self._install(operation)
@@ -440,6 +599,13 @@ class Executor:
             if src_dir.exists():
                 safe_rmtree(str(src_dir))
 
+        if self._wheel_installer is not None and self._wheel_installer.can_uninstall(package.name):
+            if not self._wheel_installer.uninstall(package.name):
+                self._write(operation, f"<error>Unable to find the installed files of {package.name}</error>")
+                return 1
+
+            return 0
+
         try:
             return self.run_pip("uninstall", package.name, "-y")
         except CalledProcessError as e:
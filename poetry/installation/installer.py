@@ -27,6 +27,7 @@ from ..console import console, NullPrinter
 
 if TYPE_CHECKING:
     from .operations import OperationTypes
+    from poetry.puzzle.transaction import Transaction
     from poetry.managed_project import ManagedProject
 
 
@@ -202,13 +203,20 @@ class Installer:
                 raise ValueError(f"Extra [{extra}] is not specified.")
 
         locked_repository = self._locker.locked_repository(True)
-        solver = Solver(
-            self._project,
-            locked_repository,
-            locked_repository,
-        )
+        changed = []
+        if self._project.config.get("solver.incremental", True):
+            changed = self._changed_requirements(locked_repository)
 
-        ops = solver.solve(use_latest=[]).calculate_operations()
+        if changed:
+            ops = self._solve_incrementally(locked_repository, locked_repository, changed).calculate_operations()
+        else:
+            solver = Solver(
+                self._project,
+                locked_repository,
+                locked_repository,
+            )
+
+            ops = solver.solve(use_latest=[]).calculate_operations()
 
         local_repo = Repository()
         self._populate_local_repo(local_repo, ops)
@@ -510,7 +518,7 @@ class Installer:
         ops = []
         requirements = {it.name: it for it in self._package.all_requires}
         installations = {it.name: it for it in installed_repo.packages}
-        lockes = {it.name: it for it in locked_repository.packages}
+        locked_by_name = {it.name: it for it in locked_repository.packages}
 
         # Filter the operations by comparing it with what is
         # currently installed and what is required to be installed
@@ -539,25 +547,90 @@ class Installer:
 
         # check if there were added packages that the lock does not know about
         for requirement in self._package.all_requires:
-            if requirement.name not in lockes:
+            if requirement.name not in locked_by_name:
                 requires_dependency_resolution.append(requirement.name)
 
         # if we requires dependency resolution it means that we deffer for the solver to find the required ops
         if requires_dependency_resolution:
             self._whitelist.extend(requires_dependency_resolution)
-            from poetry.puzzle import Solver
 
-            solver = Solver(
+            return self._solve_incrementally(
+                self._installed_repository, locked_repository, requires_dependency_resolution
+            ).calculate_operations()
+
+        return ops
+
+    def _changed_requirements(self, locked_repository: Repository) -> List[str]:
+        """
+        Returns the names of the project requirements which are not satisfied by the locked packages.
+        """
+        locked_by_name = {it.name: it for it in locked_repository.packages}
+
+        changed = []
+        for requirement in self._package.all_requires:
+            locked = locked_by_name.get(requirement.name)
+            if (
+                    locked is None
+                    or not requirement.accepts(locked)
+                    or not self._is_same_source(requirement, locked)
+            ):
+                changed.append(requirement.name)
+
+        return changed
+
+    @staticmethod
+    def _is_same_source(requirement: Dependency, locked: Package) -> bool:
+        # requirements on index packages have no source type while the packages locked from private indices are
+        # "legacy" ones
+        index_source_types = {None, "legacy"}
+        if requirement.source_type in index_source_types and locked.source_type in index_source_types:
+            return True
+
+        return requirement.source_type == locked.source_type
+
+    def _solve_incrementally(
+            self, installed_repository: Repository, locked_repository: Repository, changed: List[str]
+    ) -> "Transaction":
+        """
+        Re-resolves the changed requirements, and the locked packages they depend on, while every other locked
+        package is pinned to its locked version. Falls back to a regular resolution if the pinned packages
+        conflict with the changed requirements.
+        """
+        from poetry.puzzle import Solver
+        from poetry.puzzle.exceptions import SolverProblemError
+
+        def create_solver() -> Solver:
+            return Solver(
                 self._project,
-                self._installed_repository,
+                installed_repository,
                 locked_repository,
                 printer=console,
                 package=self._package,
             )
 
-            return solver.solve(use_latest=requires_dependency_resolution).calculate_operations()
+        if self._project.config.get("solver.incremental", True):
+            locked_by_name = {package.name: package for package in locked_repository.packages}
+
+            affected = set(changed)
+            pending = [name for name in changed if name in locked_by_name]
+            while pending:
+                for requirement in locked_by_name[pending.pop()].requires:
+                    if requirement.name not in affected:
+                        affected.add(requirement.name)
+                        if requirement.name in locked_by_name:
+                            pending.append(requirement.name)
+
+            pinned = [name for name in locked_by_name if name not in affected]
+            try:
+                return create_solver().solve(use_latest=changed, pinned=pinned)
+            except SolverProblemError as e:
+                console.println(
+                    f"<warning>Unable to resolve the changed dependencies against the lock file, "
+                    f"resolving all dependencies</>\n{e}",
+                    Verbosity.VERBOSE,
+                )
 
-        return ops
+        return create_solver().solve(use_latest=changed)
         #     is_installed = False
         #     for installed_package in installed_repo.packages:
         #         if locked.name == installed_package.name:
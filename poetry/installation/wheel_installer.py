@@ -0,0 +1,274 @@
+import base64
+import configparser
+import csv
+import hashlib
+import os
+import re
+import stat
+import sys
+
+from email.parser import Parser
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from poetry.utils.helpers import link_file
+
+if TYPE_CHECKING:
+    from poetry.utils.env import Env
+
+_SCRIPT_TEMPLATE = """\
+# -*- coding: utf-8 -*-
+import re
+import sys
+from {module} import {import_name}
+if __name__ == "__main__":
+    sys.argv[0] = re.sub(r"(-script\\.pyw|\\.exe)?$", "", sys.argv[0])
+    sys.exit({func}())
+"""
+
+_MAX_SHEBANG_LENGTH = 127
+
+
+class WheelInstaller:
+    """
+    Installs wheels directly into an environment, without running pip.
+
+    Implements the parts of the wheel installation process that pip performs for our use case: the
+    content of the wheel is laid out according to the environment schemes, `RECORD` and `INSTALLER`
+    are written and console / gui entry point scripts are generated. The files are materialized from
+    the shared unpacked wheel directory according to `link_mode` (see `poetry.utils.helpers.link_file`).
+    Bytecode compilation is left to the caller, which can compile the files of many installations at once.
+    """
+
+    def __init__(self, env: "Env", link_mode: str = "copy") -> None:
+        self._env = env
+        self._link_mode = link_mode
+
+    @staticmethod
+    def is_supported() -> bool:
+        # windows entry points require launcher executables which we do not ship
+        return sys.platform != "win32"
+
+    def install(self, wheel: Path) -> Tuple[Path, List[Path]]:
+        """
+        Installs the given wheel, replacing any installed distribution of the same name (see `can_install`).
+        Returns the installed RECORD file and the installed python source files.
+        """
+        from poetry.app.relaxed_poetry import rp
+
+        name = wheel.name.split("-", 1)[0]
+        source = rp.artifacts.unpacked(wheel)
+        dist_info = self._find_dist_info(source, name)
+        wheel_metadata = Parser().parsestr((dist_info / "WHEEL").read_text(encoding="utf-8"))
+
+        paths = self._env.paths
+        root = self._env.purelib
+        if wheel_metadata.get("Root-Is-Purelib", "true").strip().lower() != "true":
+            root = self._env.platlib
+
+        data_dir = source / f"{dist_info.name[:-len('.dist-info')]}.data"
+        records = self._read_record(dist_info / "RECORD")
+
+        # every destination is resolved before the installed distribution is removed, so that an invalid wheel
+        # leaves it in place
+        files: List[Tuple[Path, Path, Path, Optional[str]]] = []
+        for src in self._files_of(source):
+            relative = src.relative_to(source)
+            if relative.parts[0] == data_dir.name:
+                if len(relative.parts) < 3:
+                    continue
+
+                scheme = relative.parts[1]
+                dest = self._scheme_path(scheme, dist_info, paths) / Path(*relative.parts[2:])
+            else:
+                scheme = None
+                dest = root / relative
+
+            if relative.parent == Path(dist_info.name) and relative.name in {"RECORD", "INSTALLER"}:
+                continue
+
+            files.append((src, relative, dest, scheme))
+
+        self.uninstall(name)
+
+        installed: List[Tuple[Path, str, str]] = []
+        for src, relative, dest, scheme in files:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if scheme == "scripts" and self._rewrite_script(src, dest):
+                installed.append((dest,) + self._hash(dest))
+                continue
+
+            if scheme == "scripts":
+                # scripts are made executable, a link would change the mode of the file in the artifacts store
+                link_file(src, dest, "copy")
+                dest.chmod(dest.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+            else:
+                link_file(src, dest, self._link_mode)
+            hash_, size = records.get(relative.as_posix(), ("", ""))
+            if not hash_:
+                hash_, size = self._hash(dest)
+            installed.append((dest, hash_, size))
+
+        for script in self._write_entry_points(dist_info, Path(paths["scripts"])):
+            installed.append((script,) + self._hash(script))
+
+        installed_dist_info = root / dist_info.name
+        installer = installed_dist_info / "INSTALLER"
+        installer.write_text("poetry\n", encoding="utf-8")
+        installed.append((installer,) + self._hash(installer))
+
+        record = installed_dist_info / "RECORD"
+        with record.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            for path, hash_, size in installed:
+                writer.writerow([self._record_path(path, root), hash_, size])
+            writer.writerow([self._record_path(record, root), "", ""])
+
+        return record, [
+            path
+            for path, _, _ in installed
+            if path.suffix == ".py" and self._env.is_path_relative_to_lib(path)
+        ]
+
+    def can_install(self, name: str) -> bool:
+        """
+        Returns True if the given distribution is not installed or if its installed distributions can be
+        replaced, see `can_uninstall`.
+        """
+        if self._env.site_packages.find_distribution(name, writable_only=True) is None:
+            return True
+
+        return self.can_uninstall(name)
+
+    def can_uninstall(self, name: str) -> bool:
+        """
+        Returns True if every installed distribution of the given name is a .dist-info distribution with a RECORD,
+        other distributions (egg-info, legacy develop installs) are left to pip.
+        """
+        distributions = list(self._env.site_packages.distributions(name=name, writable_only=True))
+        return bool(distributions) and all(
+            Path(str(distribution._path)).name.endswith(".dist-info") and distribution.files is not None
+            for distribution in distributions
+        )
+
+    def uninstall(self, name: str) -> bool:
+        """
+        Removes the installed distributions of the given name, returns False if there was none.
+        """
+        return bool(self._env.site_packages.remove_distribution_files(name))
+
+    @staticmethod
+    def _find_dist_info(source: Path, name: str) -> Path:
+        normalized = re.sub(r"[-_.]+", "_", name).lower()
+        for child in source.iterdir():
+            if child.is_dir() and child.name.endswith(".dist-info"):
+                if re.sub(r"[-_.]+", "_", child.name.split("-", 1)[0]).lower() == normalized:
+                    return child
+
+        raise RuntimeError(f"Unable to find the .dist-info directory of {name} in {source}")
+
+    @staticmethod
+    def _files_of(source: Path):
+        for directory, _, files in os.walk(str(source)):
+            for file in files:
+                yield Path(directory, file)
+
+    @staticmethod
+    def _read_record(record: Path) -> Dict[str, Tuple[str, str]]:
+        if not record.exists():
+            return {}
+
+        with record.open(encoding="utf-8", newline="") as f:
+            return {row[0]: (row[1], row[2]) for row in csv.reader(f) if len(row) >= 3}
+
+    def _scheme_path(self, scheme: str, dist_info: Path, paths: Dict[str, str]) -> Path:
+        if scheme == "purelib":
+            return self._env.purelib
+        if scheme == "platlib":
+            return self._env.platlib
+        if scheme == "headers":
+            project = dist_info.name.split("-", 1)[0]
+            return Path(paths.get("include", self._env.path / "include")) / project
+        if scheme in {"scripts", "data"} and scheme in paths:
+            return Path(paths[scheme])
+
+        raise RuntimeError(f"Unsupported wheel data scheme {scheme} in {dist_info.name}")
+
+    def _rewrite_script(self, src: Path, dest: Path) -> bool:
+        """
+        Writes the given script replacing its `#!python` shebang, returns False if it has none.
+        """
+        with src.open("rb") as f:
+            first_line = f.readline()
+            if not first_line.startswith(b"#!python"):
+                return False
+
+            content = f.read()
+
+        self._write_script(dest, self._shebang().encode("utf-8") + content)
+        return True
+
+    def _write_entry_points(self, dist_info: Path, scripts_dir: Path) -> List[Path]:
+        entry_points_file = dist_info / "entry_points.txt"
+        if not entry_points_file.exists():
+            return []
+
+        parser = configparser.ConfigParser(delimiters="=")
+        parser.optionxform = str
+        parser.read_string(entry_points_file.read_text(encoding="utf-8"))
+
+        scripts = []
+        scripts_dir.mkdir(parents=True, exist_ok=True)
+        for section in ("console_scripts", "gui_scripts"):
+            if not parser.has_section(section):
+                continue
+
+            for script_name, value in parser.items(section):
+                module, _, attrs = value.split("[", 1)[0].strip().partition(":")
+                attrs = attrs.strip() or None
+                if attrs is None:
+                    continue
+
+                content = _SCRIPT_TEMPLATE.format(
+                    module=module.strip(), import_name=attrs.split(".")[0], func=attrs
+                )
+
+                script = scripts_dir / script_name
+                self._write_script(script, (self._shebang() + content).encode("utf-8"))
+                scripts.append(script)
+
+        return scripts
+
+    def _shebang(self) -> str:
+        python = self._env.python
+        if " " not in python and len(python) + 3 <= _MAX_SHEBANG_LENGTH:
+            return f"#!{python}\n"
+
+        # too long or unsafe for a shebang line, re-execute the script using /bin/sh like pip does
+        return f"#!/bin/sh\n'''exec' '{python}' \"$0\" \"$@\"\n' '''\n"
+
+    @staticmethod
+    def _write_script(path: Path, content: bytes) -> None:
+        if path.exists():
+            path.unlink()
+
+        path.write_bytes(content)
+        mode = path.stat().st_mode
+        path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+    @staticmethod
+    def _hash(path: Path) -> Tuple[str, str]:
+        data = path.read_bytes()
+        digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=").decode("ascii")
+        return f"sha256={digest}", str(len(data))
+
+    @staticmethod
+    def _record_path(path: Path, root: Path) -> str:
+        try:
+            return path.relative_to(root).as_posix()
+        except ValueError:
+            return Path(os.path.relpath(str(path), str(root))).as_posix()
@@ -1,5 +1,9 @@
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from pathlib import Path
-from typing import List, Union, MutableMapping
+from typing import Callable, Dict, List, Set, Union, MutableMapping
 from typing import TYPE_CHECKING, Iterator, Optional
 
 from cleo.io.outputs.output import Verbosity
@@ -141,6 +145,69 @@ class ManagedProject(BasePoetry):
 
         yield self
 
+    def run_on_projects_graph(self, action: Callable[["ManagedProject"], Optional[int]]) -> int:
+        """
+        Runs the given action on every project in the projects graph. Up to `workspace.workers` projects are
+        handled concurrently, a project only starts after the sibling projects it depends on are done.
+        Returns the first non-zero result of the action (after which no more projects are started), or 0.
+        """
+        projects = list(self.projects_graph())
+        workers = self.config.get("workspace.workers", 1)
+
+        if workers <= 1 or len(projects) < 2:
+            for project in projects:
+                result = action(project)
+                if result:
+                    return result
+            return 0
+
+        indices = {project.path.resolve(): index for index, project in enumerate(projects)}
+        prerequisites: List[Set[int]] = []
+        for index, project in enumerate(projects):
+            required = {indices[path] for path in project._sibling_paths() if path in indices}
+            required.discard(index)
+            prerequisites.append(required)
+
+        started: Set[int] = set()
+        finished: Set[int] = set()
+        running: Dict[Future, int] = {}
+        status = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while len(finished) < len(projects):
+                if not status:
+                    ready = [
+                        index for index in range(len(projects))
+                        if index not in started and prerequisites[index] <= finished
+                    ]
+
+                    if not ready and not running:
+                        # dependency cycle between siblings, continue in the projects graph order
+                        ready = [min(set(range(len(projects))) - started)]
+
+                    for index in ready:
+                        started.add(index)
+                        running[executor.submit(action, projects[index])] = index
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for task in done:
+                    finished.add(running.pop(task))
+                    result = task.result()
+                    if result and not status:
+                        status = result
+
+        return status
+
+    def _sibling_paths(self) -> Set[Path]:
+        return {
+            dependency.full_path.resolve()
+            for dependency in self.package.all_requires
+            if dependency.source_type in ("directory", "sibling")
+        }
+
     @cached_property
     def parent(self) -> Optional["ManagedProject"]:
         parent = self.pyproject.parent
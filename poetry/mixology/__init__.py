@@ -1,3 +1,4 @@
+from typing import Collection
 from typing import Dict
 from typing import List
 from typing import TYPE_CHECKING
@@ -17,7 +18,8 @@ def resolve_version(
         provider: "Provider",
         locked: Dict[str, "DependencyPackage"] = None,
         use_latest: List[str] = None,
+        pinned: Collection[str] = (),
 ) -> "SolverResult":
-    solver = VersionSolver(root, provider, locked=locked, use_latest=use_latest)
+    solver = VersionSolver(root, provider, locked=locked, use_latest=use_latest, pinned=pinned)
 
     return solver.solve()
@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 from typing import Dict
 from typing import List
+from typing import NamedTuple
+from typing import Optional
 
 from .assignment import Assignment
 from .incompatibility import Incompatibility
@@ -13,6 +15,15 @@ if TYPE_CHECKING:
     from poetry.core.packages.package import Package
 
 
+class _PackageState(NamedTuple):
+    # the entry of the package in _positive, if any
+    positive: Optional[Term]
+    # the entry of the package in _negative, if any
+    negative: Optional[Term]
+    # the index of the assignment that made the package positive, which orders _positive
+    positive_since: Optional[int]
+
+
 class PartialSolution:
     """
     # A list of Assignments that represent the solver's current best guess about
@@ -44,6 +55,19 @@ class PartialSolution:
         # This is derived from self._assignments.
         self._negative: Dict[str, Dict[str, Term]] = dict()
 
+        # The assignments of each package, in the order they were assigned, along
+        # with the state of the package after each of them. Backtracking restores
+        # the state of the affected packages from these instead of replaying
+        # _assignments.
+        self._assignments_by_package: Dict[str, List[Assignment]] = dict()
+        self._states_by_package: Dict[str, List[_PackageState]] = dict()
+
+        # A stamp for each package that changes whenever its entry in _positive or
+        # _negative changes, so relations computed against the package can be
+        # reused while its stamp stays the same.
+        self._stamps: Dict[str, int] = dict()
+        self._clock = 0
+
         # The number of distinct solutions that have been attempted so far.
         self._attempted_solutions = 1
 
@@ -115,9 +139,29 @@ class PartialSolution:
         """
         Adds an Assignment to _assignments and _positive or _negative.
         """
+        name = assignment.dependency.complete_name
         self._assignments.append(assignment)
+        self._assignments_by_package.setdefault(name, []).append(assignment)
         self._register(assignment)
 
+        positive = self._positive.get(name)
+        negative_by_ref = self._negative.get(name)
+        states = self._states_by_package.setdefault(name, [])
+        if positive is None:
+            positive_since = None
+        elif states and states[-1].positive is not None:
+            positive_since = states[-1].positive_since
+        else:
+            positive_since = assignment.index
+
+        states.append(
+            _PackageState(
+                positive,
+                None if negative_by_ref is None else negative_by_ref.get(name),
+                positive_since,
+            )
+        )
+
     def backtrack(self, decision_level: int) -> None:
         """
         Resets the current decision level to decision_level, and removes all
@@ -128,27 +172,47 @@ class PartialSolution:
         packages = set()
         while self._assignments[-1].decision_level > decision_level:
             removed = self._assignments.pop(-1)
-            packages.add(removed.dependency.complete_name)
+            name = removed.dependency.complete_name
+            packages.add(name)
+            self._assignments_by_package[name].pop(-1)
+            self._states_by_package[name].pop(-1)
             if removed.is_decision():
-                del self._decisions[removed.dependency.complete_name]
+                del self._decisions[name]
 
-        # Re-compute _positive and _negative for the packages that were removed.
+        # Restore _positive and _negative for the packages that were removed.
+        restored = []
         for package in packages:
+            self._touch(package)
+
             if package in self._positive:
                 del self._positive[package]
 
             if package in self._negative:
                 del self._negative[package]
 
-        for assignment in self._assignments:
-            if assignment.dependency.complete_name in packages:
-                self._register(assignment)
+            states = self._states_by_package[package]
+            if states:
+                restored.append((package, states[-1]))
+            else:
+                del self._states_by_package[package]
+                del self._assignments_by_package[package]
+
+        # Positive entries are re-added in the order their packages became positive,
+        # just like replaying the remaining assignments would.
+        restored.sort(key=lambda it: -1 if it[1].positive_since is None else it[1].positive_since)
+        for package, state in restored:
+            if state.positive is not None:
+                self._positive[package] = state.positive
+            elif state.negative is not None:
+                self._negative[package] = {package: state.negative}
 
     def _register(self, assignment: Assignment) -> None:
         """
         Registers an Assignment in _positive or _negative.
         """
         name = assignment.dependency.complete_name
+        self._touch(name)
+
         old_positive = self._positive.get(name)
         if old_positive is not None:
             self._positive[name] = old_positive.intersect(assignment)
@@ -174,6 +238,17 @@ class PartialSolution:
 
             self._negative[name][ref] = term
 
+    def _touch(self, package: str) -> None:
+        self._clock += 1
+        self._stamps[package] = self._clock
+
+    def stamp(self, package: str) -> int:
+        """
+        Returns the current stamp of package, the relation of this solution to a term
+        about package can only change when the stamp of package changes.
+        """
+        return self._stamps.get(package, 0)
+
     def satisfier(self, term: Term) -> Assignment:
         """
         Returns the first Assignment in this solution such that the sublist of
@@ -181,10 +256,7 @@ class PartialSolution:
         """
         assigned_term = None
 
-        for assignment in self._assignments:
-            if assignment.dependency.complete_name != term.dependency.complete_name:
-                continue
-
+        for assignment in self._assignments_by_package.get(term.dependency.complete_name, []):
             if (
                 not assignment.dependency.is_root
                 and not assignment.dependency.is_same_package_as(term.dependency)
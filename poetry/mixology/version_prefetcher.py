@@ -1,6 +1,14 @@
+import heapq
+import itertools
+import threading
 from concurrent.futures._base import Future
 from concurrent.futures.thread import ThreadPoolExecutor
-from typing import Dict, Optional, List, Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
 
 from poetry.core.packages.dependency import Dependency
 
@@ -9,57 +17,186 @@ from poetry.packages import DependencyPackage
 
 
 class VersionPrefetcher:
-
-    def __init__(self, version_solver: VersionSolver, max_workers=6):
+    """
+    Speculatively searches and completes packages that the version solver is likely to ask for.
+
+    For every unsatisfied dependency the prefetcher searches for its candidates and completes the first
+    `candidates` of them (so that backtracking finds the next versions already completed), and, up to `depth`
+    levels, also searches the dependencies of the candidate the solver is expected to choose. Pending work is
+    kept in a bounded priority queue ordered like the solver chooses its next package.
+    """
+
+    def __init__(
+            self,
+            version_solver: VersionSolver,
+            max_workers: int = 6,
+            candidates: int = 3,
+            depth: int = 1,
+            max_queued: int = 256,
+    ):
         self._vsolver = version_solver
-        self._prefetched: Dict[str, Future] = {}
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
-
-    def prefetched(self, d: Dependency) -> Optional[DependencyPackage]:
-        future = self._prefetched.get(str(d))
-        return future.result() if future else None
+        self._candidates = max(candidates, 1)
+        self._depth = max(depth, 0)
+        self._max_queued = max_queued
+        self._max_workers = max(max_workers, 1)
+
+        self._searched: Set[str] = set()
+        self._completed: Dict[Tuple, "_PrefetchTask"] = {}
+        self._queue: List[Tuple[Tuple, int, "_PrefetchTask"]] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+    def completed(self, package: DependencyPackage) -> Optional[DependencyPackage]:
+        """
+        Returns the prefetched completion of the given package, or None if it was not (yet) prefetched.
+        """
+        with self._lock:
+            task = self._completed.get(_completion_key(package))
+            if task is None:
+                return None
+
+            if task.future is None:
+                # still waiting in the queue, the caller is better off completing it by itself
+                task.cancelled = True
+                del self._completed[task.key]
+                return None
+
+        result: DependencyPackage = task.future.result()
+        return DependencyPackage(package.dependency, result.package.clone())
 
     def shutdown(self):
-        for prefetching in self._prefetched.values():
-            prefetching.cancel()
+        with self._lock:
+            self._shutdown = True
+            self._queue.clear()
+            for task in self._completed.values():
+                if task.future is not None:
+                    task.future.cancel()
 
         self._executor.shutdown(False)
 
     def prefetch(self):
-        pending: List[Dependency] = [d for d in self._vsolver.solution.unsatisfied if str(d) not in self._prefetched]
-        vsolver = self._vsolver
-
-        def fetch(dependency: Dependency):
-            version = vsolver._get_locked(dependency)
-            if version is None or not dependency.constraint.allows(version.version):
-                try:
-                    packages = vsolver._provider.search_for(dependency)
-                    version = packages[0]
-                except ValueError:
-                    pass
-                except IndexError:
-                    pass
+        for dependency in self._vsolver.solution.unsatisfied:
+            self._schedule_search(dependency, 0)
 
-            if version:
-                result = vsolver._provider.complete_package(version)
-                # noinspection PyTypeChecker
-                self._prefetched[str(version.dependency)] = _FakeFuture(result)
-                return result
+    def _schedule_search(self, dependency: Dependency, depth: int) -> None:
+        key = str(dependency)
+        with self._lock:
+            if key in self._searched:
+                return
 
-            return None
+            self._searched.add(key)
 
-        for dependency in pending:
-            version = self._executor.submit(fetch, dependency)
-            if version:
-                self._prefetched[str(dependency)] = version
+        self._push(
+            (depth, -1, not dependency.marker.is_any(), 0),
+            _PrefetchTask(key, lambda: self._search(dependency, depth)),
+        )
 
-
-class _FakeFuture:
-    def __init__(self, r: Any):
-        self._result = r
-
-    def result(self) -> Any:
-        return self._result
-
-    def cancel(self):
-        pass
+    def _search(self, dependency: Dependency, depth: int) -> None:
+        vsolver = self._vsolver
+        if dependency.name in vsolver._pinned:
+            # pinned packages are completed from the lock, there is nothing to fetch
+            return
+
+        # the same ordering used by the solver when choosing which dependency to decide next
+        priority = vsolver._dependency_priority(dependency)
+
+        locked = vsolver._get_locked(dependency)
+        if locked is not None and dependency.constraint.allows(locked.version):
+            candidates = [locked]
+        else:
+            try:
+                candidates = vsolver._provider.search_for(dependency)[: self._candidates]
+            except ValueError:
+                return
+
+        for rank, candidate in enumerate(candidates):
+            key = _completion_key(candidate)
+            task = _PrefetchTask(
+                key,
+                lambda c=candidate, r=rank: self._complete(c, r, depth),
+            )
+
+            with self._lock:
+                if key in self._completed:
+                    continue
+
+                self._completed[key] = task
+
+            self._push((depth, rank) + tuple(priority), task)
+
+    def _complete(self, package: DependencyPackage, rank: int, depth: int) -> DependencyPackage:
+        result = self._vsolver._provider.complete_package(package)
+
+        if rank == 0 and depth < self._depth:
+            for requirement in result.requires:
+                self._schedule_search(requirement, depth + 1)
+
+        return result
+
+    def _push(self, priority: Tuple, task: "_PrefetchTask") -> None:
+        with self._lock:
+            if self._shutdown:
+                return
+
+            heapq.heappush(self._queue, (priority, next(self._sequence), task))
+
+            if len(self._queue) > self._max_queued:
+                # drop the least important pending task
+                worst = max(self._queue)
+                self._queue.remove(worst)
+                heapq.heapify(self._queue)
+                self._forget(worst[2])
+
+        self._dispatch()
+
+    def _forget(self, task: "_PrefetchTask") -> None:
+        task.cancelled = True
+        if self._completed.get(task.key) is task:
+            del self._completed[task.key]
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            while self._queue and self._in_flight < self._max_workers and not self._shutdown:
+                _, _, task = heapq.heappop(self._queue)
+                if task.cancelled:
+                    continue
+
+                self._in_flight += 1
+                task.future = self._executor.submit(self._run, task)
+
+    def _run(self, task: "_PrefetchTask"):
+        try:
+            return task.fn()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+            self._dispatch()
+
+
+class _PrefetchTask:
+    def __init__(self, key, fn: Callable):
+        self.key = key
+        self.fn = fn
+        self.future: Optional[Future] = None
+        self.cancelled = False
+
+
+def _completion_key(package: DependencyPackage) -> Tuple:
+    # the result of Provider.complete_package depends on the requested package and on the parts of the
+    # requesting dependency which are used to filter the package requirements
+    dependency = package.dependency
+    return (
+        package.complete_name,
+        package.full_pretty_version,
+        package.source_type,
+        package.source_url,
+        package.source_reference,
+        dependency.complete_name,
+        dependency.source_name,
+        str(dependency.transitive_marker),
+        str(dependency.python_constraint),
+    )
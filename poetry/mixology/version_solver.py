@@ -1,9 +1,11 @@
 import time
 
 from typing import TYPE_CHECKING
+from typing import Collection
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Union
 
@@ -44,7 +46,8 @@ class VersionSolver:
             provider: "Provider",
             locked: Dict[str, Package] = None,
             use_latest: List[str] = None,
-            printer: Optional[Printer] = None
+            printer: Optional[Printer] = None,
+            pinned: Collection[str] = (),
     ):
         from .version_prefetcher import VersionPrefetcher
 
@@ -58,11 +61,32 @@ class VersionSolver:
 
         self._use_latest = use_latest
 
+        # packages which can only be their locked version, their locked requirements are trusted
+        self._pinned = set(pinned)
+
+        # the incompatibilities that refer to each package, in the order they were added,
+        # and the same incompatibilities as a set for membership checks
         self._incompatibilities: Dict[str, List[Incompatibility]] = {}
+        self._incompatibilities_index: Dict[str, Set[Incompatibility]] = {}
+
+        # the package stamps of the terms of incompatibilities whose propagation derived nothing,
+        # such incompatibilities cannot derive anything until one of these stamps changes
+        self._inconclusive: Dict[Incompatibility, Tuple[int, ...]] = {}
+
+        # the relation of _solution to each propagated term, along with the stamp of its package
+        self._relations: Dict[Term, Tuple[int, int]] = {}
+
         self._solution = PartialSolution()
         self._forced_versions = {dependency.name: dependency for dependency in root.all_requires if
                                  dependency.forced_version}
-        self._prefetcher = VersionPrefetcher(self)
+
+        config = provider.project.config
+        self._prefetcher = VersionPrefetcher(
+            self,
+            max_workers=config.get("solver.prefetch.workers", 6),
+            candidates=config.get("solver.prefetch.candidates", 3),
+            depth=config.get("solver.prefetch.depth", 1),
+        )
 
     @property
     def solution(self) -> PartialSolution:
@@ -151,23 +175,34 @@ class VersionSolver:
 
         Otherwise, returns None.
         """
+        # Nothing that incompatibility refers to has changed since it was last found
+        # to be inconclusive.
+        stamps = tuple(
+            self._solution.stamp(term.dependency.complete_name)
+            for term in incompatibility.terms
+        )
+        if self._inconclusive.get(incompatibility) == stamps:
+            return
+
         # The first entry in incompatibility.terms that's not yet satisfied by
         # _solution, if one exists. If we find more than one, _solution is
         # inconclusive for incompatibility and we can't deduce anything.
         unsatisfied = None
 
-        for term in incompatibility.terms:
-            relation = self._solution.relation(term)
+        for term, stamp in zip(incompatibility.terms, stamps):
+            relation = self._relation(term, stamp)
 
             if relation == SetRelation.DISJOINT:
                 # If term is already contradicted by _solution, then
                 # incompatibility is contradicted as well and there's nothing new we
                 # can deduce from it.
+                self._inconclusive[incompatibility] = stamps
                 return
             elif relation == SetRelation.OVERLAPPING:
                 # If more than one term is inconclusive, we can't deduce anything about
                 # incompatibility.
                 if unsatisfied is not None:
+                    self._inconclusive[incompatibility] = stamps
                     return
 
                 # If exactly one term in incompatibility is inconclusive, then it's
@@ -192,6 +227,19 @@ class VersionSolver:
 
         return unsatisfied.dependency.complete_name
 
+    def _relation(self, term: Term, stamp: int) -> int:
+        """
+        Returns the relation of _solution to term, given the current stamp of its package.
+        """
+        cached = self._relations.get(term)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        relation = self._solution.relation(term)
+        self._relations[term] = (stamp, relation)
+
+        return relation
+
     def _resolve_conflict(self, incompatibility: Incompatibility) -> Incompatibility:
         """
         Given an incompatibility that's satisfied by _solution,
@@ -336,76 +384,52 @@ class VersionSolver:
         if not unsatisfied:
             return
 
-        # Prefer packages with as few remaining versions as possible,
-        # so that if a conflict is necessary it's forced quickly.
-        def _get_min(dependency: Dependency) -> Tuple[bool, int]:
-            if dependency.name in self._use_latest:
-                # If we're forced to use the latest version of a package, it effectively
-                # only has one version to choose from.
-                return not dependency.marker.is_any(), 1
-
-            locked = self._get_locked(dependency)
-            if locked and (
-                    dependency.constraint.allows(locked.version)
-                    or locked.is_prerelease()
-                    and dependency.constraint.allows(locked.version.next_patch())
-            ):
-                return not dependency.marker.is_any(), 1
+        if len(unsatisfied) == 1:
+            dependency = unsatisfied[0]
+        else:
+            dependency = min(*unsatisfied, key=self._dependency_priority)
 
-            # VCS, URL, File or Directory dependencies
-            # represent a single version
-            if (
-                    dependency.is_vcs()
-                    or dependency.is_url()
-                    or dependency.is_file()
-                    or dependency.is_directory()
-            ):
-                return not dependency.marker.is_any(), 1
+        locked = self._get_locked(dependency)
+        pinned = dependency.name in self._pinned
+        if pinned and (locked is None or not dependency.constraint.allows(locked.version)):
+            self._add_incompatibility(
+                Incompatibility([Term(dependency, True)], NoVersionsCause())
+            )
+            return dependency.complete_name
 
+        if locked is None or not dependency.constraint.allows(locked.version):
             try:
-                return (
-                    not dependency.marker.is_any(),
-                    len(self._provider.search_for(dependency)),
+                packages = self._provider.search_for(dependency)
+            except ValueError as e:
+                self._add_incompatibility(
+                    Incompatibility([Term(dependency, True)], PackageNotFoundCause(e))
                 )
-            except ValueError:
-                return not dependency.marker.is_any(), 0
+                return dependency.complete_name
 
-        if len(unsatisfied) == 1:
-            dependency = unsatisfied[0]
-        else:
-            dependency = min(*unsatisfied, key=_get_min)
+            try:
+                version = packages[0]
+            except IndexError:
+                version = None
+
+            if version is None:
+                # If there are no versions that satisfy the constraint,
+                # add an incompatibility that indicates that.
+                self._add_incompatibility(
+                    Incompatibility([Term(dependency, True)], NoVersionsCause())
+                )
 
-        prefetched_completed_package = self._prefetcher.prefetched(dependency)
-        if prefetched_completed_package:
-            version = prefetched_completed_package
+                return dependency.complete_name
         else:
-            locked = self._get_locked(dependency)
-            if locked is None or not dependency.constraint.allows(locked.version):
-                try:
-                    packages = self._provider.search_for(dependency)
-                except ValueError as e:
-                    self._add_incompatibility(
-                        Incompatibility([Term(dependency, True)], PackageNotFoundCause(e))
-                    )
-                    return dependency.complete_name
-
-                try:
-                    version = packages[0]
-                except IndexError:
-                    version = None
-
-                if version is None:
-                    # If there are no versions that satisfy the constraint,
-                    # add an incompatibility that indicates that.
-                    self._add_incompatibility(
-                        Incompatibility([Term(dependency, True)], NoVersionsCause())
-                    )
+            version = locked
 
-                    return dependency.complete_name
+        if pinned:
+            version = self._provider.complete_package(version, locked=True)
+        else:
+            prefetched_completed_package = self._prefetcher.completed(version)
+            if prefetched_completed_package is not None:
+                version = prefetched_completed_package
             else:
-                version = locked
-
-            version = self._provider.complete_package(version)
+                version = self._provider.complete_package(version)
 
         conflict = False
         for incompatibility in self._provider.incompatibilities_for(version, self._forced_versions):
@@ -432,6 +456,42 @@ class VersionSolver:
 
         return dependency.complete_name
 
+    def _dependency_priority(self, dependency: Dependency) -> Tuple[bool, int]:
+        """
+        Prefer packages with as few remaining versions as possible,
+        so that if a conflict is necessary it's forced quickly.
+        """
+        if dependency.name in self._use_latest:
+            # If we're forced to use the latest version of a package, it effectively
+            # only has one version to choose from.
+            return not dependency.marker.is_any(), 1
+
+        locked = self._get_locked(dependency)
+        if locked and (
+                dependency.constraint.allows(locked.version)
+                or locked.is_prerelease()
+                and dependency.constraint.allows(locked.version.next_patch())
+        ):
+            return not dependency.marker.is_any(), 1
+
+        # VCS, URL, File or Directory dependencies
+        # represent a single version
+        if (
+                dependency.is_vcs()
+                or dependency.is_url()
+                or dependency.is_file()
+                or dependency.is_directory()
+        ):
+            return not dependency.marker.is_any(), 1
+
+        try:
+            return (
+                not dependency.marker.is_any(),
+                len(self._provider.search_for(dependency)),
+            )
+        except ValueError:
+            return not dependency.marker.is_any(), 0
+
     def _result(self) -> SolverResult:
         """
         Creates a #SolverResult from the decisions in _solution
@@ -448,18 +508,16 @@ class VersionSolver:
         self._log(f"fact: {incompatibility}")
 
         for term in incompatibility.terms:
-            if term.dependency.complete_name not in self._incompatibilities:
-                self._incompatibilities[term.dependency.complete_name] = []
+            name = term.dependency.complete_name
+            if name not in self._incompatibilities:
+                self._incompatibilities[name] = []
+                self._incompatibilities_index[name] = set()
 
-            if (
-                    incompatibility
-                    in self._incompatibilities[term.dependency.complete_name]
-            ):
+            if incompatibility in self._incompatibilities_index[name]:
                 continue
 
-            self._incompatibilities[term.dependency.complete_name].append(
-                incompatibility
-            )
+            self._incompatibilities[name].append(incompatibility)
+            self._incompatibilities_index[name].add(incompatibility)
 
     def _get_locked(self, dependency: Dependency) -> Optional[Package]:
         if dependency.name in self._use_latest:
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import pickle
 import re
 
 from copy import deepcopy
@@ -21,12 +22,16 @@ from poetry.core.utils import toml
 
 import poetry.repositories as repositories
 
+from poetry.__version__ import __version__
+from poetry.core import __version__ as core_version
+
 from poetry.core.packages.dependency import Dependency
 from poetry.core.packages.package import Package
 from poetry.core.semver.helpers import parse_constraint
 from poetry.core.semver.version import Version
 from poetry.core.version.markers import parse_marker
 from poetry.core.version.requirements import InvalidRequirement
+from poetry.locations import CACHE_DIR
 from poetry.packages import DependencyPackage
 from poetry.utils.extras import get_extra_package_names
 
@@ -34,7 +39,16 @@ logger = logging.getLogger(__name__)
 
 
 class Locker:
+    """
+    Reads and writes the lock file.
+
+    The parsed lock data and the locked packages are kept in a snapshot (see `_snapshot_file`), keyed by the
+    lock file content and the rp version, so unchanged lock files are neither parsed nor turned into
+    packages again. The snapshot lives in the cache directory, pickles are never read from the project.
+    """
+
     _VERSION = "1.1"
+    _SNAPSHOT_VERSION = 1
 
     _relevant_keys = ["dependencies", "group", "source", "extras"]
 
@@ -42,6 +56,7 @@ class Locker:
         self._lock = Path(lock)
         self._local_config = local_config
         self._lock_data = None
+        self._locked_packages: Optional[bytes] = None
         self._content_hash = self._get_content_hash()
 
         lock_dir = self._lock.parent
@@ -54,6 +69,9 @@ class Locker:
 
     @property
     def lock_data(self) -> Dict[str, Any]:
+        if self._lock_data is None:
+            self._load_snapshot()
+
         if self._lock_data is None:
             self._lock_data = self._get_lock_data()
 
@@ -72,11 +90,13 @@ class Locker:
         """
         Checks whether the lock file is still up to date with the current hash.
         """
-        lock, _ = toml.load(self._lock)
-        metadata = lock.get("metadata", {})
+        if not self._lock.exists():
+            return False
+
+        metadata = self.lock_data.get("metadata", {})
 
         if "content-hash" in metadata:
-            return self._content_hash == lock["metadata"]["content-hash"]
+            return self._content_hash == metadata["content-hash"]
 
         return False
 
@@ -86,24 +106,31 @@ class Locker:
         """
         Searches and returns a repository of locked packages.
         """
-        from poetry.factory import Factory
-
         if not self.is_locked():
             return repositories.Repository()
 
-        lock_data = self.lock_data
-        packages = repositories.Repository()
+        if self._locked_packages is not None:
+            # every call returns new packages since callers modify them
+            try:
+                return repositories.Repository(pickle.loads(self._locked_packages))
+            except Exception as e:
+                logger.debug(f"Unable to load the snapshot of the lock file {self._lock}: {e}")
+                self._locked_packages = None
 
-        if with_dev_reqs:
-            locked_packages = lock_data["package"]
-        else:
-            locked_packages = [
-                p for p in lock_data["package"]
-            ]
+        packages = self._create_locked_packages(self.lock_data)
+        try:
+            self._locked_packages = pickle.dumps(packages, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write_snapshot()
+        except (pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            logger.debug(f"Unable to snapshot the lock file {self._lock}: {e}")
+
+        return repositories.Repository(packages)
 
-        if not locked_packages:
-            return packages
+    def _create_locked_packages(self, lock_data: Dict[str, Any]) -> List[Package]:
+        from poetry.factory import Factory
 
+        packages = []
+        locked_packages = lock_data["package"]
 
         for info in locked_packages:
             source = info.get("source", {})
@@ -191,10 +218,58 @@ class Locker:
             if "develop" in info:
                 package.develop = info["develop"]
 
-            packages.add_package(package)
+            packages.append(package)
 
         return packages
 
+    def _snapshot_file(self) -> Path:
+        lock_key = sha256(self._lock.resolve().as_posix().encode()).hexdigest()
+        return Path(CACHE_DIR) / "lock-snapshots" / lock_key[:2] / f"{lock_key}.pickle"
+
+    def _snapshot_key(self) -> str:
+        # the locked packages depend on the lock content, on the rp and core versions (the packages are pickled
+        # poetry-core objects) and on the lock location (the urls of path dependencies are resolved relative to it)
+        key = sha256(self._lock.read_bytes())
+        key.update(
+            f"{__version__}:{core_version}:{self._SNAPSHOT_VERSION}:{self._lock.resolve().as_posix()}".encode()
+        )
+        return key.hexdigest()
+
+    def _load_snapshot(self) -> None:
+        if not self._lock.exists():
+            return
+
+        snapshot_file = self._snapshot_file()
+        if not snapshot_file.exists():
+            return
+
+        try:
+            with snapshot_file.open("rb") as f:
+                snapshot = pickle.load(f)
+
+            if snapshot["key"] != self._snapshot_key():
+                return
+
+            self._lock_data = snapshot["lock_data"]
+            self._locked_packages = snapshot["packages"]
+        except Exception as e:
+            logger.debug(f"Ignoring the unreadable lock snapshot {snapshot_file}: {e}")
+
+    def _write_snapshot(self) -> None:
+        snapshot = {
+            "key": self._snapshot_key(),
+            # lock data may contain toml document items, keep plain values only
+            "lock_data": json.loads(json.dumps(self.lock_data)),
+            "packages": self._locked_packages,
+        }
+
+        snapshot_file = self._snapshot_file()
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = snapshot_file.with_name(f"{snapshot_file.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(str(tmp), str(snapshot_file))
+
     @staticmethod
     def __get_locked_package(
             _dependency: Dependency, packages_by_name: Dict[str, List[Package]]
@@ -436,6 +511,7 @@ class Locker:
     def _write_lock_data(self, data: Dict[str, Any]) -> None:
         self.lock.write_text(toml.dumps(data))
         self._lock_data = None
+        self._locked_packages = None
 
     def _get_content_hash(self) -> str:
         """
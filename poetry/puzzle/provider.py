@@ -1,3 +1,4 @@
+import copy
 import logging
 import re
 import threading
@@ -5,9 +6,11 @@ import time
 from contextlib import contextmanager
 from pathlib import Path
 from tempfile import mkdtemp
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from cleo.io.io import IO
@@ -56,6 +59,47 @@ def _installed_python_version_constraint(env: Env) -> VersionTypes:
     return parse_constraint(f"={i[0]}.{i[1]}.{i[2]}")
 
 
+class ProviderCache:
+    """
+    Caches the provider work which does not depend on the resolved project. A single instance is shared by
+    the providers of all the projects handled by a command invocation (e.g., the sub-projects of a workspace).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # (pool signature, complete name) -> search results
+        self._search_for: Dict[Tuple, Dict[Dependency, List[Package]]] = {}
+        self._packages: Dict[Tuple, Package] = {}
+        self._package_locks: Dict[Tuple, threading.Lock] = {}
+
+    @property
+    def lock(self) -> threading.Lock:
+        return self._lock
+
+    def search_results(self, pool: Pool, name: str) -> Dict[Dependency, List[Package]]:
+        """
+        Returns the search results of the given pool for the dependencies of the given (complete) name, shared
+        by all the pools which find the same packages.
+        Must only be called, and the results accessed, while holding `lock`.
+        """
+        return self._search_for.setdefault((pool.signature(), name), {})
+
+    def package(self, key: Tuple, create: Callable[[], Package]) -> Package:
+        """
+        Returns a clone of the package stored under the given key, the package is created once
+        even when requested concurrently.
+        """
+        with self._lock:
+            lock = self._package_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            package = self._packages.get(key)
+            if package is None:
+                package = self._packages[key] = create()
+
+        return package.clone()
+
+
 class Provider:
     UNSAFE_PACKAGES = set()
 
@@ -65,6 +109,8 @@ class Provider:
             package: Optional[Package] = None,
             io: Optional[IO] = None
     ) -> None:
+        from poetry.app.relaxed_poetry import rp
+
         env = project.env
 
         self._project = project
@@ -74,6 +120,9 @@ class Provider:
         self._env = env
         self._python_constraint = project.package.python_constraint
         self._installed_python_constraint = _installed_python_version_constraint(env) if env else None
+        self._cache: ProviderCache = rp.provider_cache
+        # results of searching the pool are shared, results of deferred (vcs, file, directory and url) dependencies
+        # depend on the location of the project and are kept per provider
         self._search_for: Dict[Dependency, List[Package]] = {}
         # TODO: lock has a context manager associated with it already - replace it and remove semaphore custom context.
         self._search_for_sem = threading.Semaphore(1)
@@ -95,12 +144,26 @@ class Provider:
     def pool(self) -> Pool:
         return self._pool
 
+    @property
+    def project(self) -> "ManagedProject":
+        return self._project
+
     def is_debugging(self) -> bool:
         return self._is_debugging
 
     def set_overrides(self, overrides: Dict) -> None:
         self._overrides = overrides
 
+    def with_overrides(self, overrides: Dict) -> "Provider":
+        """
+        Returns a provider that uses the given overrides and shares the search results and caches of this one,
+        so that several override branches can be solved concurrently.
+        """
+        provider = copy.copy(self)
+        provider._overrides = overrides
+
+        return provider
+
     def load_deferred(self, load_deferred: bool) -> None:
         self._load_deferred = load_deferred
 
@@ -143,9 +206,14 @@ class Provider:
         with self.__search_for_locked():
             search_for = self._search_for.copy()
 
+        # only the results of this package are copied, the shared results span every project of the workspace
+        with self._cache.lock:
+            search_for.update(self._cache.search_results(self._pool, dependency.complete_name))
+
         for constraint in search_for:
             if (
                     constraint.is_same_package_as(dependency)
+                    and constraint.source_name == dependency.source_name
                     and constraint.constraint.intersect(dependency.constraint)
                     == dependency.constraint
             ):
@@ -184,8 +252,12 @@ class Provider:
                 reverse=True,
             )
 
-        with self.__search_for_locked():
-            self._search_for[dependency] = packages
+        if dependency.is_vcs() or dependency.is_file() or dependency.is_directory() or dependency.is_url():
+            with self.__search_for_locked():
+                self._search_for[dependency] = packages
+        else:
+            with self._cache.lock:
+                self._cache.search_results(self._pool, dependency.complete_name)[dependency] = packages
 
         return PackageCollection(dependency, packages)
 
@@ -199,13 +271,17 @@ class Provider:
         if dependency in self._deferred_cache:
             return [self._deferred_cache[dependency]]
 
-        package = self.get_package_from_vcs(
-            dependency.vcs,
-            dependency.source,
-            branch=dependency.branch,
-            tag=dependency.tag,
-            rev=dependency.rev,
-            name=dependency.name,
+        package = self._cache.package(
+            ("vcs", dependency.vcs, dependency.source, dependency.branch, dependency.tag, dependency.rev,
+             dependency.name),
+            lambda: self.get_package_from_vcs(
+                dependency.vcs,
+                dependency.source,
+                branch=dependency.branch,
+                tag=dependency.tag,
+                rev=dependency.rev,
+                name=dependency.name,
+            ),
         )
         package.develop = dependency.develop
 
@@ -271,7 +347,9 @@ class Provider:
 
             package = _package.clone()
         else:
-            package = self.get_package_from_file(dependency.full_path)
+            package = self._cache.package(
+                ("file", str(dependency.full_path)), lambda: self.get_package_from_file(dependency.full_path)
+            )
 
             dependency._constraint = package.version
             dependency._pretty_constraint = package.version.text
@@ -314,8 +392,9 @@ class Provider:
 
             package = _package.clone()
         else:
-            package = self.get_package_from_directory(
-                dependency.full_path, name=dependency.name
+            package = self._cache.package(
+                ("directory", str(dependency.full_path), dependency.name),
+                lambda: self.get_package_from_directory(dependency.full_path, name=dependency.name),
             )
 
             dependency._constraint = package.version
@@ -353,7 +432,7 @@ class Provider:
         if dependency in self._deferred_cache:
             return [self._deferred_cache[dependency]]
 
-        package = self.get_package_from_url(dependency.url)
+        package = self._cache.package(("url", dependency.url), lambda: self.get_package_from_url(dependency.url))
 
         if dependency.name != package.name:
             # For now, the dependency's name must match the actual package's name
@@ -381,8 +460,15 @@ class Provider:
     @classmethod
     def get_package_from_url(cls, url: str) -> Package:
         from poetry.app.relaxed_poetry import rp
-        file = rp.artifacts.fetch(url)
-        package = cls.get_package_from_file(file)
+
+        def inspect():
+            try:
+                return PackageInfo.from_path(path=rp.artifacts.fetch(url)).asdict()
+            except PackageInfoError:
+                raise RuntimeError(f"Unable to determine package info from url: {url}")
+
+        # the metadata is shared with the repositories serving the same archive, see Artifacts.metadata
+        package = PackageInfo.load(rp.artifacts.metadata(url, inspect)).to_package()
 
         # with temporary_directory() as temp_dir:
         #     temp_dir = Path(temp_dir)
@@ -455,11 +541,20 @@ class Provider:
             for dep in dependencies
         ]
 
-    def complete_package(self, package: DependencyPackage) -> DependencyPackage:
+    def complete_package(self, package: DependencyPackage, locked: bool = False) -> DependencyPackage:
+        """
+        Returns the given package with its (filtered) requirements. The requirements of `locked` packages are
+        taken as is, instead of being retrieved from their repository.
+        """
         if package.is_root():
             package = package.clone()
             requires = package.all_requires
 
+        elif locked:
+            # the locked package is shared between solves, its requirements are modified below
+            package = DependencyPackage(package.dependency, package.package.clone())
+            requires = package.requires
+
         elif not package.is_root() and package.source_type not in {
             "directory",
             "sibling",
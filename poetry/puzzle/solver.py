@@ -1,11 +1,15 @@
+import copy
 import enum
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Callable
+from typing import Collection
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import TYPE_CHECKING, Iterable
 from typing import Tuple
 from typing import Union
@@ -56,6 +60,9 @@ class Solver:
         self._provider = provider
         self._overrides = []
 
+        # override branches are solved concurrently by the top level solver only, which caps the branches in flight
+        self._parallel_overrides = True
+
     @property
     def provider(self) -> Provider:
         return self._provider
@@ -65,12 +72,17 @@ class Solver:
         with self.provider.use_environment(env):
             yield
 
-    def solve(self, use_latest: List[str] = None) -> "Transaction":
+    def solve(self, use_latest: List[str] = None, pinned: Collection[str] = ()) -> "Transaction":
+        """
+        Resolves the dependencies of the package, preferring the locked versions of packages not in `use_latest`.
+        `pinned` packages can only resolve to their locked version (with their locked requirements), the
+        resolution fails if that is not possible.
+        """
         from .transaction import Transaction
 
         self._printer.println("<info>Resolving dependencies...</info>")
         start = time.time()
-        packages, depths = self._solve(use_latest=use_latest)
+        packages, depths = self._solve(use_latest=use_latest, pinned=pinned)
         end = time.time()
 
         self._printer.println(f"<success>Dependency Resolution done within {end - start:.2f} seconds")
@@ -93,21 +105,32 @@ class Solver:
         )
 
     def solve_in_compatibility_mode(
-            self, overrides: Tuple[Dict], use_latest: List[str] = None
+            self, overrides: Tuple[Dict], use_latest: List[str] = None, pinned: Collection[str] = ()
     ) -> Tuple[List["Package"], List[int]]:
-        locked = {}
-        for package in self._locked.packages:
-            locked[package.name] = DependencyPackage(package.to_dependency(), package)
+        workers = 1
+        if self._parallel_overrides:
+            workers = min(len(overrides), self._provider.project.config.get("solver.override-workers", 4))
 
-        packages = []
-        depths = []
         for override in overrides:
             self._provider.debug(
                 "<comment>Retrying dependency resolution "
                 f"with the following overrides ({override}).</comment>"
             )
-            self._provider.set_overrides(override)
-            _packages, _depths = self._solve(use_latest=use_latest)
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._solve_branch, override, use_latest, pinned) for override in overrides
+                ]
+                branches = [future.result() for future in futures]
+        else:
+            branches = [self._solve_branch(override, use_latest, pinned) for override in overrides]
+
+        # merged in the order of the overrides, so the result does not depend on which branch finished first
+        packages = []
+        depths = []
+        for _packages, _depths, _overrides in branches:
+            self._overrides.extend(_overrides)
             for index, package in enumerate(_packages):
                 if package not in packages:
                     packages.append(package)
@@ -124,7 +147,24 @@ class Solver:
 
         return packages, depths
 
-    def _solve(self, use_latest: List[str] = None) -> Tuple[List[Package], List[int]]:
+    def _solve_branch(
+            self, override: Dict, use_latest: List[str] = None, pinned: Collection[str] = ()
+    ) -> Tuple[List[Package], List[int], List[Dict]]:
+        """
+        Solves with the given override using a copy of this solver, returns the packages, their depths and the
+        overrides that were used.
+        """
+        branch = copy.copy(self)
+        branch._provider = self._provider.with_overrides(override)
+        branch._overrides = []
+        branch._parallel_overrides = False
+
+        packages, depths = branch._solve(use_latest=use_latest, pinned=pinned)
+        return packages, depths, branch._overrides
+
+    def _solve(
+            self, use_latest: List[str] = None, pinned: Collection[str] = ()
+    ) -> Tuple[List[Package], List[int]]:
         if self._provider._overrides:
             self._overrides.append(self._provider._overrides)
 
@@ -139,28 +179,32 @@ class Solver:
 
         try:
             result = resolve_version(
-                self._package, self._provider, locked=locked, use_latest=use_latest
+                self._package, self._provider, locked=locked, use_latest=use_latest, pinned=pinned
             )
 
             packages = result.packages
         except OverrideNeeded as e:
-            return self.solve_in_compatibility_mode(e.overrides, use_latest=use_latest)
+            return self.solve_in_compatibility_mode(e.overrides, use_latest=use_latest, pinned=pinned)
         except SolveFailure as e:
             raise SolverProblemError(e)
 
-        # NOTE passing explicit empty array for seen to reset between invocations during update + install cycle
+        # NOTE passing explicit empty set for seen to reset between invocations during update + install cycle
         results = dict(
             depth_first_search(
-                PackageNode(self._package, packages, seen=[]), aggregate_package_nodes
+                PackageNode(self._package, packages, seen=set()), aggregate_package_nodes
             )
         )
 
+        packages_by_name: Dict[str, List[Package]] = defaultdict(list)
+        for package in packages:
+            packages_by_name[package.name].append(package)
+
         # Merging feature packages with base packages
         final_packages = []
         depths = []
         for package in packages:
             if package.features:
-                for _package in packages:
+                for _package in packages_by_name[package.name]:
                     if (
                             _package.name == package.name
                             and not _package.is_same_package_as(package)
@@ -217,6 +261,8 @@ def depth_first_search(
     topo_sorted_nodes = []
 
     dfs_visit(source, back_edges, visited, topo_sorted_nodes)
+    # dfs_visit appends the nodes in post order
+    topo_sorted_nodes.reverse()
 
     # Combine the nodes by name
     combined_nodes = defaultdict(list)
@@ -258,7 +304,7 @@ def dfs_visit(
         if not dfs_visit(neighbor, back_edges, visited, sorted_nodes):
             return False
     visited[node.id] = VisitedState.Visited
-    sorted_nodes.insert(0, node)
+    sorted_nodes.append(node)
     return True
 
 
@@ -267,7 +313,7 @@ class PackageNode(DFSNode):
             self,
             package: Package,
             packages: List[Package],
-            seen: List[Package],
+            seen: Set[Package],
             previous: Optional["PackageNode"] = None,
             previous_dep: Optional[
                 Union[
@@ -287,11 +333,20 @@ class PackageNode(DFSNode):
                     "Dependency",
                 ]
             ] = None,
+            packages_by_name: Optional[Dict[str, List[Package]]] = None,
     ) -> None:
         self.package = package
         self.packages = packages
         self.seen = seen
 
+        # the packages of each complete name, in their order in packages, shared by all the nodes of a search
+        if packages_by_name is None:
+            packages_by_name = defaultdict(list)
+            for pkg in packages:
+                packages_by_name[pkg.complete_name].append(pkg)
+
+        self.packages_by_name = packages_by_name
+
         self.previous = previous
         self.previous_dep = previous_dep
         self.dep = dep
@@ -310,12 +365,13 @@ class PackageNode(DFSNode):
 
     def reachable(self) -> List["PackageNode"]:
         children: List[PackageNode] = []
+        children_names = set()
 
         # skip already traversed packages
         if self.package in self.seen:
             return []
         else:
-            self.seen.append(self.package)
+            self.seen.add(self.package)
 
         if (
                 self.previous_dep
@@ -333,8 +389,8 @@ class PackageNode(DFSNode):
                 # dependency cycles in general are handled by the DFS traversal
                 continue
 
-            for pkg in self.packages:
-                if pkg.complete_name == dependency.complete_name and (
+            for pkg in self.packages_by_name.get(dependency.complete_name, ()):
+                if (
                         dependency.constraint.allows(pkg.version)
                         or dependency.allows_prereleases()
                         and pkg.version.is_unstable()
@@ -342,12 +398,10 @@ class PackageNode(DFSNode):
                 ):
                     # If there is already a child with this name
                     # we merge the requirements
-                    if any(
-                            child.package.name == pkg.name
-                            for child in children
-                    ):
+                    if pkg.name in children_names:
                         continue
 
+                    children_names.add(pkg.name)
                     children.append(
                         PackageNode(
                             pkg,
@@ -356,6 +410,7 @@ class PackageNode(DFSNode):
                             self,
                             dependency,
                             self.dep or dependency,
+                            self.packages_by_name,
                         )
                     )
 
@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -38,47 +39,42 @@ class Transaction:
 
         operations = []
 
+        # the first installed package and the number of installed packages of each name
+        installed_by_name: Dict[str, "Package"] = {}
+        installed_counts: Dict[str, int] = {}
+        for installed_package in self._installed_packages:
+            installed_by_name.setdefault(installed_package.name, installed_package)
+            installed_counts[installed_package.name] = installed_counts.get(installed_package.name, 0) + 1
+
         for result_package, priority in self._result_packages:
-            installed = False
-
-            for installed_package in self._installed_packages:
-                if result_package.name == installed_package.name:
-                    installed = True
-
-                    if result_package.version != installed_package.version:
-                        operations.append(
-                            Update(installed_package, result_package, priority=priority)
-                        )
-                    elif (
-                            installed_package.source_type
-                            or result_package.source_type != "legacy"
-                    ) and not result_package.is_same_package_as(installed_package):
-                        operations.append(
-                            Update(installed_package, result_package, priority=priority)
-                        )
-                    else:
-                        operations.append(
-                            Install(result_package).skip("Already installed")
-                        )
-
-                    break
-
-            if not installed:
+            installed_package = installed_by_name.get(result_package.name)
+
+            if installed_package is None:
                 operations.append(Install(result_package, priority=priority))
+            elif result_package.version != installed_package.version:
+                operations.append(
+                    Update(installed_package, result_package, priority=priority)
+                )
+            elif (
+                    installed_package.source_type
+                    or result_package.source_type != "legacy"
+            ) and not result_package.is_same_package_as(installed_package):
+                operations.append(
+                    Update(installed_package, result_package, priority=priority)
+                )
+            else:
+                operations.append(
+                    Install(result_package).skip("Already installed")
+                )
 
         if with_uninstalls:
+            result_names = {result_package.name for result_package, _ in self._result_packages}
             for current_package in self._current_packages:
-                found = False
-                for result_package, _ in self._result_packages:
-                    if current_package.name == result_package.name:
-                        found = True
-
-                        break
+                if current_package.name in result_names:
+                    continue
 
-                if not found:
-                    for installed_package in self._installed_packages:
-                        if installed_package.name == current_package.name:
-                            operations.append(Uninstall(current_package))
+                for _ in range(installed_counts.get(current_package.name, 0)):
+                    operations.append(Uninstall(current_package))
 
             if synchronize:
                 current_package_names = {
@@ -1,21 +1,75 @@
 import hashlib
+import json
+import os
 import threading
+import urllib.parse
+import zipfile
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Optional, Set, Union
 
+import requests
 from poetry.console import Printer, NullPrinter
 from poetry.core.packages.file_dependency import FileDependency
 from poetry.core.packages.package import Package
 from poetry.core.packages.utils.link import Link
 from poetry.utils.authenticator import Authenticator
+from poetry.utils.helpers import link_file
+from poetry.utils.helpers import safe_rmtree
 
 _ARCHIVE_TYPES = {".whl", ".tar.gz", ".tar.bz2", ".bz2", ".zip"}
 
+_MIN_CHUNK_SIZE = 64 * 1024
+_MAX_CHUNK_SIZE = 4 * 1024 * 1024
+_DOWNLOAD_RETRIES = 3
+
+
+def _chunk_size_for(total: Optional[int]) -> int:
+    """
+    Read large archives in large chunks (about 1/64 of the archive) and small ones in small chunks,
+    keeping the progress bar responsive.
+    """
+    if total is None:
+        return _MIN_CHUNK_SIZE
+
+    return min(max(total // 64, _MIN_CHUNK_SIZE), _MAX_CHUNK_SIZE)
+
 
 class Artifacts:
+    """
+    Archives are stored by content under `sha256/<digest>/<filename>`, so an archive served by several
+    indexes or mirrors is only stored once. `urls/<md5(url)>.json` records the digest of every downloaded url,
+    so that links whose digest is not known up front (no hash fragment and no locked file hashes) can still
+    be found in the store. The inspected metadata of archives is stored by content as well, under
+    `metadata/<digest>.json`.
+    """
+
     def __init__(self, workspace: Union[Path, str]):
         self._workspace = Path(workspace)
         self._lock = threading.Lock()
+        self._link_locks: Dict[str, threading.Lock] = {}
+
+    def _blob_dir_of(self, digest: str) -> Path:
+        return self._workspace / "sha256" / digest[:2] / digest[2:4] / digest
+
+    def _is_stored(self, archive: Path) -> bool:
+        return len(archive.parents) > 3 and archive.parents[3] == self._workspace / "sha256"
+
+    def _alias_of(self, link: Link) -> Path:
+        link_hash = hashlib.md5(self._alias_url(link).encode('ascii')).hexdigest()
+        return self._workspace / "urls" / link_hash[:2] / f"{link_hash}.json"
+
+    @staticmethod
+    def _alias_url(link: Link) -> str:
+        # credentials are not part of the identity of an archive
+        parsed = urllib.parse.urlsplit(link.url_without_fragment)
+        return urllib.parse.urlunsplit(parsed._replace(netloc=parsed.netloc.rpartition("@")[2]))
+
+    def _metadata_file_of(self, digest: str) -> Path:
+        return self._workspace / "metadata" / digest[:2] / f"{digest}.json"
+
+    def _url_metadata_file_of(self, link: Link) -> Path:
+        link_hash = hashlib.md5(self._alias_url(link).encode('ascii')).hexdigest()
+        return self._workspace / "metadata" / "urls" / link_hash[:2] / f"{link_hash}.json"
 
     def _cache_dir_of(self, link: Link) -> Path:
         link_hash = hashlib.md5(link.url.encode('ascii')).hexdigest()
@@ -25,48 +79,253 @@ class Artifacts:
 
         return self._workspace / pack_dir / ver_dir / link_hash
 
-    def fetch(self, link: Union[Link, str], authenticator: Optional[Authenticator], io: Printer = NullPrinter,
-              package: Optional[Package] = None) -> Path:
+    def _link_lock(self, link: Link) -> threading.Lock:
+        """
+        Returns the lock guarding the cache entry of the given link, so that different links can be
+        downloaded concurrently while the same link is only downloaded once.
+        """
+        return self._path_lock(self._cache_dir_of(link))
+
+    def _path_lock(self, path: Path) -> threading.Lock:
+        key = str(path)
+        with self._lock:
+            lock = self._link_locks.get(key)
+            if lock is None:
+                lock = self._link_locks[key] = threading.Lock()
+
+            return lock
+
+    def fetch(self, link: Union[Link, str], authenticator: Optional[Authenticator] = None,
+              io: Printer = NullPrinter, package: Optional[Package] = None) -> Path:
 
         if isinstance(link, str):
             link = Link(link)
 
-        cached = self._lookup_cache(link)
-        if cached is not None:
-            return cached
+        with self._link_lock(link):
+            cached = self._lookup_cache(link, package)
+            if cached is not None:
+                if package is not None and self._is_stored(cached):
+                    # the sha256 digest of a stored archive is its directory name, other algorithms re-read it
+                    self._validate_hash(cached, package, io, {"sha256": cached.parent.name})
+                return cached
 
-        cached = self._download_archive(authenticator, link, io)
-        if package is not None:
-            self._validate_hash(cached, package, io)
-        return cached
+            return self._download_archive(authenticator, link, io, package)
+
+    def cached(self, link: Union[Link, str]) -> Optional[Path]:
+        """
+        Returns the locally stored archive of the given link, or None if it was not downloaded yet.
+        """
+        if isinstance(link, str):
+            link = Link(link)
 
-    def _download_archive(self, authenticator: Optional[Authenticator], link: Link, printer: Printer) -> Path:
+        with self._link_lock(link):
+            return self._lookup_cache(link)
+
+    def metadata(self, link: Union[Link, str], inspect: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Returns the metadata of the archive of the given link, as returned by `inspect`. Metadata is stored
+        by the archive digest, so `inspect` is only called for archives that were not inspected before
+        through any url. Links without a known digest fall back to a url keyed entry.
+        """
+        if isinstance(link, str):
+            link = Link(link)
+
+        with self._path_lock(self._url_metadata_file_of(link)):
+            digest = self._known_digest(link, None)
+            stored = self._read_json(
+                self._metadata_file_of(digest) if digest is not None else self._url_metadata_file_of(link)
+            )
+            if stored is not None:
+                return stored
+
+            result = inspect()
+
+            if digest is None:
+                # inspecting may have downloaded the archive
+                digest = self._known_digest(link, None)
+
+            if digest is not None:
+                self._write_json(self._metadata_file_of(digest), result)
+                if link.hash_name == "sha256":
+                    self._write_alias(link, digest)
+            else:
+                self._write_json(self._url_metadata_file_of(link), result)
+
+            return result
+
+    def unpacked(self, wheel: Path) -> Path:
+        """
+        Returns a directory containing the unpacked content of the given (fetched) wheel. The directory is
+        shared by every installation of the wheel, which may hard link or reflink its files instead of
+        copying them, so it must be treated as read-only.
+        """
+        if self._is_stored(wheel):
+            digest = wheel.parent.name
+        else:
+            digest = FileDependency(wheel.name, wheel).hash()
+
+        target = self._workspace / "unpacked" / digest[:2] / digest
+
+        with self._path_lock(target):
+            if target.exists():
+                return target
+
+            tmp = target.with_name(target.name + ".tmp")
+            if tmp.exists():
+                safe_rmtree(str(tmp))
+
+            with zipfile.ZipFile(str(wheel)) as zf:
+                zf.extractall(str(tmp))
+
+            os.replace(str(tmp), str(target))
+
+        return target
+
+    def _download_archive(
+            self, authenticator: Optional[Authenticator], link: Link, printer: Printer,
+            package: Optional[Package] = None
+    ) -> Path:
         if not authenticator:
             from poetry.app.relaxed_poetry import rp
             authenticator = rp.authenticator
 
-        response = authenticator.request("get", link.url, stream=True, io=printer.as_output())
-        wheel_size = response.headers.get("content-length")
+        partial = self._cache_dir_of(link) / (link.filename + ".part")
+        partial.parent.mkdir(parents=True, exist_ok=True)
+
+        hash_names = self._hash_names_for(link, package)
+
+        attempt = 0
+        while True:
+            try:
+                hashes = self._download_part(authenticator, link, partial, hash_names, printer)
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                # the partial file is kept so that the next attempt resumes from where this one stopped
+                if attempt >= _DOWNLOAD_RETRIES:
+                    raise
+
+                attempt += 1
+
+        # a corrupted download or a stale part resumed against changed content must never reach the store
+        if link.hash_name in hashes and hashes[link.hash_name] != link.hash:
+            partial.unlink()
+            raise RuntimeError(
+                f"Invalid hash for {link.filename}: expected {link.hash_name}:{link.hash}, "
+                f"got {link.hash_name}:{hashes[link.hash_name]}"
+            )
+
+        archive = self._blob_dir_of(hashes["sha256"]) / link.filename
+
+        if package is not None:
+            try:
+                self._validate_hash(archive, package, printer, hashes)
+            except RuntimeError:
+                partial.unlink()
+                raise
+
+        # the archive only becomes visible to _lookup_cache once it is complete and validated
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(str(partial), str(archive))
+        self._write_alias(link, hashes["sha256"])
+
+        return archive
+
+    def _write_alias(self, link: Link, digest: str):
+        self._write_json(self._alias_of(link), {"url": self._alias_url(link), "sha256": digest})
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(str(tmp), str(path))
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+        if not path.exists():
+            return None
+
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _known_digest(self, link: Link, package: Optional[Package]) -> Optional[str]:
+        """
+        Returns the sha256 digest of the given link if it is known without downloading it - from the link
+        hash fragment, from the package files hashes or from a previous download of the same url.
+        """
+        if link.hash_name == "sha256" and link.hash:
+            return link.hash
+
+        if package is not None:
+            for meta in package.files or []:
+                if meta.get("file") == link.filename and (meta.get("hash") or "").startswith("sha256:"):
+                    return meta["hash"][len("sha256:"):]
+
+        alias = self._read_json(self._alias_of(link))
+        if alias is not None:
+            return alias.get("sha256")
+
+        return None
+
+    def _download_part(
+            self, authenticator: Authenticator, link: Link, partial: Path, hash_names: Set[str], printer: Printer
+    ) -> Dict[str, str]:
+        """
+        Downloads the given link into the partial file, resuming a previously interrupted download
+        if the server supports range requests. Returns the requested digests of the downloaded content.
+        """
+        hashers = {name: hashlib.new(name) for name in hash_names}
+
+        done = partial.stat().st_size if partial.exists() else 0
+        headers = {"Range": f"bytes={done}-"} if done else {}
+
+        try:
+            response = authenticator.request(
+                "get", link.url, stream=True, headers=headers, io=printer.as_output()
+            )
+        except requests.exceptions.HTTPError as e:
+            if not done or e.response is None or e.response.status_code != 416:
+                raise
+
+            # the partial file cannot be resumed, start over
+            partial.unlink()
+            done = 0
+            response = authenticator.request("get", link.url, stream=True, io=printer.as_output())
+
+        if done and response.status_code == 206:
+            # re-hash the part we already have before appending to it
+            with partial.open("rb") as f:
+                for chunk in iter(lambda: f.read(_MAX_CHUNK_SIZE), b""):
+                    for hasher in hashers.values():
+                        hasher.update(chunk)
+            mode = "ab"
+        else:
+            done = 0
+            mode = "wb"
+
+        remaining = response.headers.get("content-length")
+        total = done + int(remaining) if remaining is not None else None
 
         message = f"<info>Downloading {link.filename}...</>"
         progress = None
         if printer.is_decorated():
-            if wheel_size is None:
+            if total is None:
                 printer.println(message)
             else:
                 from cleo.ui.progress_bar import ProgressBar
 
-                progress = ProgressBar(printer.dynamic_line().as_output(), max=int(wheel_size))
+                progress = ProgressBar(printer.dynamic_line().as_output(), max=total)
                 progress.set_format(message + " <b>%percent%%</b>")
 
         if progress:
             progress.start()
+            progress.set_progress(done)
 
-        done = 0
-        archive = self._cache_dir_of(link) / link.filename
-        archive.parent.mkdir(parents=True, exist_ok=True)
-        with archive.open("wb") as f:
-            for chunk in response.iter_content(chunk_size=4096):
+        with partial.open(mode) as f:
+            for chunk in response.iter_content(chunk_size=_chunk_size_for(total)):
                 if not chunk:
                     break
 
@@ -75,19 +334,51 @@ class Artifacts:
                 if progress:
                     progress.set_progress(done)
 
+                for hasher in hashers.values():
+                    hasher.update(chunk)
+
                 f.write(chunk)
 
         if progress:
             progress.finish()
 
-        archive.with_suffix(".success").touch(exist_ok=True)
+        if total is not None and done != total:
+            raise requests.exceptions.ChunkedEncodingError(
+                f"Incomplete download of {link.filename}: received {done} out of {total} bytes"
+            )
 
-        return archive
+        return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+    @staticmethod
+    def _hash_names_for(link: Link, package: Optional[Package]) -> Set[str]:
+        names = {"sha256"}
+        if link.hash_name:
+            names.add(link.hash_name)
+
+        if package is not None:
+            for meta in package.files or []:
+                if meta.get("file") == link.filename and meta.get("hash"):
+                    names.add(meta["hash"].split(":", 1)[0])
+
+        return {name for name in names if name in hashlib.algorithms_available}
+
+    def _lookup_cache(self, link: Link, package: Optional[Package] = None) -> Optional[Path]:
+        digest = self._known_digest(link, package)
+        if digest is not None:
+            blob_dir = self._blob_dir_of(digest)
+            blob = blob_dir / link.filename
+            if blob.exists():
+                return blob
 
-    def _lookup_cache(self, link: Link) -> Optional[Path]:
-        cache_dir = self._cache_dir_of(link)
-        cached_file = cache_dir / link.filename
+            # the same content may be stored under a different file name by another index
+            if blob_dir.exists():
+                for stored in blob_dir.iterdir():
+                    if stored.is_file() and not stored.name.endswith(".tmp"):
+                        link_file(stored, blob, "hardlink")
+                        return blob
 
+        # archives downloaded before the content addressed layout
+        cached_file = self._cache_dir_of(link) / link.filename
         if cached_file.with_suffix(".success").exists():
             return cached_file
         return None
@@ -116,11 +407,17 @@ class Artifacts:
         #
         # return None
 
-    def _validate_hash(self, artifact: Path, package: Package, io: Printer):
+    def _validate_hash(
+            self, artifact: Path, package: Package, io: Printer, hashes: Optional[Dict[str, str]] = None
+    ):
         if package.files:
             file_meta = next((meta for meta in package.files if meta.get('file') == artifact.name), None)
             if file_meta and file_meta['hash']:
-                archive_hash = ("sha256:" + FileDependency(package.name, artifact, ).hash())
+                hash_name = file_meta['hash'].split(":", 1)[0]
+                if hashes and hash_name in hashes:
+                    archive_hash = f"{hash_name}:{hashes[hash_name]}"
+                else:
+                    archive_hash = f"{hash_name}:{FileDependency(package.name, artifact).hash(hash_name)}"
                 if archive_hash != file_meta['hash']:
                     raise RuntimeError(f"Invalid hash for {package} using archive {artifact.name}")
             else:
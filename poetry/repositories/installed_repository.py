@@ -1,7 +1,13 @@
+import hashlib
 import itertools
 import json
+import os
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
 from typing import Set
 from typing import Tuple
 from typing import Union
@@ -10,6 +16,7 @@ from poetry.core.packages.package import Package
 from poetry.core.packages.utils.utils import url_to_path
 from poetry.core.utils.helpers import canonicalize_name
 from poetry.core.utils.helpers import module_name
+from poetry.locations import CACHE_DIR
 from poetry.utils._compat import metadata
 from poetry.utils.env import Env
 
@@ -18,6 +25,9 @@ from .repository import Repository
 
 _VENDORS = Path(__file__).parent.parent.joinpath("_vendor")
 
+# bump whenever the structure of the records stored in the installed packages index changes
+_INDEX_VERSION = 1
+
 
 try:
     FileNotFoundError
@@ -224,39 +234,141 @@ class InstalledRepository(Repository):
     def load(cls, env: Env, with_dependencies: bool = False) -> "InstalledRepository":
         """
         Load installed packages.
+
+        The packages found in every distribution directory are kept in a persistent per environment index that
+        is invalidated by the mtime of the distribution directory, so only new or changed distributions are
+        parsed (concurrently).
         """
         from poetry.core.packages.dependency import Dependency
 
-        repo = cls()
-        seen = set()
-
+        index = cls._load_index(env)
+        distributions = []
         for entry in reversed(env.sys_path):
             for distribution in sorted(
                 metadata.distributions(path=[entry]),
                 key=lambda d: str(d._path),
             ):
-                name = canonicalize_name(distribution.metadata["name"])
-
-                if name in seen:
-                    continue
-
                 path = Path(str(distribution._path))
 
                 try:
                     path.relative_to(_VENDORS)
                 except ValueError:
-                    pass
-                else:
-                    continue
+                    distributions.append((path, distribution))
+
+        records: Dict[str, Dict[str, Any]] = {}
+        stale = []
+        for path, distribution in distributions:
+            key = str(path)
+            record = index.get(key)
+            if record is not None and record["mtime"] == cls._mtime_of(path):
+                records[key] = record
+            else:
+                stale.append((path, distribution))
 
-                package = cls.create_package_from_distribution(distribution, env)
+        if stale:
+            with ThreadPoolExecutor() as executor:
+                parsed = list(executor.map(lambda it: cls._record_of(it[1], env), stale))
 
-                if with_dependencies:
-                    for require in distribution.metadata.get_all("requires-dist", []):
-                        dep = Dependency.create_from_pep_508(require)
-                        package.add_dependency(dep)
+            for (path, _), record in zip(stale, parsed):
+                records[str(path)] = record
 
-                seen.add(package.name)
-                repo.add_package(package)
+        repo = cls()
+        seen = set()
+        for path, _ in distributions:
+            record = records[str(path)]
+            name = canonicalize_name(record["name"])
+
+            if name in seen:
+                continue
+
+            package = Package(
+                record["name"],
+                record["version"],
+                source_type=record["source_type"],
+                source_url=record["source_url"],
+                source_reference=record["source_reference"],
+                source_resolved_reference=record["source_resolved_reference"],
+                develop=record["develop"],
+            )
+            package.description = record["description"]
+
+            if with_dependencies:
+                for require in record["requires"]:
+                    dep = Dependency.create_from_pep_508(require)
+                    package.add_dependency(dep)
+
+            seen.add(package.name)
+            repo.add_package(package)
+
+        if stale or len(index) != len(records):
+            cls._save_index(
+                env, {key: record for key, record in records.items() if not record["volatile"]}
+            )
 
         return repo
+
+    @classmethod
+    def _record_of(cls, distribution: metadata.Distribution, env: Env) -> Dict[str, Any]:
+        path = Path(str(distribution._path))
+        mtime = cls._mtime_of(path)
+        package = cls.create_package_from_distribution(distribution, env)
+
+        # packages installed from a vcs checkout in the src directory report its current revision,
+        # which may change without touching the distribution directory
+        volatile = mtime is None or (
+            package.source_type in {"git", "hg", "bzr", "svn"}
+            and not path.joinpath("direct_url.json").exists()
+        )
+
+        return {
+            "mtime": mtime,
+            "name": distribution.metadata["name"],
+            "version": distribution.metadata["version"],
+            "source_type": package.source_type,
+            "source_url": package.source_url,
+            "source_reference": package.source_reference,
+            "source_resolved_reference": package.source_resolved_reference,
+            "develop": package.develop,
+            "description": package.description,
+            "requires": distribution.metadata.get_all("requires-dist", []),
+            "volatile": volatile,
+        }
+
+    @staticmethod
+    def _mtime_of(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _index_file(env: Env) -> Path:
+        key = hashlib.sha256(str(env.path).encode("utf-8")).hexdigest()
+        return Path(CACHE_DIR) / "installed" / key[:2] / f"{key}.json"
+
+    @classmethod
+    def _load_index(cls, env: Env) -> Dict[str, Dict[str, Any]]:
+        index_file = cls._index_file(env)
+        try:
+            index = json.loads(index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(index, dict) or index.get("version") != _INDEX_VERSION:
+            return {}
+
+        return index.get("distributions", {})
+
+    @classmethod
+    def _save_index(cls, env: Env, records: Dict[str, Dict[str, Any]]) -> None:
+        index_file = cls._index_file(env)
+        try:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps({"version": _INDEX_VERSION, "distributions": records}), encoding="utf-8"
+            )
+            os.replace(str(tmp), str(index_file))
+        except OSError:
+            # the index is only an optimization
+            pass
@@ -1,13 +1,17 @@
 import cgi
+import hashlib
+import json
 import re
 import urllib.parse
-import warnings
 from collections import defaultdict
+from html.parser import HTMLParser
 from pathlib import Path
 from typing import Any
+from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import TYPE_CHECKING, MutableMapping
 
 import requests
@@ -35,29 +39,45 @@ from ..utils.authenticator import Authenticator
 if TYPE_CHECKING:
     from poetry.core.packages.dependency import Dependency
 
-try:
-    from html import unescape
-except ImportError:
-    try:
-        from html.parser import HTMLParser
-    except ImportError:
-        # noinspection PyUnresolvedReferences,PyCompatibility
-        from HTMLParser import HTMLParser
-
-    unescape = HTMLParser().unescape
-
 try:
     from urllib.parse import quote
 except ImportError:
     # noinspection PyUnresolvedReferences
     from urllib import quote
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore")
-    import html5lib
+# PEP 691 content negotiation, the html formats are only used by indexes that do not serve json
+SIMPLE_API_ACCEPT = ", ".join(
+    [
+        "application/vnd.pypi.simple.v1+json",
+        "application/vnd.pypi.simple.v1+html;q=0.2",
+        "text/html;q=0.01",
+    ]
+)
+SIMPLE_API_JSON = "application/vnd.pypi.simple.v1+json"
+
+
+class _AnchorParser(HTMLParser):
+    """
+    Collects the attributes of the anchors of a simple index page, without building a document tree.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.anchors: List[Dict[str, Optional[str]]] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "a":
+            self.anchors.append(dict(attrs))
 
 
 class Page:
+    """
+    A simple index page of a single project.
+
+    The page is parsed once into an index of its distribution links by version, the index can be
+    serialized (see `asdict`) so that cached pages do not need to be parsed again.
+    """
+
     VERSION_REGEX = re.compile(r"(?i)([a-z0-9_\-.]+?)-(?=\d)([a-z0-9_.!+-]+)")
     SUPPORTED_FORMATS = [
         ".tar.gz",
@@ -74,70 +94,53 @@ class Page:
             url += "/"
 
         self._url = url
-        encoding = None
-        if headers and "Content-Type" in headers:
-            content_type, params = cgi.parse_header(headers["Content-Type"])
+        self._content = content
+        self._headers = headers
 
-            if "charset" in params:
-                encoding = params["charset"]
+        # each entry is [url, requires python, version, PEP 658 metadata hashes]
+        self._entries: Optional[List[list]] = None
+        self._links: Optional[List[Link]] = None
+        self._links_by_version: Dict[Optional[Version], List[Link]] = {}
+        self._dist_metadata: Dict[str, Dict[str, str]] = {}
 
-        self._content = content
+    @classmethod
+    def load(cls, data: Dict[str, Any]) -> "Page":
+        """
+        Loads a page previously serialized with `asdict`.
+        """
+        page = cls(data["url"], b"", {})
+        page._entries = data["links"]
+        return page
 
-        if encoding is None:
-            self._parsed = html5lib.parse(content, namespaceHTMLElements=False)
-        else:
-            self._parsed = html5lib.parse(
-                content, transport_encoding=encoding, namespaceHTMLElements=False
-            )
+    def asdict(self) -> Dict[str, Any]:
+        return {"url": self._url, "links": self._parsed_entries()}
 
     @property
     def versions(self) -> Iterator[Version]:
-        seen = set()
-        for link in self.links:
-            version = self.link_version(link)
-
-            if not version:
-                continue
-
-            if version in seen:
-                continue
-
-            seen.add(version)
-
-            yield version
+        self._build_index()
+        return (version for version in self._links_by_version if version is not None)
 
     @property
     def links(self) -> Iterator[Link]:
-        for anchor in self._parsed.findall(".//a"):
-            if anchor.get("href"):
-                href = anchor.get("href")
-                url = self.clean_link(urllib.parse.urljoin(self._url, href))
-                pyrequire = anchor.get("data-requires-python")
-                pyrequire = unescape(pyrequire) if pyrequire else None
-
-                link = Link(url, self, requires_python=pyrequire)
-
-                if link.ext not in self.SUPPORTED_FORMATS:
-                    continue
-
-                yield link
+        self._build_index()
+        return iter(self._links)
 
     def links_for_version(self, version: Version) -> Iterator[Link]:
-        for link in self.links:
-            if self.link_version(link) == version:
-                yield link
+        self._build_index()
+        return iter(self._links_by_version.get(version, []))
 
-    def link_version(self, link: Link) -> Optional[Version]:
-        m = wheel_file_re.match(link.filename)
-        if m:
-            version = m.group("ver")
-        else:
-            info, ext = link.splitext()
-            match = self.VERSION_REGEX.match(info)
-            if not match:
-                return
+    def dist_metadata(self, link: Link) -> Optional[Dict[str, str]]:
+        """
+        Returns the hashes of the PEP 658 metadata file of the given link (which may be empty),
+        or None if the index does not serve such a file for it.
+        """
+        self._build_index()
+        return self._dist_metadata.get(link.url_without_fragment)
 
-            version = match.group(2)
+    def link_version(self, link: Link) -> Optional[Version]:
+        version = self._link_version_text(link)
+        if version is None:
+            return
 
         try:
             version = Version.parse(version)
@@ -146,6 +149,18 @@ class Page:
 
         return version
 
+    def _link_version_text(self, link: Link) -> Optional[str]:
+        m = wheel_file_re.match(link.filename)
+        if m:
+            return m.group("ver")
+
+        info, ext = link.splitext()
+        match = self.VERSION_REGEX.match(info)
+        if not match:
+            return
+
+        return match.group(2)
+
     _clean_re = re.compile(r"[^a-z0-9$&+,/:;=?@.#%_\\|-]", re.I)
 
     def clean_link(self, url: str) -> str:
@@ -154,9 +169,107 @@ class Page:
         % or other characters)."""
         return self._clean_re.sub(lambda match: "%%%2x" % ord(match.group(0)), url)
 
+    def _parsed_entries(self) -> List[list]:
+        if self._entries is None:
+            entries = []
+            for url, requires_python, metadata in self._parse_files():
+                link = Link(url, self, requires_python=requires_python)
+                if link.ext not in self.SUPPORTED_FORMATS:
+                    continue
+
+                entries.append([url, requires_python, self._link_version_text(link), metadata])
+
+            self._entries = entries
+
+        return self._entries
+
+    def _build_index(self) -> None:
+        if self._links is not None:
+            return
+
+        links = []
+        links_by_version: Dict[Optional[Version], List[Link]] = {}
+        parsed_versions: Dict[Optional[str], Optional[Version]] = {None: None}
+        for url, requires_python, version_text, metadata in self._parsed_entries():
+            link = Link(url, self, requires_python=requires_python)
+            links.append(link)
+
+            if version_text not in parsed_versions:
+                try:
+                    parsed_versions[version_text] = Version.parse(version_text)
+                except ValueError:
+                    parsed_versions[version_text] = None
+
+            links_by_version.setdefault(parsed_versions[version_text], []).append(link)
+
+            if metadata is not None:
+                self._dist_metadata[link.url_without_fragment] = metadata
+
+        self._links_by_version = links_by_version
+        self._links = links
+
+    def _parse_files(self) -> Iterator[Tuple[str, Optional[str], Optional[Dict[str, str]]]]:
+        """
+        Yields the url, requires python and PEP 658 metadata hashes of the files listed in the page.
+        """
+        encoding = "utf-8"
+        if self._headers and "Content-Type" in self._headers:
+            content_type, params = cgi.parse_header(self._headers["Content-Type"])
+
+            if "charset" in params:
+                encoding = params["charset"]
+
+        parser = _AnchorParser()
+        parser.feed(self._content.decode(encoding, errors="replace"))
+        parser.close()
+
+        for anchor in parser.anchors:
+            href = anchor.get("href")
+            if not href:
+                continue
+
+            metadata = None
+            metadata_attr = anchor.get("data-core-metadata") or anchor.get("data-dist-info-metadata")
+            if metadata_attr and metadata_attr != "false":
+                metadata = {}
+                name, _, value = metadata_attr.partition("=")
+                if value:
+                    metadata[name] = value
+
+            yield (
+                self.clean_link(urllib.parse.urljoin(self._url, href)),
+                anchor.get("data-requires-python") or None,
+                metadata,
+            )
+
+
+class JsonPage(Page):
+    """
+    A PEP 691 json simple index page.
+    """
+
+    def _parse_files(self) -> Iterator[Tuple[str, Optional[str], Optional[Dict[str, str]]]]:
+        for file in json.loads(self._content).get("files", []):
+            url = self.clean_link(urllib.parse.urljoin(self._url, file["url"]))
+
+            hashes = file.get("hashes") or {}
+            if "#" not in url and hashes:
+                name = "sha256" if "sha256" in hashes else next(iter(hashes))
+                url += f"#{name}={hashes[name]}"
+
+            metadata = file.get("core-metadata", file.get("dist-info-metadata", False))
+            if metadata:
+                metadata = metadata if isinstance(metadata, dict) else {}
+            else:
+                metadata = None
+
+            yield url, file.get("requires-python"), metadata
+
 
 # noinspection PyMissingConstructor
 class LegacyRepository(PyPiRepository):
+    PAGE_CACHE_MINUTES = 7 * 24 * 60
+
     def __init__(
             self,
             name: str,
@@ -183,6 +296,7 @@ class LegacyRepository(PyPiRepository):
                     "releases": {"driver": "file", "path": str(self._cache_dir)},
                     "packages": {"driver": "dict"},
                     "matches": {"driver": "dict"},
+                    "pages": {"driver": "dict"},
                 },
             }
         )
@@ -209,6 +323,7 @@ class LegacyRepository(PyPiRepository):
             self._request_auth_args["cert"]  = str(self._client_cert)
 
         self._disable_cache = disable_cache
+        self._dist_metadata: Dict[str, Dict[str, str]] = {}
 
     @property
     def cert(self) -> Optional[Path]:
@@ -339,7 +454,7 @@ class LegacyRepository(PyPiRepository):
 
         return list(page.links_for_version(package.version))
 
-    def get_release_info(self, name: str, version: str, project: ManagedProject) -> "PackageInfo":
+    def _get_release_info(self, name: str, version: str, project: ManagedProject) -> dict:
         page = self._get("/{}/".format(canonicalize_name(name).replace(".", "-")))
         if page is None:
             raise PackageNotFound(f'No package named "{name}"')
@@ -377,6 +492,10 @@ class LegacyRepository(PyPiRepository):
 
             files.append({"file": link.filename, "hash": file_hash})
 
+            metadata = page.dist_metadata(link)
+            if metadata is not None:
+                self._dist_metadata[link.url] = metadata
+
         data.files = files
 
         info = self._get_info_from_urls(urls, project)
@@ -385,14 +504,46 @@ class LegacyRepository(PyPiRepository):
         data.requires_dist = info.requires_dist
         data.requires_python = info.requires_python
 
-        return data
+        # the inspected archive was selected according to the project environment
+        return self._release_record(data, project)
+
+    def _inspect_wheel(self, url: str, project: ManagedProject) -> dict:
+        hashes = self._dist_metadata.get(url)
+        if hashes is not None:
+            metadata = self._get_dist_metadata(url, hashes)
+            if metadata is not None:
+                return PackageInfo.from_wheel_metadata(metadata, url).asdict()
+
+        return super()._inspect_wheel(url, project)
+
+    def _get_dist_metadata(self, url: str, hashes: Dict[str, str]) -> Optional[bytes]:
+        """
+        Downloads the PEP 658 metadata file of the given distribution url, returns None if it is unusable.
+        """
+        metadata_url = Link(url).url_without_fragment + ".metadata"
+        self._log(f"Downloading metadata: {metadata_url}", level="debug")
+
+        try:
+            response = http.session().get(metadata_url, **self._request_auth_args)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self._log(f"Unable to download {metadata_url} ({e})", level="debug")
+            return None
+
+        content = response.content
+        for name, expected in hashes.items():
+            if name in hashlib.algorithms_guaranteed and hashlib.new(name, content).hexdigest() != expected:
+                self._log(f"Hash mismatch for {metadata_url}, ignoring it", level="debug")
+                return None
+
+        return content
 
     def _get(self, endpoint: str) -> Optional[Page]:
         url = self._url + endpoint
         session = http.cached_session(True)
 
         try:
-            response = session.get(url, **self._request_auth_args)
+            response = session.get(url, headers={"Accept": SIMPLE_API_ACCEPT}, **self._request_auth_args)
             if response.status_code in (401, 403):
                 self._log(
                     f"Authorization error accessing {url}",
@@ -413,7 +564,24 @@ class LegacyRepository(PyPiRepository):
                 level="debug",
             )
 
-        return Page(response.url, response.content, response.headers)
+        # the parsed link index of a page is cached with the digest of the page content it was parsed from,
+        # unchanged pages are not parsed again and a changed page replaces the entry of its url
+        digest = hashlib.sha256(response.content).hexdigest()
+        key = f"pages/{response.url}"
+
+        def load_page():
+            cached = self._cache.get(key)
+            if cached is not None and cached.get("digest") == digest:
+                return Page.load(cached["page"])
+
+            content_type, _ = cgi.parse_header(response.headers.get("Content-Type", ""))
+            page_type = JsonPage if content_type == SIMPLE_API_JSON else Page
+            page = page_type(response.url, response.content, response.headers)
+            self._cache.put(key, {"digest": digest, "page": page.asdict()}, self.PAGE_CACHE_MINUTES)
+
+            return page
+
+        return self._cache.store("pages").remember_forever(f"{key}/{digest}", load_page)
 
     # def _download(self, url, dest):  # type: (str, str) -> None
     #     from poetry.app.relaxed_poetry import rp
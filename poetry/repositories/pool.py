@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from .base_repository import BaseRepository
 from .exceptions import PackageNotFound
@@ -41,6 +42,18 @@ class Pool(BaseRepository):
     def repositories(self) -> List[Repository]:
         return self._repositories
 
+    def signature(self) -> Tuple:
+        """
+        Pools with equal signatures find the same packages for the same dependencies.
+        """
+        return (
+            tuple(self._repositories),
+            tuple(sorted(self._lookup.items(), key=lambda item: str(item[0]))),
+            self._secondary_start_idx,
+            self._ignore_repository_names,
+            self._parent.signature() if self._parent is not None else None,
+        )
+
     def has_default(self) -> bool:
         return self._default
 
@@ -35,7 +35,7 @@ from poetry.inspection.info import PackageInfo
 
 
 class PyPiRepository(RemoteRepository):
-    CACHE_VERSION = parse_constraint("1.0.0")
+    CACHE_VERSION = parse_constraint("1.1.0")
 
     def __init__(
             self,
@@ -207,6 +207,48 @@ class PyPiRepository(RemoteRepository):
         """
         from poetry.inspection.info import PackageInfo
 
+        if self._disable_cache:
+            cached = self._get_release_info(name, version, project)
+        else:
+            key = f"{name}:{version}"
+            cached = self._cache.get(key)
+            if cached is None or not self._is_release_cache_valid(cached, project):
+                if cached is not None:
+                    self._log(
+                        f"The cache for {name} {version} is outdated. Refreshing.",
+                        level="debug",
+                    )
+
+                cached = self._get_release_info(name, version, project)
+                self._cache.forever(key, cached)
+
+        cached = dict(cached)
+        cached.pop("_env", None)
+        return PackageInfo.load(cached)
+
+    def _is_release_cache_valid(self, cached: dict, project: ManagedProject) -> bool:
+        cache_version = cached.get("_cache_version") or "0.0.0"
+        if parse_constraint(cache_version) != self.CACHE_VERSION:
+            return False
+
+        # releases which were filtered against (or inspected for) a specific environment
+        # are only valid for environments that look the same
+        env = cached.get("_env")
+        return env is None or env == self._release_env_key(project)
+
+    @staticmethod
+    def _release_env_key(project: ManagedProject) -> str:
+        marker_env = project.env.marker_env
+        return "{}-{}-{}-{}".format(
+            marker_env["implementation_name"],
+            marker_env["python_full_version"],
+            marker_env["sys_platform"],
+            marker_env["platform_machine"],
+        )
+
+    def _get_release_info(self, name: str, version: str, project: ManagedProject) -> dict:
+        from poetry.inspection.info import PackageInfo
+
         self._log(f"Getting info for {name} ({version}) from PyPI", "debug")
 
         json_data = self._get(f"pypi/{name}/{version}/json")
@@ -229,7 +271,7 @@ class PyPiRepository(RemoteRepository):
         package = data.to_package()
         if package.python_constraint.intersect(project.env.python_constraint).is_empty():
             # this package is not usable for this project - we can stop trying to bring more information
-            return data
+            return self._release_record(data, project)
 
         try:
             version_info = json_data["releases"][version]
@@ -258,10 +300,11 @@ class PyPiRepository(RemoteRepository):
                 if dist_type not in ["sdist", "bdist_wheel"]:
                     continue
 
-                urls[dist_type].append(url["url"])
+                # the digest fragment lets inspected metadata be shared with other indexes serving the file
+                urls[dist_type].append("{}#sha256={}".format(url["url"], url["digests"]["sha256"]))
 
             if not urls:
-                return data
+                return data.asdict()
 
             info = self._get_info_from_urls(urls, project)
 
@@ -270,7 +313,17 @@ class PyPiRepository(RemoteRepository):
             if not data.requires_python:
                 data.requires_python = info.requires_python
 
-        return data
+            return self._release_record(data, project)
+
+        return data.asdict()
+
+    def _release_record(self, data: "PackageInfo", project: ManagedProject) -> dict:
+        """
+        Serialize release information that depends on the given project environment.
+        """
+        record = data.asdict()
+        record["_env"] = self._release_env_key(project)
+        return record
 
     def find_links_for_package(self, package: Package) -> List[Link]:
         json_data = self._get(f"pypi/{package.name}/{package.version}/json")
@@ -402,44 +455,57 @@ class PyPiRepository(RemoteRepository):
         return self._get_info_from_sdist(urls["sdist"][0], project)
 
     def _get_info_from_wheel(self, url: str, project: ManagedProject) -> "PackageInfo":
+        from poetry.app.relaxed_poetry import rp
+        from poetry.inspection.info import PackageInfo
 
-        def get_info():
-            from poetry.inspection.info import PackageInfo
+        # shared by every repository serving the same wheel, see Artifacts.metadata
+        return PackageInfo.load(rp.artifacts.metadata(url, lambda: self._inspect_wheel(url, project)))
 
-            self._log(
-                "Downloading wheel: {}".format(
-                    urllib.parse.urlparse(url).path.rsplit("/")[-1]
-                ),
-                level="debug",
-            )
+    def _inspect_wheel(self, url: str, project: ManagedProject) -> dict:
+        import zipfile
 
-            # filename = os.path.basename(urllib.parse.urlparse(url).path.rsplit("/")[-1])
-            from poetry.app.relaxed_poetry import rp
-            wheel_archive = rp.artifacts.fetch(Link(url), authenticator=project.authenticator, io=console)
+        from poetry.app.relaxed_poetry import rp
+        from poetry.inspection.info import PackageInfo
+        from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupported
+        from poetry.inspection.lazy_wheel import wheel_metadata
 
+        filename = urllib.parse.urlparse(url).path.rsplit("/")[-1]
+
+        wheel_archive = rp.artifacts.cached(url)
+        if wheel_archive is not None:
             return PackageInfo.from_wheel(wheel_archive).asdict()
 
-        return PackageInfo.load(self._cache.remember_forever(f"wheels/{url}", get_info))
+        # only the METADATA file is needed, read it using range requests instead of downloading the wheel
+        try:
+            self._log(f"Reading wheel metadata: {filename}", level="debug")
+            return PackageInfo.from_wheel_metadata(wheel_metadata(url, project.authenticator), url).asdict()
+        except (HTTPRangeRequestUnsupported, zipfile.BadZipFile, requests.RequestException) as e:
+            self._log(f"Unable to read the metadata of {filename} remotely ({e})", level="debug")
 
-    def _get_info_from_sdist(self, url: str, project: ManagedProject) -> "PackageInfo":
+        self._log(f"Downloading wheel: {filename}", level="debug")
+        wheel_archive = rp.artifacts.fetch(Link(url), authenticator=project.authenticator, io=console)
 
-        def get_info():
-            from poetry.inspection.info import PackageInfo
+        return PackageInfo.from_wheel(wheel_archive).asdict()
 
-            self._log(
-                "Downloading sdist: {}".format(
-                    urllib.parse.urlparse(url).path.rsplit("/")[-1]
-                ),
-                level="debug",
-            )
+    def _get_info_from_sdist(self, url: str, project: ManagedProject) -> "PackageInfo":
+        from poetry.app.relaxed_poetry import rp
+        from poetry.inspection.info import PackageInfo
+
+        return PackageInfo.load(rp.artifacts.metadata(url, lambda: self._inspect_sdist(url, project)))
 
-            # filename = os.path.basename(urllib.parse.urlparse(url).path)
+    def _inspect_sdist(self, url: str, project: ManagedProject) -> dict:
+        from poetry.app.relaxed_poetry import rp
+        from poetry.inspection.info import PackageInfo
 
-            from poetry.app.relaxed_poetry import rp
-            wheel_archive = rp.artifacts.fetch(Link(url), authenticator=project.authenticator, io=console)
-            return PackageInfo.from_sdist(wheel_archive).asdict()
+        self._log(
+            "Downloading sdist: {}".format(
+                urllib.parse.urlparse(url).path.rsplit("/")[-1]
+            ),
+            level="debug",
+        )
 
-        return PackageInfo.load(self._cache.remember_forever(f"sdists/{url}", get_info))
+        sdist_archive = rp.artifacts.fetch(Link(url), authenticator=project.authenticator, io=console)
+        return PackageInfo.from_sdist(sdist_archive).asdict()
 
     def _log(self, msg: str, level: str = "info") -> None:
         getattr(logger, level)(f"<debug>{self._name}:</debug> {msg}")
@@ -1,5 +1,4 @@
 import logging
-import time
 import urllib.parse
 
 from typing import TYPE_CHECKING
@@ -12,7 +11,6 @@ import requests
 import requests.auth
 import requests.exceptions
 
-from poetry.exceptions import PoetryException
 from poetry.utils import http
 from poetry.utils.password_manager import PasswordManager
 
@@ -42,7 +40,7 @@ class Authenticator:
             getattr(logger, level, logger.debug)(message)
 
     def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
-        request = requests.Request(method, url)
+        request = requests.Request(method, url, headers=kwargs.get("headers"))
         username, password = self.get_credentials_for_url(url)
 
         if username is not None and password is not None:
@@ -67,29 +65,10 @@ class Authenticator:
         }
         send_kwargs.update(settings)
 
-        attempt = 0
-
-        while True:
-            is_last_attempt = attempt >= 5
-            try:
-                resp = session.send(prepared_request, **send_kwargs)
-            except (requests.exceptions.ConnectionError, OSError) as e:
-                if is_last_attempt:
-                    raise e
-            else:
-                if resp.status_code not in [502, 503, 504] or is_last_attempt:
-                    resp.raise_for_status()
-                    return resp
-
-            if not is_last_attempt:
-                attempt += 1
-                delay = 0.5 * attempt
-                self._log(f"Retrying HTTP request in {delay} seconds.", level="debug")
-                time.sleep(delay)
-                continue
-
-        # this should never really be hit under any sane circumstance
-        raise PoetryException("Failed HTTP {} request", method.upper())
+        # transient failures are retried with backoff by the shared http adapters
+        resp = session.send(prepared_request, **send_kwargs)
+        resp.raise_for_status()
+        return resp
 
     def get_credentials_for_url(self, url: str) -> Tuple[Optional[str], Optional[str]]:
         parsed_url = urllib.parse.urlsplit(url)
@@ -160,6 +160,22 @@ import sysconfig
 print(json.dumps(sysconfig.get_paths()))
 """
 
+# runs the given introspection scripts in a single interpreter and prints their outputs
+GET_INTROSPECTION = """\
+import contextlib
+import io
+import json
+
+outputs = {{}}
+for name, script in json.loads({scripts!r}).items():
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        exec(compile(script, name, "exec"), {{"__name__": "__main__"}})
+    outputs[name] = output.getvalue()
+
+print(json.dumps(outputs))
+"""
+
 GET_PATHS_FOR_GENERIC_ENVS = """\
 # We can't use sysconfig.get_paths() because
 # on some distributions it does not return the proper paths
@@ -1288,6 +1304,17 @@ class Env:
     def supported_tags_strset(self) -> Set[str]:
         return {str(tag) for tag in self.supported_tags}
 
+    @cached_property
+    def supported_tags_priority(self) -> Dict[Tag, int]:
+        """
+        Maps each supported tag to its index in `supported_tags`, lower is preferred.
+        """
+        priorities = {}
+        for index, tag in enumerate(self.supported_tags):
+            priorities.setdefault(tag, index)
+
+        return priorities
+
     @classmethod
     def get_base_prefix(cls) -> Path:
         if hasattr(sys, "real_prefix"):
@@ -1549,9 +1576,16 @@ class SystemEnv(Env):
 class VirtualEnv(Env):
     """
     A virtual Python environment.
+
+    The introspected information of the environment (marker env, supported tags, paths, etc.) is collected
+    by a single interpreter process and cached on disk, keyed by the interpreter binary and `pyvenv.cfg`.
     """
 
+    _paths_script = GET_PATHS
+
     def __init__(self, path: Path, base: Optional[Path] = None) -> None:
+        self._introspection: Optional[Dict[str, str]] = None
+
         super().__init__(path, base)
 
         # If base is None, it probably means this is
@@ -1559,7 +1593,7 @@ class VirtualEnv(Env):
         # In this case we need to get sys.base_prefix
         # from inside the virtualenv.
         if base is None:
-            self._base = Path(self.run_python_script(GET_BASE_PREFIX).strip())
+            self._base = Path(self._introspected("base_prefix").strip())
 
     @property
     def sys_path(self) -> List[str]:
@@ -1567,10 +1601,79 @@ class VirtualEnv(Env):
         return json.loads(output)
 
     def get_version_info(self) -> Tuple[int]:
-        output = self.run_python_script(GET_PYTHON_VERSION)
+        output = self._introspected("version_info")
 
         return tuple([int(s) for s in output.strip().split(".")])
 
+    def _introspection_scripts(self) -> Dict[str, str]:
+        return {
+            "base_prefix": GET_BASE_PREFIX,
+            "version_info": GET_PYTHON_VERSION,
+            "marker_env": GET_ENVIRONMENT_INFO,
+            "supported_tags": self._supported_tags_script(),
+            "paths": self._paths_script,
+        }
+
+    def _introspected(self, name: str) -> str:
+        """
+        Returns the output of the introspection script of the given name.
+        """
+        if self._introspection is None:
+            scripts = self._introspection_scripts()
+            cache_file = self._introspection_cache_file(scripts)
+
+            introspection = None
+            if cache_file is not None and cache_file.exists():
+                try:
+                    introspection = json.loads(cache_file.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    introspection = None
+
+            if introspection is None:
+                introspection = json.loads(
+                    self.run_python_script(GET_INTROSPECTION.format(scripts=json.dumps(scripts)))
+                )
+
+                if cache_file is not None:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                    tmp.write_text(json.dumps(introspection), encoding="utf-8")
+                    os.replace(str(tmp), str(cache_file))
+
+            self._introspection = introspection
+
+        return self._introspection[name]
+
+    def _introspection_cache_file(self, scripts: Dict[str, str]) -> Optional[Path]:
+        """
+        Returns the cache file of the introspection of this environment, which changes whenever the interpreter
+        binary, the environment configuration, the host (the kernel is part of the marker env) or the introspection
+        scripts change.
+        """
+        python = Path(self.python)
+        pyvenv_cfg = self._path / "pyvenv.cfg"
+        try:
+            interpreter = python.resolve()
+            interpreter_stat = interpreter.stat()
+            cfg = pyvenv_cfg.read_text(encoding="utf-8") if pyvenv_cfg.exists() else ""
+        except OSError:
+            return None
+
+        fingerprint = json.dumps([
+            str(self._path),
+            str(python),
+            str(interpreter),
+            interpreter_stat.st_mtime_ns,
+            interpreter_stat.st_size,
+            cfg,
+            platform.release(),
+            platform.version(),
+            scripts,
+        ])
+
+        key = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+        return Path(CACHE_DIR) / "envs-info" / key[:2] / f"{key}.json"
+
     def get_python_implementation(self) -> str:
         return self.marker_env["platform_python_implementation"]
 
@@ -1583,6 +1686,10 @@ class VirtualEnv(Env):
         ]
 
     def get_supported_tags(self) -> List[Tag]:
+        return [Tag(*t) for t in json.loads(self._introspected("supported_tags"))]
+
+    @staticmethod
+    def _supported_tags_script() -> str:
         file_path = Path(packaging.tags.__file__)
         if file_path.suffix == ".pyc":
             # Python 2
@@ -1608,26 +1715,21 @@ class VirtualEnv(Env):
             """
         )
 
-        output = self.run_python_script(script)
-
-        return [Tag(*t) for t in json.loads(output)]
+        return script
 
     def get_marker_env(self) -> Dict[str, Any]:
-        output = self.run_python_script(GET_ENVIRONMENT_INFO)
-
-        return json.loads(output)
+        return json.loads(self._introspected("marker_env"))
 
     def get_pip_version(self) -> Version:
-        output = self.run_pip("--version").strip()
-        m = re.match("pip (.+?)(?: from .+)?$", output)
-        if not m:
+        # pip commands run the embedded pip wheel (see get_pip_command), whose version is part of its name
+        wheel = get_embed_wheel("pip", "{}.{}".format(*self.version_info[:2]))
+        if wheel is None:
             return Version.parse("0.0")
 
-        return Version.parse(m.group(1))
+        return Version.parse(wheel.version)
 
     def get_paths(self) -> Dict[str, str]:
-        output = self.run_python_script(GET_PATHS)
-        return json.loads(output)
+        return json.loads(self._introspected("paths"))
 
     def is_venv(self) -> bool:
         return True
@@ -1681,6 +1783,8 @@ class VirtualEnv(Env):
 
 
 class GenericEnv(VirtualEnv):
+    _paths_script = GET_PATHS_FOR_GENERIC_ENVS
+
     def __init__(
             self, path: Path, base: Optional[Path] = None, child_env: Optional["Env"] = None
     ) -> None:
@@ -1745,11 +1849,6 @@ class GenericEnv(VirtualEnv):
             if pip_executable:
                 self._pip_executable = pip_executable
 
-    def get_paths(self) -> Dict[str, str]:
-        output = self.run_python_script(GET_PATHS_FOR_GENERIC_ENVS)
-
-        return json.loads(output)
-
     def execute(self, bin: str, *args: str, **kwargs: Any) -> Optional[int]:
         command = self.get_command_from_bin(bin) + list(args)
         env = kwargs.pop("env", {k: v for k, v in os.environ.items()})
@@ -3,6 +3,7 @@ import re
 import shutil
 import stat
 import tempfile
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
@@ -130,3 +131,44 @@ def is_dir_writable(path: Path, create: bool = False) -> bool:
         return False
     else:
         return True
+
+
+LINK_MODES = ("copy", "hardlink", "reflink")
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    import fcntl
+
+    ficlone = 0x40049409  # FICLONE from linux/fs.h
+    with src.open("rb") as s, dst.open("wb") as d:
+        fcntl.ioctl(d.fileno(), ficlone, s.fileno())
+
+
+def link_file(src: Path, dst: Path, mode: str = "copy") -> str:
+    """
+    Materializes src at dst by copying, hard linking or reflinking (copy-on-write cloning) it, falling back
+    to a copy when the file system does not support the requested mode. dst is replaced atomically.
+    Returns the mode that was actually used.
+    """
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if mode == "hardlink":
+            try:
+                os.link(str(src), str(tmp))
+            except OSError:
+                mode = "copy"
+        elif mode == "reflink":
+            try:
+                _reflink(src, tmp)
+            except (OSError, ImportError):
+                mode = "copy"
+
+        if mode == "copy":
+            shutil.copy2(str(src), str(tmp))
+
+        os.replace(str(tmp), str(dst))
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+    return mode
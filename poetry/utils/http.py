@@ -1,20 +1,173 @@
 import threading
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict
+from typing import Optional
 
 import requests
-from cachecontrol import CacheControl
+from cachecontrol import CacheControlAdapter
+from cachecontrol.cache import DictCache
 from cachecontrol.caches import FileCache
 from poetry.locations import CACHE_DIR
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+# responses with these statuses are retried (with backoff) by the shared adapters
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 _global_sessions = threading.local()
 _persistent_cache = FileCache(str(Path(CACHE_DIR) / "http"))
 
+_lock = threading.Lock()
+_pool_manager: Optional[PoolManager] = None
+_adapters: Dict[str, HTTPAdapter] = {}
+
+
+class _Metrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {"connections_opened": 0, "requests": 0, "bytes_read": 0}
+
+    def add(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += count
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            counts = dict(self._counts)
+
+        counts["connections_reused"] = max(0, counts["requests"] - counts["connections_opened"])
+        return counts
+
+
+_metrics = _Metrics()
+
+
+class _CountingPoolMixin:
+    def _new_conn(self):
+        _metrics.add("connections_opened")
+        return super()._new_conn()
+
+    def urlopen(self, *args, **kwargs):
+        _metrics.add("requests")
+        response = super().urlopen(*args, **kwargs)
+
+        # urlopen calls itself on retries, only count the body of the final response once
+        if not getattr(response, "_counted", False):
+            response._counted = True
+            stream = response.stream
+
+            def counting_stream(*stream_args, **stream_kwargs):
+                for chunk in stream(*stream_args, **stream_kwargs):
+                    _metrics.add("bytes_read", len(chunk))
+                    yield chunk
+
+            response.stream = counting_stream
+
+        return response
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _SharedPoolMixin:
+    """
+    Makes an adapter use the process wide pool manager, so connections to a host are kept alive and reused
+    by all the sessions (and threads) of the process.
+    """
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _shared_pool_manager()
+
+    def close(self):
+        # the shared pools outlive any single adapter
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
+
+
+class _SharedPoolAdapter(_SharedPoolMixin, HTTPAdapter):
+    pass
+
+
+class _SharedPoolCacheControlAdapter(_SharedPoolMixin, CacheControlAdapter):
+    pass
+
+
+@lru_cache(maxsize=None)
+def _settings() -> Dict[str, int]:
+    from poetry.app.relaxed_poetry import rp
+
+    config = rp.config
+    return {
+        "retries": config.get("http.retries", 5),
+        "retry-backoff-ms": config.get("http.retry-backoff-ms", 500),
+        "max-connections-per-host": config.get("http.max-connections-per-host", 16),
+    }
+
+
+def _shared_pool_manager() -> PoolManager:
+    global _pool_manager
+
+    with _lock:
+        if _pool_manager is None:
+            manager = PoolManager(num_pools=32, maxsize=_settings()["max-connections-per-host"])
+            manager.pool_classes_by_scheme = {
+                "http": _CountingHTTPConnectionPool,
+                "https": _CountingHTTPSConnectionPool,
+            }
+            _pool_manager = manager
+
+        return _pool_manager
+
+
+def _adapter(kind: str) -> HTTPAdapter:
+    with _lock:
+        adapter = _adapters.get(kind)
+        if adapter is not None:
+            return adapter
+
+    settings = _settings()
+    retries = Retry(
+        total=settings["retries"],
+        backoff_factor=settings["retry-backoff-ms"] / 1000,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+
+    if kind == "plain":
+        adapter = _SharedPoolAdapter(max_retries=retries)
+    else:
+        cache = _persistent_cache if kind == "persistent" else DictCache()
+        adapter = _SharedPoolCacheControlAdapter(cache=cache, max_retries=retries)
+
+    with _lock:
+        return _adapters.setdefault(kind, adapter)
+
+
+def _new_session(kind: str) -> requests.Session:
+    result = requests.Session()
+    adapter = _adapter(kind)
+    result.mount("http://", adapter)
+    result.mount("https://", adapter)
+    return result
+
 
 def session() -> requests.Session:
     try:
         return _global_sessions.session
     except AttributeError:
-        result = requests.Session()
+        result = _new_session("plain")
         _global_sessions.session = result
         return result
 
@@ -24,10 +177,18 @@ def cached_session(persistent: bool = False) -> requests.Session:
     try:
         return getattr(_global_sessions, attr)
     except AttributeError:
-        result = CacheControl(requests.Session(), _persistent_cache) if persistent else CacheControl(requests.Session())
+        result = _new_session("persistent" if persistent else "memory")
         setattr(_global_sessions, attr, result)
         return result
 
 
+def metrics() -> Dict[str, int]:
+    """
+    Returns the connections opened and reused, the requests sent and the response body bytes read
+    by the sessions of this process.
+    """
+    return _metrics.snapshot()
+
+
 def remove_persistent_cache(url: str):
     _persistent_cache.delete(url)
@@ -16,6 +16,7 @@ def pip_install(
     editable: bool = False,
     deps: bool = False,
     upgrade: bool = False,
+    compile: bool = True,
 ) -> Union[int, str]:
     path = Path(path) if isinstance(path, str) else path
     is_wheel = path.suffix == ".whl"
@@ -34,6 +35,9 @@ def pip_install(
     if not deps:
         args.append("--no-deps")
 
+    if not compile:
+        args.append("--no-compile")
+
     if editable:
         if not path.is_dir():
             raise PoetryException(
@@ -0,0 +1,83 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from subprocess import CalledProcessError
+
+import pytest
+
+from poetry.app.relaxed_poetry import rp
+from poetry.inspection.build_envs import DEFAULT_BUILD_REQUIRES
+from poetry.inspection.build_envs import MetadataBuildEnvs
+from poetry.inspection.info import PackageInfo
+from poetry.inspection.info import PackageInfoError
+from poetry.utils.env import EnvCommandError
+from poetry.utils.env import EnvManager
+from poetry.utils.env import VirtualEnv
+
+
+def fake_provisioning(mocker):
+    lock = threading.Lock()
+    provisioned = []
+
+    def build_venv(path, **kwargs):
+        Path(path).mkdir(parents=True)
+        with lock:
+            provisioned.append(path)
+
+    mocker.patch.object(EnvManager, "build_venv", side_effect=build_venv)
+    mocker.patch.object(VirtualEnv, "run_pip")
+    return provisioned
+
+
+def test_environments_are_provisioned_once_per_build_requirements(tmp_path, mocker):
+    provisioned = fake_provisioning(mocker)
+    envs = MetadataBuildEnvs(tmp_path)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        paths = set(executor.map(lambda _: envs.get(["flit_core>=3.2"]).path, range(8)))
+
+    assert len(paths) == 1
+    assert len(provisioned) == 1
+
+    assert MetadataBuildEnvs(tmp_path).get(["flit_core>=3.2", "flit_core>=3.2"]).path in paths
+    assert MetadataBuildEnvs(tmp_path).get(["poetry-core"]).path not in paths
+    assert len(provisioned) == 2
+
+
+def test_incomplete_environments_are_provisioned_again_in_place(tmp_path, mocker):
+    provisioned = fake_provisioning(mocker)
+    envs = MetadataBuildEnvs(tmp_path)
+
+    path = tmp_path / envs._key(["flit_core"])
+    (path / "lib").mkdir(parents=True)
+    (path / "lib" / "partial.py").write_text("")
+
+    assert envs.get(["flit_core"]).path == path
+    assert provisioned == [path.as_posix()]
+    assert not (path / "lib" / "partial.py").exists()
+    assert (path / ".ready").exists()
+
+
+def test_build_requirements_of_sources(tmp_path):
+    assert MetadataBuildEnvs.build_requires(tmp_path) == DEFAULT_BUILD_REQUIRES
+
+    (tmp_path / "pyproject.toml").write_text(
+        '[build-system]\nrequires = ["flit_core>=3.2,<4"]\nbuild-backend = "flit_core.buildapi"\n'
+    )
+    assert MetadataBuildEnvs.build_requires(tmp_path) == ["flit_core>=3.2,<4"]
+
+
+def test_failing_to_provision_the_fallback_environment_is_a_package_info_error(tmp_path, mocker):
+    (tmp_path / "setup.py").write_text("from setuptools import setup\n\nsetup()\n")
+
+    def fail(*args, **kwargs):
+        raise EnvCommandError(CalledProcessError(1, ["pip", "install"], b"no matching distribution"))
+
+    build_envs = MetadataBuildEnvs(tmp_path / "build-envs")
+    mocker.patch.object(build_envs, "prepare_metadata", side_effect=fail)
+    mocker.patch.object(build_envs, "get", side_effect=fail)
+    mocker.patch.object(rp, "_metadata_build_envs", build_envs)
+
+    with pytest.raises(PackageInfoError):
+        PackageInfo._pep517_metadata(tmp_path)
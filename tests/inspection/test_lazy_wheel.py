@@ -0,0 +1,100 @@
+import io
+import zipfile
+
+from typing import List
+from typing import Optional
+
+import pytest
+
+from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupported
+from poetry.inspection.lazy_wheel import LazyZipOverHTTP
+from poetry.inspection.lazy_wheel import wheel_metadata
+
+
+class Response:
+    def __init__(self, status_code: int, content: bytes = b"", headers: Optional[dict] = None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class RangeServer:
+    """
+    Serves a single file and records the ranges that were requested.
+    """
+
+    def __init__(self, content: bytes, accept_ranges: bool = True) -> None:
+        self.content = content
+        self.accept_ranges = accept_ranges
+        self.ranges: List[str] = []
+
+    def request(self, method: str, url: str, headers: Optional[dict] = None, **kwargs) -> Response:
+        if method == "head":
+            headers = {"Content-Length": str(len(self.content))}
+            if self.accept_ranges:
+                headers["Accept-Ranges"] = "bytes"
+            return Response(200, headers=headers)
+
+        range_ = headers["Range"]
+        self.ranges.append(range_)
+        start, end = (int(it) for it in range_[len("bytes="):].split("-"))
+        return Response(206, self.content[start:end + 1])
+
+
+def make_wheel(size: int = 300 * 1024) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as wheel:
+        wheel.writestr("demo/__init__.py", b"x" * size)
+        wheel.writestr("demo-1.0.dist-info/METADATA", b"Metadata-Version: 2.1\nName: demo\nVersion: 1.0\n")
+        wheel.writestr("demo-1.0.dist-info/RECORD", b"")
+
+    return buffer.getvalue()
+
+
+def test_reads_match_the_remote_content():
+    content = bytes(range(256)) * 1024
+    server = RangeServer(content)
+    f = LazyZipOverHTTP("https://example.com/demo.whl", server, chunk_size=1000)
+
+    f.seek(12345)
+    assert f.read(5000) == content[12345:17345]
+    f.seek(-10, io.SEEK_END)
+    assert f.read() == content[-10:]
+    f.seek(0)
+    assert f.read(3) == content[:3]
+
+
+def test_chunks_are_downloaded_once_and_missing_chunks_are_merged():
+    content = b"a" * 10000
+    server = RangeServer(content)
+    f = LazyZipOverHTTP("https://example.com/demo.whl", server, chunk_size=1000)
+
+    # the tail of the file is prefetched
+    assert server.ranges == ["bytes=9000-9999"]
+
+    f.seek(0)
+    f.read(3500)
+    assert server.ranges[1:] == ["bytes=0-3999"]
+
+    f.seek(500)
+    f.read(1000)
+    assert len(server.ranges) == 2
+
+
+def test_servers_without_range_support_are_rejected():
+    with pytest.raises(HTTPRangeRequestUnsupported):
+        LazyZipOverHTTP("https://example.com/demo.whl", RangeServer(b"abc", accept_ranges=False))
+
+
+def test_wheel_metadata_only_downloads_the_needed_parts():
+    content = make_wheel()
+    server = RangeServer(content)
+
+    metadata = wheel_metadata("https://example.com/demo-1.0-py3-none-any.whl", server)
+
+    assert b"Name: demo" in metadata
+    downloaded = 0
+    for range_ in server.ranges:
+        start, end = (int(it) for it in range_[len("bytes="):].split("-"))
+        downloaded += end - start + 1
+    assert downloaded < len(content) / 2
@@ -0,0 +1,45 @@
+import importlib.util
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from poetry.installation.bytecode_compiler import BytecodeCompiler
+from poetry.utils.env import SystemEnv
+
+
+def distribution(root, name, modules):
+    package = root / name
+    package.mkdir()
+    sources = []
+    for module in range(modules):
+        source = package / f"module_{module}.py"
+        source.write_text(f"VALUE = {module}\n")
+        sources.append(source)
+
+    record = root / f"{name}-1.0.dist-info" / "RECORD"
+    record.parent.mkdir()
+    record.write_text("".join(f"{name}/{source.name},,\n" for source in sources))
+
+    return record, sources
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("invalidation_mode", [None, "checked-hash"])
+def test_sources_are_compiled_and_recorded(tmp_path, workers, invalidation_mode):
+    records = dict([distribution(tmp_path, "foo", 70), distribution(tmp_path, "bar", 2)])
+
+    timings = BytecodeCompiler(SystemEnv(Path(sys.prefix)), workers, invalidation_mode).compile(records)
+
+    assert set(timings) == set(records)
+    for record, sources in records.items():
+        recorded = record.read_text().splitlines()
+        for source in sources:
+            pyc = Path(importlib.util.cache_from_source(str(source)))
+            assert pyc.exists()
+            assert f"{pyc.relative_to(tmp_path).as_posix()},," in recorded
+
+    pyc = Path(importlib.util.cache_from_source(str(records[next(iter(records))][0])))
+    flags = int.from_bytes(pyc.read_bytes()[4:8], "little")
+    assert flags == (0 if invalidation_mode is None else 0b11)
@@ -0,0 +1,77 @@
+from packaging.tags import Tag
+
+from poetry.core.packages.package import Package
+from poetry.core.packages.utils.link import Link
+
+from poetry.installation.chooser import Chooser
+from poetry.installation.chooser import Wheel
+from poetry.installation.chooser import parse_wheel
+from poetry.repositories import Pool
+from poetry.utils.env import MockEnv
+
+
+SUPPORTED_TAGS = [
+    Tag("cp39", "cp39", "manylinux2014_x86_64"),
+    Tag("cp39", "abi3", "manylinux2014_x86_64"),
+    Tag("cp39", "cp39", "linux_x86_64"),
+    Tag("cp39", "cp39", "manylinux2014_x86_64"),
+    Tag("py3", "none", "manylinux2014_x86_64"),
+    Tag("py3", "none", "any"),
+]
+
+
+def test_tag_priorities_keep_the_first_index_of_each_tag():
+    env = MockEnv(supported_tags=SUPPORTED_TAGS)
+
+    assert env.supported_tags_priority[Tag("cp39", "cp39", "manylinux2014_x86_64")] == 0
+    assert env.supported_tags_priority[Tag("py3", "none", "any")] == 5
+    assert len(env.supported_tags_priority) == 5
+
+
+def test_minimum_supported_index_is_the_same_for_lists_and_priorities():
+    env = MockEnv(supported_tags=SUPPORTED_TAGS)
+
+    for filename in [
+        "demo-1.0-cp39-cp39-manylinux2014_x86_64.whl",
+        "demo-1.0-cp39-abi3-manylinux2014_x86_64.whl",
+        "demo-1.0-py2.py3-none-any.whl",
+        "demo-1.0-cp38-cp38-win_amd64.whl",
+    ]:
+        wheel = Wheel(filename)
+        assert wheel.get_minimum_supported_index(SUPPORTED_TAGS) == wheel.get_minimum_supported_index(
+            env.supported_tags_priority
+        )
+        assert wheel.is_supported_by_environment(env) == (wheel.get_minimum_supported_index(SUPPORTED_TAGS) is not None)
+
+
+def test_wheel_filenames_are_parsed_once():
+    assert parse_wheel("demo-1.0-py3-none-any.whl") is parse_wheel("demo-1.0-py3-none-any.whl")
+
+
+def test_links_are_sorted_by_hash_then_tag_priority():
+    chooser = Chooser(Pool(), MockEnv(supported_tags=SUPPORTED_TAGS))
+    package = Package("demo", "1.0")
+    package.files = [
+        {"file": "demo-1.0-py3-none-any.whl", "hash": "sha256:aaaa"},
+        {"file": "demo-1.0-cp39-abi3-manylinux2014_x86_64.whl", "hash": "sha256:bbbb"},
+        {"file": "demo-1.0.tar.gz", "hash": "sha256:cccc"},
+    ]
+    links = [
+        Link("https://example.com/demo-1.0.tar.gz#sha256=cccc"),
+        Link("https://example.com/demo-1.0-py3-none-any.whl#sha256=aaaa"),
+        Link("https://example.com/demo-1.0-cp39-abi3-manylinux2014_x86_64.whl#sha256=bbbb"),
+        Link("https://example.com/demo-1.0-cp39-cp39-manylinux2014_x86_64.whl#sha256=dddd"),
+    ]
+
+    ranked = sorted(links, key=lambda link: chooser._sort_key(package, link), reverse=True)
+
+    assert [link.filename for link in ranked] == [
+        "demo-1.0-cp39-abi3-manylinux2014_x86_64.whl",
+        "demo-1.0-py3-none-any.whl",
+        "demo-1.0.tar.gz",
+        "demo-1.0-cp39-cp39-manylinux2014_x86_64.whl",
+    ]
+    allowed_hashes = {f["hash"] for f in package.files}
+    assert [chooser._sort_key(package, link, allowed_hashes) for link in links] == [
+        chooser._sort_key(package, link) for link in links
+    ]
@@ -0,0 +1,112 @@
+import threading
+import time
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.config.config import Config
+from poetry.console import console
+from poetry.installation.executor import Executor
+from poetry.installation.operations import Install
+from poetry.installation.operations import Uninstall
+from poetry.installation.operations import Update
+from poetry.repositories import Pool
+from poetry.utils.env import MockEnv
+
+
+def package(name, *requires):
+    result = Package(name, "1.0")
+    for requirement in requires:
+        result.add_dependency(Dependency(requirement, "*"))
+
+    return result
+
+
+OPERATIONS = [
+    Uninstall(package("old")),
+    Install(package("a")),
+    Install(package("b", "a")),
+    Update(package("c"), package("c", "b", "e")),
+    Install(package("d")),
+    Install(package("e", "d")),
+]
+
+
+def test_operations_wait_for_their_dependencies_and_uninstalls():
+    assert Executor._prerequisites(OPERATIONS) == [
+        set(),
+        {0},
+        {0, 1},
+        # e comes later in the transaction, the edge is dropped so cycles cannot deadlock
+        {0, 2},
+        {0},
+        {0, 4},
+    ]
+
+
+def test_operations_of_the_same_distribution_run_in_order():
+    operations = [Uninstall(package("a")), Install(package("a")), Install(package("b"))]
+
+    assert Executor._prerequisites(operations) == [set(), {0}, {0}]
+
+
+def test_operations_start_once_their_prerequisites_are_done(mocker):
+    project = SimpleNamespace(env=MockEnv(), pool=Pool(), config=Config())
+    executor = Executor(project, parallel=True).dry_run()
+    mocker.patch.object(executor, "_display_summary")
+
+    lock = threading.Lock()
+    events = []
+
+    def execute(operation):
+        with lock:
+            events.append(("start", operation.package.name))
+
+        time.sleep(0.01)
+
+        with lock:
+            events.append(("end", operation.package.name))
+
+    mocker.patch.object(executor, "_execute_operation", side_effect=execute)
+
+    assert executor.execute(OPERATIONS) == 0
+
+    for index, required in enumerate(Executor._prerequisites(OPERATIONS)):
+        started = events.index(("start", OPERATIONS[index].package.name))
+        for prerequisite in required:
+            assert events.index(("end", OPERATIONS[prerequisite].package.name)) < started
+
+    assert len(events) == 2 * len(OPERATIONS)
+
+
+def test_download_threads_are_released_after_a_successful_execution(mocker):
+    project = SimpleNamespace(env=MockEnv(), pool=Pool(), config=Config())
+    executor = Executor(project, parallel=True).dry_run()
+    mocker.patch.object(executor, "_display_summary")
+    mocker.patch.object(executor, "_execute_operation")
+
+    assert executor.execute(OPERATIONS) == 0
+
+    with pytest.raises(RuntimeError):
+        executor._download_executor.submit(print)
+
+
+def test_uncompiled_sources_are_not_collected_behind_the_console_output():
+    project = SimpleNamespace(env=MockEnv(), pool=Pool(), config=Config())
+    executor = Executor(project, parallel=True)
+    record, sources = Path("demo-1.0.dist-info/RECORD"), [Path("demo/__init__.py")]
+    executor._wheel_installer = SimpleNamespace(install=lambda archive: (record, sources))
+
+    with console.out_lock:
+        installing = threading.Thread(target=executor._install_wheel, args=(Path("demo-1.0-py3-none-any.whl"),))
+        installing.start()
+        installing.join(timeout=5)
+
+        assert not installing.is_alive()
+
+    assert executor._uncompiled == {record: sources}
@@ -0,0 +1,43 @@
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+from poetry.core.packages.project_package import ProjectPackage
+from poetry.core.packages.vcs_dependency import VCSDependency
+
+from poetry.installation.installer import Installer
+from poetry.repositories import Repository
+
+
+def changed_requirements(requirements, locked_packages):
+    package = ProjectPackage("root", "1.0")
+    for requirement in requirements:
+        package.add_dependency(requirement)
+
+    installer = Installer.__new__(Installer)
+    installer._package = package
+
+    return installer._changed_requirements(Repository(locked_packages))
+
+
+def test_satisfied_requirements_are_not_changed():
+    locked = [
+        Package("foo", "1.2.0"),
+        Package("bar", "2.0.0", source_type="legacy", source_url="https://foo.bar/simple", source_reference="foo"),
+    ]
+
+    assert changed_requirements([Dependency("foo", "^1.0"), Dependency("bar", "*")], locked) == []
+
+
+def test_requirements_not_satisfied_by_the_lock_are_changed():
+    locked = [Package("foo", "1.2.0"), Package("bar", "2.0.0")]
+    requirements = [Dependency("foo", "^2.0"), Dependency("bar", "^2.0"), Dependency("baz", "*")]
+
+    assert changed_requirements(requirements, locked) == ["foo", "baz"]
+
+
+def test_requirements_moved_to_another_source_are_changed():
+    locked = [Package("foo", "1.2.0")]
+    requirement = VCSDependency("foo", "git", "https://github.com/demo/foo.git")
+
+    assert changed_requirements([requirement], locked) == ["foo"]
+    assert not Installer._is_same_source(requirement, locked[0])
+    assert Installer._is_same_source(Dependency("foo", "*"), locked[0])
@@ -0,0 +1,151 @@
+import csv
+import os
+import zipfile
+
+from types import SimpleNamespace
+
+import pytest
+
+from poetry.core.packages.package import Package
+
+from poetry.app.relaxed_poetry import rp
+from poetry.installation.executor import Executor
+from poetry.installation.operations import Update
+from poetry.installation.wheel_installer import WheelInstaller
+from poetry.repositories.artifacts import Artifacts
+from poetry.utils.env import MockEnv
+
+
+def build_wheel(directory, version="1.0", files=None):
+    dist_info = f"demo-{version}.dist-info"
+    contents = {
+        "demo/__init__.py": f"__version__ = '{version}'\n",
+        f"{dist_info}/METADATA": f"Metadata-Version: 2.1\nName: demo\nVersion: {version}\n",
+        f"{dist_info}/WHEEL": "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        f"{dist_info}/entry_points.txt": "[console_scripts]\ndemo-cli = demo.cli:main\n",
+        f"demo-{version}.data/scripts/run-demo": "#!python\nimport demo\n",
+        f"demo-{version}.data/scripts/plain.sh": "echo demo\n",
+        **(files or {}),
+    }
+    contents[f"{dist_info}/RECORD"] = "".join(f"{name},,\n" for name in contents)
+
+    wheel = directory / f"demo-{version}-py3-none-any.whl"
+    with zipfile.ZipFile(str(wheel), "w") as zf:
+        for name, content in contents.items():
+            zf.writestr(name, content)
+
+    return wheel
+
+
+@pytest.fixture()
+def env(tmp_path, mocker):
+    mocker.patch.object(rp, "artifacts", Artifacts(tmp_path / "artifacts"))
+
+    root = tmp_path / "venv"
+    env = MockEnv(path=root)
+    env._paths = {
+        "purelib": str(root / "lib"),
+        "platlib": str(root / "lib"),
+        "scripts": str(root / "bin"),
+        "data": str(root),
+    }
+    env._executable = str(root / "bin" / "python")
+    (root / "lib").mkdir(parents=True)
+
+    return env
+
+
+def test_wheels_are_laid_out_in_the_environment(tmp_path, env):
+    record, sources = WheelInstaller(env).install(build_wheel(tmp_path))
+
+    lib = env.purelib
+    scripts = env.path / "bin"
+    assert (lib / "demo" / "__init__.py").read_text() == "__version__ = '1.0'\n"
+    assert (lib / "demo-1.0.dist-info" / "INSTALLER").read_text() == "poetry\n"
+    assert sources == [lib / "demo" / "__init__.py"]
+
+    assert (scripts / "run-demo").read_text().startswith(f"#!{env.python}\n")
+    assert "from demo.cli import main" in (scripts / "demo-cli").read_text()
+    for script in ("run-demo", "plain.sh", "demo-cli"):
+        assert os.access(str(scripts / script), os.X_OK)
+
+    with record.open() as f:
+        recorded = {row[0] for row in csv.reader(f)}
+
+    assert "demo/__init__.py" in recorded
+    assert "../bin/demo-cli" in recorded
+    assert "demo-1.0.dist-info/RECORD" in recorded
+
+
+def test_scripts_in_the_artifacts_store_keep_their_mode(tmp_path, env):
+    wheel = build_wheel(tmp_path)
+    WheelInstaller(env, link_mode="hardlink").install(wheel)
+
+    stored = rp.artifacts.unpacked(wheel) / "demo-1.0.data" / "scripts" / "plain.sh"
+    assert not os.access(str(stored), os.X_OK)
+
+
+def test_installing_replaces_the_installed_distribution(tmp_path, env):
+    installer = WheelInstaller(env)
+    installer.install(build_wheel(tmp_path, "1.0", {"demo/legacy.py": ""}))
+    installer.install(build_wheel(tmp_path, "2.0"))
+
+    assert not (env.purelib / "demo" / "legacy.py").exists()
+    assert not (env.purelib / "demo-1.0.dist-info").exists()
+    assert (env.purelib / "demo" / "__init__.py").read_text() == "__version__ = '2.0'\n"
+
+
+def test_only_dist_info_distributions_with_a_record_are_uninstalled(tmp_path, env):
+    installer = WheelInstaller(env)
+    assert not installer.can_uninstall("demo")
+    assert not installer.uninstall("demo")
+
+    installer.install(build_wheel(tmp_path))
+    assert installer.can_uninstall("demo")
+    assert installer.uninstall("demo")
+    assert not (env.purelib / "demo" / "__init__.py").exists()
+    assert not (env.path / "bin" / "demo-cli").exists()
+
+    egg_info = env.purelib / "legacy-1.0.egg-info"
+    egg_info.mkdir()
+    (egg_info / "PKG-INFO").write_text("Metadata-Version: 1.0\nName: legacy\nVersion: 1.0\n")
+    assert not installer.can_uninstall("legacy")
+
+
+def test_distributions_without_a_record_are_not_replaced(tmp_path, env):
+    installer = WheelInstaller(env)
+    assert installer.can_install("demo")
+
+    egg_info = env.purelib / "demo-0.9.egg-info"
+    egg_info.mkdir()
+    (egg_info / "PKG-INFO").write_text("Metadata-Version: 1.0\nName: demo\nVersion: 0.9\n")
+    assert not installer.can_install("demo")
+
+    wheel = build_wheel(tmp_path)
+    pip_installs = []
+    executor = SimpleNamespace(
+        _wheel_installer=installer,
+        _prepared={},
+        _prepare_archive=lambda operation: wheel,
+        _write=lambda operation, line: None,
+        _compile_stage=False,
+        _install_wheel=lambda archive: pytest.fail("the egg-info distribution cannot be replaced natively"),
+        pip_install=lambda req, upgrade=False: pip_installs.append((req, upgrade)) or 0,
+    )
+
+    assert Executor._install(executor, Update(Package("demo", "0.9"), Package("demo", "1.0"))) == 0
+    assert pip_installs == [(str(wheel), True)]
+    assert egg_info.exists()
+
+
+def test_invalid_wheels_leave_the_installed_distribution_in_place(tmp_path, env):
+    installer = WheelInstaller(env)
+    installer.install(build_wheel(tmp_path, "1.0"))
+
+    broken = tmp_path / "broken"
+    broken.mkdir()
+    with pytest.raises(RuntimeError, match="Unsupported wheel data scheme"):
+        installer.install(build_wheel(broken, "2.0", {"demo-2.0.data/unknown/file.txt": ""}))
+
+    assert (env.purelib / "demo" / "__init__.py").read_text() == "__version__ = '1.0'\n"
+    assert installer.can_uninstall("demo")
@@ -0,0 +1,187 @@
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+from poetry.core.packages.project_package import ProjectPackage
+
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import RootCause
+from poetry.mixology.partial_solution import PartialSolution
+from poetry.mixology.set_relation import SetRelation
+from poetry.mixology.term import Term
+
+
+def derive(solution, name, constraint, is_positive=True):
+    dependency = Dependency(name, constraint)
+    solution.derive(dependency, is_positive, Incompatibility([Term(dependency, not is_positive)], RootCause()))
+
+
+def test_assignments_only_change_the_stamp_of_their_package():
+    solution = PartialSolution()
+    solution.decide(ProjectPackage("root", "1.0"))
+
+    assert solution.stamp("foo") == 0
+
+    derive(solution, "foo", "^1.0")
+    foo, bar = solution.stamp("foo"), solution.stamp("bar")
+    assert foo != 0
+
+    derive(solution, "bar", "<2.0", is_positive=False)
+    assert solution.stamp("foo") == foo
+    assert solution.stamp("bar") != bar
+
+
+def test_relations_do_not_change_while_the_stamp_does_not():
+    solution = PartialSolution()
+    solution.decide(ProjectPackage("root", "1.0"))
+    derive(solution, "foo", ">=1.0")
+
+    term = Term(Dependency("foo", "<2.0"), True)
+    stamp = solution.stamp("foo")
+    assert solution.relation(term) == SetRelation.OVERLAPPING
+
+    derive(solution, "bar", "*")
+    assert solution.stamp("foo") == stamp
+    assert solution.relation(term) == SetRelation.OVERLAPPING
+
+    derive(solution, "foo", "<1.5")
+    assert solution.stamp("foo") != stamp
+    assert solution.relation(term) == SetRelation.SUBSET
+
+
+def test_backtracking_changes_the_stamp_of_removed_packages():
+    solution = PartialSolution()
+    solution.decide(ProjectPackage("root", "1.0"))
+    derive(solution, "foo", "^1.0")
+    solution.decide(Package("foo", "1.2.0"))
+    derive(solution, "bar", "^2.0")
+
+    foo, bar, root = solution.stamp("foo"), solution.stamp("bar"), solution.stamp("root")
+    solution.backtrack(1)
+
+    assert solution.stamp("foo") != foo
+    assert solution.stamp("bar") != bar
+    assert solution.stamp("root") == root
+    assert solution.relation(Term(Dependency("bar", "^2.0"), True)) == SetRelation.OVERLAPPING
+
+
+# decisions and derivations over 4 decision levels, bar becomes positive only at the third level
+STEPS = [
+    ("decide", ProjectPackage("root", "1.0")),
+    ("derive", "foo", "^1.0", True),
+    ("derive", "bar", "<2.0", False),
+    ("decide", Package("foo", "1.2.0")),
+    ("derive", "baz", ">=1.0", True),
+    ("derive", "bar", ">=3.0", False),
+    ("decide", Package("baz", "1.5.0")),
+    ("derive", "qux", "*", True),
+    ("derive", "bar", ">=2.0", True),
+    ("derive", "foo", ">=1.1", True),
+    ("decide", Package("qux", "0.1.0")),
+]
+
+
+def replay(steps):
+    solution = PartialSolution()
+    for step in steps:
+        if step[0] == "decide":
+            solution.decide(step[1])
+        else:
+            derive(solution, *step[1:])
+
+    return solution
+
+
+def state(solution):
+    return (
+        [(name, str(term)) for name, term in solution._positive.items()],
+        sorted((name, str(term)) for name, by_ref in solution._negative.items() for term in by_ref.values()),
+        [package.complete_name for package in solution.decisions],
+        [(str(assignment), assignment.decision_level) for assignment in solution._assignments],
+    )
+
+
+def baseline_backtrack(solution, decision_level):
+    # the backtracking which re-registers every remaining assignment of the removed packages
+    packages = set()
+    while solution._assignments[-1].decision_level > decision_level:
+        removed = solution._assignments.pop(-1)
+        packages.add(removed.dependency.complete_name)
+        if removed.is_decision():
+            del solution._decisions[removed.dependency.complete_name]
+
+    for package in packages:
+        solution._positive.pop(package, None)
+        solution._negative.pop(package, None)
+
+    for assignment in solution._assignments:
+        if assignment.dependency.complete_name in packages:
+            solution._register(assignment)
+
+
+def baseline_satisfier(solution, term):
+    # the satisfier lookup scanning every assignment of the solution
+    assigned_term = None
+    for assignment in solution._assignments:
+        if assignment.dependency.complete_name != term.dependency.complete_name:
+            continue
+
+        assigned_term = assignment if assigned_term is None else assigned_term.intersect(assignment)
+        if assigned_term.satisfies(term):
+            return assignment
+
+
+def test_backtracking_restores_the_state_of_a_full_recomputation():
+    for level in (3, 2, 1):
+        solution = replay(STEPS)
+        solution.backtrack(level)
+
+        expected = replay(STEPS)
+        baseline_backtrack(expected, level)
+
+        assert state(solution) == state(expected)
+
+
+def test_backtracking_keeps_the_terms_of_the_remaining_assignments():
+    decisions = [index for index, step in enumerate(STEPS) if step[0] == "decide"]
+
+    for level in (3, 2, 1):
+        solution = replay(STEPS)
+        solution.backtrack(level)
+        expected = replay(STEPS[:decisions[level]])
+
+        # only the order of _positive may differ from a solution that never made the removed assignments
+        assert sorted(state(solution)[0]) == sorted(state(expected)[0])
+        assert state(solution)[1:] == state(expected)[1:]
+
+
+def test_backtracking_then_deciding_again():
+    solution = replay(STEPS)
+    solution.backtrack(1)
+    derive(solution, "bar", ">=2.5", True)
+    solution.decide(Package("foo", "1.3.0"))
+
+    expected = replay(STEPS)
+    baseline_backtrack(expected, 1)
+    derive(expected, "bar", ">=2.5", True)
+    expected.decide(Package("foo", "1.3.0"))
+
+    assert state(solution) == state(expected)
+    assert solution.attempted_solutions == 2
+
+
+def test_satisfier_matches_a_scan_of_all_assignments():
+    terms = [
+        Term(Dependency("foo", "^1.0"), True),
+        Term(Dependency("foo", ">=1.1"), True),
+        Term(Dependency("bar", "<2.0"), False),
+        Term(Dependency("bar", ">=2.0,<3.0"), True),
+        Term(Dependency("qux", "*"), True),
+    ]
+
+    solution = replay(STEPS)
+    for level in (4, 3, 2, 1):
+        solution.backtrack(level)
+        for term in terms:
+            if solution.satisfies(term):
+                assert solution.satisfier(term) is baseline_satisfier(solution, term)
+            else:
+                assert baseline_satisfier(solution, term) is None
@@ -0,0 +1,107 @@
+import threading
+import time
+
+from types import SimpleNamespace
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.mixology.version_prefetcher import VersionPrefetcher
+from poetry.packages import DependencyPackage
+
+
+class Provider:
+    def __init__(self, releases):
+        # name -> [(version, requirements)], newest first
+        self._releases = releases
+        self._lock = threading.Lock()
+        self.searched = []
+        self.completed = []
+
+    def search_for(self, dependency):
+        with self._lock:
+            self.searched.append(dependency.name)
+
+        return [
+            DependencyPackage(dependency, Package(dependency.name, version))
+            for version, _ in self._releases[dependency.name]
+        ]
+
+    def complete_package(self, package):
+        with self._lock:
+            self.completed.append(f"{package.name} {package.version}")
+
+        completed = package.package.clone()
+        for version, requirements in self._releases[package.name]:
+            if version == package.version.text:
+                for requirement in requirements:
+                    completed.add_dependency(Dependency(*requirement))
+
+        return DependencyPackage(package.dependency, completed)
+
+
+def prefetcher(provider, unsatisfied, pinned=(), **kwargs):
+    solver = SimpleNamespace(
+        solution=SimpleNamespace(unsatisfied=unsatisfied),
+        _pinned=set(pinned),
+        _provider=provider,
+        _dependency_priority=lambda dependency: (False, 0),
+        _get_locked=lambda dependency: None,
+    )
+
+    return VersionPrefetcher(solver, **kwargs)
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+RELEASES = {
+    "foo": [("3.0", [("bar", "^1.0")]), ("2.0", []), ("1.0", [])],
+    "bar": [("1.0", [])],
+}
+
+
+def test_first_candidates_are_completed_ahead_of_the_solver():
+    dependency = Dependency("foo", "*")
+    provider = Provider(RELEASES)
+    versions = prefetcher(provider, [dependency], candidates=2, depth=0)
+    try:
+        versions.prefetch()
+        wait_for(lambda: len(provider.completed) == 2)
+
+        latest = versions.completed(DependencyPackage(dependency, Package("foo", "3.0")))
+        previous = versions.completed(DependencyPackage(dependency, Package("foo", "2.0")))
+
+        assert [requirement.name for requirement in latest.requires] == ["bar"]
+        assert previous.requires == []
+        assert versions.completed(DependencyPackage(dependency, Package("foo", "1.0"))) is None
+        assert provider.searched == ["foo"]
+    finally:
+        versions.shutdown()
+
+
+def test_dependencies_of_the_expected_choice_are_searched():
+    dependency = Dependency("foo", "*")
+    provider = Provider(RELEASES)
+    versions = prefetcher(provider, [dependency], candidates=2, depth=1)
+    try:
+        versions.prefetch()
+
+        wait_for(lambda: "bar 1.0" in provider.completed)
+        assert sorted(provider.searched) == ["bar", "foo"]
+        assert versions.completed(DependencyPackage(Dependency("bar", "^1.0"), Package("bar", "1.0"))) is not None
+    finally:
+        versions.shutdown()
+
+
+def test_pinned_packages_are_not_searched():
+    provider = Provider(RELEASES)
+    versions = prefetcher(provider, [Dependency("foo", "*")], pinned=["foo"])
+    versions.prefetch()
+    versions._executor.shutdown(wait=True)
+
+    assert provider.searched == []
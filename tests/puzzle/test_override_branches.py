@@ -0,0 +1,109 @@
+import threading
+import time
+
+from types import SimpleNamespace
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.puzzle.provider import Provider
+from poetry.puzzle.solver import Solver
+
+
+def fake_provider(overrides=None, workers=4):
+    provider = Provider.__new__(Provider)
+    provider._overrides = overrides or {}
+    provider._project = SimpleNamespace(config={"solver.override-workers": workers})
+    provider.debug = lambda message: None
+
+    return provider
+
+
+class FakeSolver:
+    def __init__(self, provider, branches):
+        self._provider = provider
+        self._overrides = []
+        self._parallel_overrides = True
+        self._branches = branches
+
+    def _solve(self, use_latest=None, pinned=()):
+        # records its overrides like Solver._solve, nested overrides are reported by the branch
+        self._overrides.append(self._provider._overrides)
+        return self._branches[self._provider._overrides["name"]]
+
+
+def package(name, version, *requires):
+    package = Package(name, version)
+    for dependency in requires:
+        package.add_dependency(Dependency(dependency, "*"))
+
+    return package
+
+
+def test_providers_with_overrides_share_the_state_of_the_original():
+    provider = fake_provider({"name": "original"})
+    provider._search_for = {}
+
+    branch = provider.with_overrides({"name": "branch"})
+
+    assert branch is not provider
+    assert branch._overrides == {"name": "branch"}
+    assert provider._overrides == {"name": "original"}
+    assert branch._search_for is provider._search_for
+
+
+def test_branches_are_solved_with_a_copy_of_the_solver():
+    solver = FakeSolver(fake_provider(), {"a": ([package("a", "1.0")], [0])})
+
+    packages, depths, overrides = Solver._solve_branch(solver, {"name": "a"})
+
+    assert [p.name for p in packages] == ["a"]
+    assert depths == [0]
+    assert overrides == [{"name": "a"}]
+    assert solver._overrides == []
+    assert solver._provider._overrides == {}
+
+
+def test_branches_are_solved_concurrently_and_merged_in_the_order_of_the_overrides():
+    barrier = threading.Barrier(2, timeout=5)
+    threads = set()
+
+    def solve_branch(override, use_latest=None, pinned=()):
+        threads.add(threading.get_ident())
+        # both branches have to be in flight at the same time, the first one finishes last
+        barrier.wait()
+        if override["name"] == "first":
+            time.sleep(0.05)
+            return [package("a", "1.0", "b"), package("b", "1.0")], [0, 1], [override]
+
+        return [package("c", "1.0"), package("b", "1.0", "c")], [0, 2], [override, {"name": "nested"}]
+
+    solver = SimpleNamespace(
+        _provider=fake_provider(), _overrides=[], _parallel_overrides=True, _solve_branch=solve_branch
+    )
+
+    packages, depths = Solver.solve_in_compatibility_mode(solver, ({"name": "first"}, {"name": "second"}))
+
+    assert len(threads) == 2
+    assert [p.name for p in packages] == ["a", "b", "c"]
+    assert depths == [0, 2, 0]
+    assert [d.name for d in packages[1].requires] == ["c"]
+    assert solver._overrides == [{"name": "first"}, {"name": "second"}, {"name": "nested"}]
+
+
+def test_nested_overrides_are_solved_serially():
+    threads = set()
+
+    def solve_branch(override, use_latest=None, pinned=()):
+        threads.add(threading.get_ident())
+        return [package(override["name"], "1.0")], [0], [override]
+
+    solver = SimpleNamespace(
+        _provider=fake_provider(), _overrides=[], _parallel_overrides=False, _solve_branch=solve_branch
+    )
+
+    packages, depths = Solver.solve_in_compatibility_mode(solver, ({"name": "a"}, {"name": "b"}))
+
+    assert threads == {threading.get_ident()}
+    assert [p.name for p in packages] == ["a", "b"]
+    assert depths == [0, 0]
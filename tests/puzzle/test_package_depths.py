@@ -0,0 +1,47 @@
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+from poetry.core.packages.project_package import ProjectPackage
+
+from poetry.puzzle.solver import PackageNode
+from poetry.puzzle.solver import aggregate_package_nodes
+from poetry.puzzle.solver import depth_first_search
+
+
+def package(name, *requires):
+    result = Package(name, "1.0")
+    for requirement in requires:
+        result.add_dependency(Dependency(requirement, "*"))
+
+    return result
+
+
+def depths(root, packages):
+    results = depth_first_search(PackageNode(root, packages, seen=set()), aggregate_package_nodes)
+    return sorted((package.name, depth, package.optional) for package, depth in results)
+
+
+def test_packages_get_their_deepest_depth():
+    root = ProjectPackage("root", "1.0")
+    root.add_dependency(Dependency("a", "*"))
+    root.add_dependency(Dependency("c", "*"))
+    root.add_dependency(Dependency("e", "*", optional=True))
+
+    packages = [package("a", "b"), package("b", "c"), package("c", "d"), package("d"), package("e", "d")]
+
+    assert depths(root, packages) == [
+        ("a", 0, False),
+        ("b", 1, False),
+        ("c", 2, False),
+        ("d", 3, False),
+        ("e", 0, True),
+        ("root", -1, True),
+    ]
+
+
+def test_dependency_cycles_are_visited_once():
+    root = ProjectPackage("root", "1.0")
+    root.add_dependency(Dependency("a", "*"))
+
+    packages = [package("a", "b"), package("b", "c"), package("c", "a")]
+
+    assert [name for name, _, _ in depths(root, packages)] == ["a", "b", "c", "root"]
@@ -0,0 +1,80 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.puzzle.provider import Provider
+from poetry.puzzle.provider import ProviderCache
+from poetry.repositories import Pool
+from poetry.repositories import Repository
+
+
+def test_pools_with_the_same_repositories_share_search_results():
+    shared = Repository(name="shared")
+    cache = ProviderCache()
+
+    with cache.lock:
+        cache.search_results(Pool([shared]), "foo")[Dependency("foo", "*")] = [Package("foo", "1.0")]
+
+        assert Dependency("foo", "*") in cache.search_results(Pool([shared]), "foo")
+        assert cache.search_results(Pool([shared]), "bar") == {}
+        assert cache.search_results(Pool([shared, Repository(name="other")]), "foo") == {}
+        assert cache.search_results(Pool([shared], parent=Pool([Repository(name="other")])), "foo") == {}
+
+
+def test_packages_are_created_once_and_handed_out_as_clones():
+    cache = ProviderCache()
+    created = []
+    lock = threading.Lock()
+
+    def create():
+        with lock:
+            created.append(1)
+
+        time.sleep(0.01)
+        return Package("demo", "1.0", source_type="directory", source_url="/workspace/demo")
+
+    key = ("directory", "/workspace/demo", "demo")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        packages = list(executor.map(lambda _: cache.package(key, create), range(8)))
+
+    assert len(created) == 1
+    assert len({id(package) for package in packages}) == len(packages)
+
+    packages[0].develop = True
+    assert not cache.package(key, create).develop
+
+
+def provider(cache, pool):
+    provider = Provider.__new__(Provider)
+    provider._cache = cache
+    provider._pool = pool
+    provider._search_for = {}
+    provider._search_for_sem = threading.Semaphore()
+
+    return provider
+
+
+def test_searches_reuse_the_shared_results_of_the_same_package():
+    repository = Repository(name="shared")
+    for version in ("1.0", "1.5", "2.0"):
+        repository.add_package(Package("foo", version))
+    repository.add_package(Package("bar", "1.0"))
+
+    cache = ProviderCache()
+    first = provider(cache, Pool([repository]))
+    assert [p.pretty_version for p in first.search_for(Dependency("foo", "*"))] == ["2.0", "1.5", "1.0"]
+
+    repository.remove_package(Package("foo", "2.0"))
+
+    second = provider(cache, Pool([repository]))
+    assert [p.pretty_version for p in second.search_for(Dependency("foo", "^1.0"))] == ["1.5", "1.0"]
+    assert [p.pretty_version for p in second.search_for(Dependency("foo", ">=2.0"))] == ["2.0"]
+    assert [p.name for p in second.search_for(Dependency("bar", "*"))] == ["bar"]
+
+    with cache.lock:
+        assert list(cache.search_results(Pool([repository]), "foo")) == [Dependency("foo", "*")]
+        assert list(cache.search_results(Pool([repository]), "bar")) == [Dependency("bar", "*")]
@@ -0,0 +1,87 @@
+from poetry.core.packages.package import Package
+
+from poetry.puzzle.transaction import Transaction
+
+
+def summary(operations):
+    return [
+        (operation.job_type, operation.package.name, str(operation.package.version), operation.skipped)
+        for operation in operations
+    ]
+
+
+def test_result_packages_are_installed_updated_or_skipped():
+    transaction = Transaction(
+        [],
+        [
+            (Package("a", "1.0.0"), 0),
+            (Package("b", "2.0.0"), 0),
+            (Package("c", "1.0.0"), 0),
+            (Package("d", "1.0.0", source_type="legacy", source_url="https://foo.bar/simple"), 0),
+            (Package("e", "1.0.0", source_type="git", source_url="https://github.com/demo/e.git",
+                     source_reference="main"), 0),
+        ],
+        installed_packages=[
+            Package("b", "1.0.0"),
+            Package("c", "1.0.0"),
+            Package("d", "1.0.0"),
+            Package("e", "1.0.0"),
+        ],
+    )
+
+    assert summary(transaction.calculate_operations()) == [
+        ("install", "a", "1.0.0", False),
+        ("update", "b", "2.0.0", False),
+        ("install", "c", "1.0.0", True),
+        ("install", "d", "1.0.0", True),
+        ("update", "e", "1.0.0", False),
+    ]
+
+
+def test_every_installed_copy_of_a_removed_package_is_uninstalled():
+    transaction = Transaction(
+        [Package("a", "1.0.0"), Package("b", "1.0.0")],
+        [(Package("a", "1.0.0"), 0)],
+        installed_packages=[Package("a", "1.0.0"), Package("b", "1.0.0"), Package("b", "1.0.0")],
+    )
+
+    assert summary(transaction.calculate_operations()) == [
+        ("uninstall", "b", "1.0.0", False),
+        ("uninstall", "b", "1.0.0", False),
+        ("install", "a", "1.0.0", True),
+    ]
+    assert summary(transaction.calculate_operations(with_uninstalls=False)) == [
+        ("install", "a", "1.0.0", True),
+    ]
+
+
+def test_synchronize_keeps_the_root_and_unmanaged_build_tools():
+    transaction = Transaction(
+        [Package("a", "1.0.0"), Package("setuptools", "50.0.0")],
+        [(Package("a", "1.0.0"), 0), (Package("setuptools", "50.0.0"), 0)],
+        installed_packages=[
+            Package("a", "1.0.0"),
+            Package("setuptools", "50.0.0"),
+            Package("pip", "21.0"),
+            Package("root", "1.0.0"),
+            Package("stale", "1.0.0"),
+        ],
+        root_package=Package("root", "1.0.0"),
+    )
+
+    assert summary(transaction.calculate_operations(synchronize=True)) == [
+        ("uninstall", "stale", "1.0.0", False),
+        ("install", "a", "1.0.0", True),
+        ("install", "setuptools", "50.0.0", True),
+    ]
+
+
+def test_operations_are_sorted_by_priority_then_name():
+    # uninstalls have the highest priority
+    transaction = Transaction(
+        [Package("d", "1.0.0")],
+        [(Package("b", "1.0.0"), 0), (Package("c", "1.0.0"), 2), (Package("a", "1.0.0"), 0)],
+        installed_packages=[Package("d", "1.0.0")],
+    )
+
+    assert [operation.package.name for operation in transaction.calculate_operations()] == ["d", "c", "a", "b"]
@@ -0,0 +1,72 @@
+import os
+import shutil
+
+import pytest
+
+from poetry.repositories import installed_repository
+from poetry.repositories.installed_repository import InstalledRepository
+from poetry.utils.env import MockEnv
+
+
+def install(lib, name, version, requires=()):
+    dist_info = lib / f"{name}-{version}.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\nSummary: The {name} package\n"
+        + "".join(f"Requires-Dist: {requirement}\n" for requirement in requires)
+    )
+    return dist_info
+
+
+@pytest.fixture()
+def env(tmp_path, mocker):
+    mocker.patch.object(installed_repository, "CACHE_DIR", str(tmp_path / "cache"))
+
+    lib = tmp_path / "venv" / "lib"
+    lib.mkdir(parents=True)
+    env = MockEnv(path=tmp_path / "venv", sys_path=[str(lib)])
+    env._paths = {"purelib": str(lib), "platlib": str(lib)}
+
+    install(lib, "foo", "1.0", ["bar>=2.0"])
+    install(lib, "bar", "2.0")
+    return env
+
+
+def installed(env):
+    return sorted(
+        (package.name, package.version.text, package.description, [str(dep) for dep in package.requires])
+        for package in InstalledRepository.load(env, with_dependencies=True).packages
+    )
+
+
+def test_unchanged_distributions_are_not_parsed_again(env, mocker):
+    expected = [("bar", "2.0", "The bar package", []), ("foo", "1.0", "The foo package", ["bar (>=2.0)"])]
+    assert installed(env) == expected
+
+    record_of = mocker.spy(InstalledRepository, "_record_of")
+    assert installed(env) == expected
+    assert record_of.call_count == 0
+
+
+def test_changed_distributions_are_parsed_again(env, mocker):
+    installed(env)
+    record_of = mocker.spy(InstalledRepository, "_record_of")
+
+    shutil.rmtree(str(env.purelib / "bar-2.0.dist-info"))
+    install(env.purelib, "bar", "3.0")
+    assert [package[:2] for package in installed(env)] == [("bar", "3.0"), ("foo", "1.0")]
+    assert record_of.call_count == 1
+
+    metadata = env.purelib / "foo-1.0.dist-info" / "METADATA"
+    metadata.write_text(metadata.read_text().replace("The foo package", "Changed"))
+    stat = metadata.parent.stat()
+    os.utime(str(metadata.parent), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert installed(env)[1][2] == "Changed"
+    assert record_of.call_count == 2
+
+
+def test_unreadable_indexes_are_rebuilt(env):
+    installed(env)
+    InstalledRepository._index_file(env).write_text("{")
+
+    assert [package[:2] for package in installed(env)] == [("bar", "2.0"), ("foo", "1.0")]
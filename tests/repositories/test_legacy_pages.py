@@ -0,0 +1,144 @@
+import json
+
+from types import SimpleNamespace
+
+from poetry.core.packages.utils.link import Link
+from poetry.core.semver.version import Version
+
+from poetry.repositories import legacy_repository
+from poetry.repositories.legacy_repository import JsonPage
+from poetry.repositories.legacy_repository import LegacyRepository
+from poetry.repositories.legacy_repository import Page
+
+
+HTML_PAGE = b"""<!DOCTYPE html>
+<html>
+  <body>
+    <a href="demo-1.0.tar.gz#sha256=aaaa" data-requires-python="&gt;=3.6">demo-1.0.tar.gz</a>
+    <a href="demo-1.0-py3-none-any.whl#sha256=bbbb" data-core-metadata="sha256=cccc">demo-1.0-py3-none-any.whl</a>
+    <a href="demo-2.0-py3-none-any.whl#sha256=dddd" data-dist-info-metadata="true">demo-2.0-py3-none-any.whl</a>
+    <a href="demo-2.0.exe">demo-2.0.exe</a>
+  </body>
+</html>
+"""
+
+JSON_PAGE = json.dumps(
+    {
+        "meta": {"api-version": "1.0"},
+        "name": "demo",
+        "files": [
+            {
+                "filename": "demo-1.0.tar.gz",
+                "url": "https://files.example.com/demo-1.0.tar.gz",
+                "hashes": {"sha256": "aaaa"},
+                "requires-python": ">=3.6",
+            },
+            {
+                "filename": "demo-1.0-py3-none-any.whl",
+                "url": "../../files/demo-1.0-py3-none-any.whl",
+                "hashes": {"md5": "eeee"},
+                "core-metadata": {"sha256": "cccc"},
+            },
+            {
+                "filename": "demo-2.0-py3-none-any.whl",
+                "url": "https://files.example.com/demo-2.0-py3-none-any.whl",
+                "hashes": {},
+                "dist-info-metadata": True,
+            },
+        ],
+    }
+).encode()
+
+
+def test_json_page_links_carry_a_hash_fragment():
+    page = JsonPage("https://example.com/simple/demo", JSON_PAGE, {})
+
+    assert [link.url for link in page.links] == [
+        "https://files.example.com/demo-1.0.tar.gz#sha256=aaaa",
+        "https://example.com/files/demo-1.0-py3-none-any.whl#md5=eeee",
+        "https://files.example.com/demo-2.0-py3-none-any.whl",
+    ]
+    assert next(page.links).requires_python == ">=3.6"
+
+
+def test_json_page_dist_metadata():
+    page = JsonPage("https://example.com/simple/demo", JSON_PAGE, {})
+    sdist, wheel, other_wheel = page.links
+
+    assert page.dist_metadata(sdist) is None
+    assert page.dist_metadata(wheel) == {"sha256": "cccc"}
+    assert page.dist_metadata(other_wheel) == {}
+
+
+def test_html_page_dist_metadata():
+    page = Page("https://example.com/simple/demo/", HTML_PAGE, {"Content-Type": "text/html; charset=utf-8"})
+    sdist, wheel, other_wheel = page.links
+
+    assert page.dist_metadata(sdist) is None
+    assert page.dist_metadata(wheel) == {"sha256": "cccc"}
+    assert page.dist_metadata(other_wheel) == {}
+    assert page.dist_metadata(Link("https://example.com/simple/demo/unknown-1.0.tar.gz")) is None
+
+
+def test_html_page_links_by_version():
+    page = Page("https://example.com/simple/demo", HTML_PAGE, {})
+
+    assert [link.filename for link in page.links] == [
+        "demo-1.0.tar.gz",
+        "demo-1.0-py3-none-any.whl",
+        "demo-2.0-py3-none-any.whl",
+    ]
+    assert next(page.links).url == "https://example.com/simple/demo/demo-1.0.tar.gz#sha256=aaaa"
+    assert next(page.links).requires_python == ">=3.6"
+    assert list(page.versions) == [Version.parse("1.0"), Version.parse("2.0")]
+    assert [link.filename for link in page.links_for_version(Version.parse("1.0"))] == [
+        "demo-1.0.tar.gz",
+        "demo-1.0-py3-none-any.whl",
+    ]
+    assert list(page.links_for_version(Version.parse("3.0"))) == []
+
+
+def test_loaded_page_does_not_parse_again(mocker):
+    page = Page("https://example.com/simple/demo/", HTML_PAGE, {})
+    loaded = Page.load(json.loads(json.dumps(page.asdict())))
+    parse_files = mocker.spy(loaded, "_parse_files")
+
+    assert loaded.asdict() == page.asdict()
+    assert [(link.url, link.requires_python) for link in loaded.links] == [
+        (link.url, link.requires_python) for link in page.links
+    ]
+    assert list(loaded.versions) == list(page.versions)
+    assert [loaded.dist_metadata(link) for link in loaded.links] == [
+        page.dist_metadata(link) for link in page.links
+    ]
+    assert parse_files.call_count == 0
+
+
+def test_cached_pages_are_replaced_when_their_content_changes(tmp_path, mocker):
+    url = "https://example.com/simple/demo/"
+    content = {"page": HTML_PAGE}
+
+    def get(request_url, **kwargs):
+        return SimpleNamespace(
+            status_code=200, url=request_url, content=content["page"], headers={}, raise_for_status=lambda: None
+        )
+
+    mocker.patch.object(legacy_repository, "REPOSITORY_CACHE_DIR", tmp_path)
+    mocker.patch.object(legacy_repository.http, "cached_session", return_value=SimpleNamespace(get=get))
+    parse_files = mocker.spy(Page, "_parse_files")
+
+    def fetch():
+        # a new repository does not share the in-memory pages of the previous ones
+        return [link.filename for link in LegacyRepository("demo", "https://example.com/simple")._get("/demo/").links]
+
+    assert fetch() == ["demo-1.0.tar.gz", "demo-1.0-py3-none-any.whl", "demo-2.0-py3-none-any.whl"]
+    assert fetch() == ["demo-1.0.tar.gz", "demo-1.0-py3-none-any.whl", "demo-2.0-py3-none-any.whl"]
+    assert parse_files.call_count == 1
+
+    content["page"] = HTML_PAGE.replace(b"demo-2.0", b"demo-3.0")
+    assert fetch() == ["demo-1.0.tar.gz", "demo-1.0-py3-none-any.whl", "demo-3.0-py3-none-any.whl"]
+    assert fetch() == ["demo-1.0.tar.gz", "demo-1.0-py3-none-any.whl", "demo-3.0-py3-none-any.whl"]
+    assert parse_files.call_count == 2
+
+    # the entry of the page was replaced rather than added next to the previous one
+    assert len([path for path in (tmp_path / "demo").rglob("*") if path.is_file()]) == 1
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+from cachy import CacheManager
+
+from poetry.inspection.info import PackageInfo
+from poetry.repositories.pypi_repository import PyPiRepository
+
+
+def project(python_full_version="3.9.1"):
+    marker_env = {
+        "implementation_name": "cpython",
+        "python_full_version": python_full_version,
+        "sys_platform": "linux",
+        "platform_machine": "x86_64",
+    }
+    return SimpleNamespace(env=SimpleNamespace(marker_env=marker_env))
+
+
+def cached_repository(mocker, record):
+    repository = PyPiRepository()
+    repository._cache = CacheManager(
+        {"default": "releases", "serializer": "json", "stores": {"releases": {"driver": "dict"}}}
+    )
+    fetch = mocker.patch.object(repository, "_get_release_info", return_value=record)
+    return repository, fetch
+
+
+def record(**kwargs):
+    info = PackageInfo(
+        name="demo",
+        version="1.0",
+        requires_dist=["requests (>=2.0)"],
+        cache_version=str(PyPiRepository.CACHE_VERSION),
+    )
+    return {**info.asdict(), **kwargs}
+
+
+def test_release_info_is_fetched_once(mocker):
+    repository, fetch = cached_repository(mocker, record())
+
+    first = repository.get_release_info("demo", "1.0", project())
+    second = repository.get_release_info("demo", "1.0", project())
+
+    assert fetch.call_count == 1
+    assert first.asdict() == second.asdict()
+    assert second.requires_dist == ["requests (>=2.0)"]
+
+
+def test_outdated_release_info_is_fetched_again(mocker):
+    repository, fetch = cached_repository(mocker, record(_cache_version="1.0.0"))
+
+    repository.get_release_info("demo", "1.0", project())
+    repository.get_release_info("demo", "1.0", project())
+
+    assert fetch.call_count == 2
+
+
+def test_environment_specific_release_info_is_only_reused_in_the_same_environment(mocker):
+    repository, fetch = cached_repository(mocker, record(_env=PyPiRepository._release_env_key(project())))
+
+    info = repository.get_release_info("demo", "1.0", project())
+    repository.get_release_info("demo", "1.0", project())
+    assert fetch.call_count == 1
+    assert "_env" not in info.asdict()
+
+    repository.get_release_info("demo", "1.0", project("3.10.0"))
+    assert fetch.call_count == 2
@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+from poetry.config.config import Config
+from poetry.factory import Factory
+from poetry.repositories import Pool
+from poetry.repositories import Repository
+
+
+def test_repositories_are_shared_by_key(mocker):
+    mocker.patch.object(Factory, "_repositories", {})
+    create = mocker.Mock(side_effect=lambda: object())
+
+    first = Factory._shared_repository(("legacy", "foo", "https://foo.bar/simple"), create)
+    second = Factory._shared_repository(("legacy", "foo", "https://foo.bar/simple"), create)
+    other = Factory._shared_repository(("legacy", "foo", "https://mirror.foo.bar/simple"), create)
+
+    assert first is second
+    assert other is not first
+    assert create.call_count == 2
+
+
+def test_repository_keys_do_not_contain_credentials(mocker):
+    mocker.patch.object(Factory, "_repositories", {})
+    mocker.patch.object(
+        Factory, "create_legacy_repository", side_effect=lambda source, config: Repository(name=source["name"])
+    )
+    io = mocker.Mock(is_debug=lambda: False)
+    source = {"name": "foo", "url": "https://foo.bar/simple", "default": True}
+
+    def configure(password):
+        config = Config(use_environment=False)
+        config.merge({"http-basic": {"foo": {"username": "user", "password": password}}})
+        project = SimpleNamespace(pool=Pool())
+        Factory.configure_sources(project, [source], config, io)
+
+        return project.pool.repository("foo")
+
+    first = configure("s3cr3t")
+    assert configure("s3cr3t") is first
+    assert configure("other") is not first
+
+    assert len(Factory._repositories) == 2
+    assert not any("s3cr3t" in str(key) or "other" in str(key) for key in Factory._repositories)
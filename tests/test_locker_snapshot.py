@@ -0,0 +1,101 @@
+import pytest
+
+from poetry.packages import locker as locker_module
+from poetry.packages.locker import Locker
+
+
+LOCK = """\
+[[package]]
+name = "requests"
+version = "2.25.1"
+description = "Python HTTP for Humans."
+category = "main"
+optional = false
+python-versions = ">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*"
+
+[package.dependencies]
+idna = ">=2.5,<3"
+
+[[package]]
+name = "idna"
+version = "2.10"
+description = "Internationalized Domain Names in Applications (IDNA)"
+category = "main"
+optional = false
+python-versions = ">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*"
+
+[metadata]
+lock-version = "1.1"
+python-versions = "^3.6"
+content-hash = "123456789"
+
+[metadata.files]
+requests = [
+    {file = "requests-2.25.1-py2.py3-none-any.whl", hash = "sha256:aaaa"},
+]
+idna = []
+"""
+
+
+@pytest.fixture()
+def lock(tmp_path, mocker):
+    mocker.patch.object(locker_module, "CACHE_DIR", str(tmp_path / "cache"))
+
+    lock = tmp_path / "project" / "poetry.lock"
+    lock.parent.mkdir()
+    lock.write_text(LOCK)
+    return lock
+
+
+def locked(lock):
+    return {(package.name, package.version.text) for package in Locker(lock, {}).locked_repository().packages}
+
+
+def test_unchanged_lock_files_are_loaded_from_the_snapshot(lock, mocker):
+    assert locked(lock) == {("requests", "2.25.1"), ("idna", "2.10")}
+
+    mocker.patch.object(Locker, "_get_lock_data", side_effect=AssertionError)
+    mocker.patch.object(Locker, "_create_locked_packages", side_effect=AssertionError)
+    locker = Locker(lock, {})
+
+    packages = locker.locked_repository().packages
+    assert {(package.name, package.version.text) for package in packages} == {("requests", "2.25.1"), ("idna", "2.10")}
+    assert [dependency.name for dependency in packages[0].requires] == ["idna"]
+    assert packages[0].files == [{"file": "requests-2.25.1-py2.py3-none-any.whl", "hash": "sha256:aaaa"}]
+
+    # every call returns new packages
+    assert locker.locked_repository().packages[0] is not packages[0]
+
+
+def test_snapshots_of_changed_lock_files_are_ignored(lock):
+    locked(lock)
+    lock.write_text(LOCK.replace('version = "2.10"', 'version = "2.9"'))
+
+    assert locked(lock) == {("requests", "2.25.1"), ("idna", "2.9")}
+
+
+def test_snapshots_of_another_core_version_are_ignored(lock, mocker):
+    locked(lock)
+
+    mocker.patch.object(locker_module, "core_version", "0.0.0")
+    create = mocker.spy(Locker, "_create_locked_packages")
+
+    assert locked(lock) == {("requests", "2.25.1"), ("idna", "2.10")}
+    assert create.call_count == 1
+
+
+def test_unreadable_snapshots_are_rebuilt(lock, mocker):
+    locker = Locker(lock, {})
+    locker.locked_repository()
+    snapshot = locker._snapshot_file()
+
+    snapshot.write_bytes(b"not a pickle")
+    assert locked(lock) == {("requests", "2.25.1"), ("idna", "2.10")}
+
+    locker = Locker(lock, {})
+    locker.lock_data
+    locker._locked_packages = b"not a pickle"
+    create = mocker.spy(Locker, "_create_locked_packages")
+
+    assert {package.name for package in locker.locked_repository().packages} == {"requests", "idna"}
+    assert create.call_count == 1
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from poetry.managed_project import ManagedProject
+
+
+class Project:
+    def __init__(self, name, *siblings):
+        self.name = name
+        self.path = Path("/workspace", name)
+        self._siblings = siblings
+
+    def _sibling_paths(self):
+        return {Path("/workspace", sibling) for sibling in self._siblings}
+
+
+def run(projects, workers, action):
+    root = SimpleNamespace(
+        projects_graph=lambda: iter(projects),
+        config=SimpleNamespace(get=lambda key, default=None: workers),
+    )
+    return ManagedProject.run_on_projects_graph(root, action)
+
+
+def recorder(failing=()):
+    lock = threading.Lock()
+    events = []
+
+    def action(project):
+        with lock:
+            events.append(("start", project.name))
+
+        time.sleep(0.01)
+
+        with lock:
+            events.append(("end", project.name))
+
+        return 1 if project.name in failing else 0
+
+    return events, action
+
+
+def test_projects_run_in_order_with_a_single_worker():
+    projects = [Project("lib"), Project("app", "lib"), Project("tool")]
+    events, action = recorder(failing={"app"})
+
+    assert run(projects, 1, action) == 1
+    assert events == [("start", "lib"), ("end", "lib"), ("start", "app"), ("end", "app")]
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_projects_wait_for_their_siblings(workers):
+    projects = [Project("core"), Project("lib", "core"), Project("app", "lib", "core"), Project("tool")]
+    events, action = recorder()
+
+    assert run(projects, workers, action) == 0
+    assert len(events) == 2 * len(projects)
+    for project in projects:
+        for sibling in project._siblings:
+            assert events.index(("end", sibling)) < events.index(("start", project.name))
+
+
+def test_no_project_starts_after_a_failure():
+    projects = [Project("lib"), Project("app", "lib"), Project("tool", "app")]
+    events, action = recorder(failing={"lib"})
+
+    assert run(projects, 2, action) == 1
+    assert events == [("start", "lib"), ("end", "lib")]
+
+
+def test_sibling_cycles_do_not_deadlock():
+    projects = [Project("a", "b"), Project("b", "a")]
+    events, action = recorder()
+
+    assert run(projects, 2, action) == 0
+    assert events == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
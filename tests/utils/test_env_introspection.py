@@ -0,0 +1,55 @@
+import sys
+import venv
+
+from pathlib import Path
+
+import pytest
+
+from poetry.utils.env import VirtualEnv
+
+
+@pytest.fixture()
+def venv_path(tmp_path, mocker):
+    mocker.patch("poetry.utils.env.CACHE_DIR", str(tmp_path / "cache"))
+
+    path = tmp_path / "venv"
+    venv.create(str(path), with_pip=False, symlinks=sys.platform != "win32")
+    return path
+
+
+def test_introspection_runs_a_single_interpreter(venv_path, mocker):
+    run_python_script = mocker.spy(VirtualEnv, "run_python_script")
+
+    env = VirtualEnv(venv_path)
+
+    assert env.version_info[:3] == tuple(sys.version_info[:3])
+    assert env.marker_env["python_full_version"].startswith(".".join(map(str, sys.version_info[:2])))
+    assert venv_path in Path(env.paths["purelib"]).parents
+    assert env.supported_tags
+    assert env.base == Path(sys.base_prefix)
+    assert run_python_script.call_count == 1
+
+
+def test_introspection_is_reused_from_the_cache(venv_path, mocker):
+    first = VirtualEnv(venv_path)
+    marker_env, paths = first.marker_env, first.paths
+
+    run_python_script = mocker.patch.object(VirtualEnv, "run_python_script", side_effect=AssertionError)
+    second = VirtualEnv(venv_path)
+
+    assert second.marker_env == marker_env
+    assert second.paths == paths
+    assert [str(tag) for tag in second.supported_tags] == [str(tag) for tag in first.supported_tags]
+    assert run_python_script.call_count == 0
+
+
+def test_introspection_is_refreshed_when_the_environment_changes(venv_path, mocker):
+    VirtualEnv(venv_path).marker_env
+
+    cfg = venv_path / "pyvenv.cfg"
+    cfg.write_text(cfg.read_text() + "prompt = changed\n")
+
+    run_python_script = mocker.spy(VirtualEnv, "run_python_script")
+    VirtualEnv(venv_path).marker_env
+
+    assert run_python_script.call_count == 1
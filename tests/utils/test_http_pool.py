@@ -0,0 +1,94 @@
+import threading
+
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from poetry.utils import http
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures = 0
+
+    def do_GET(self):
+        if Handler.failures:
+            Handler.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = b"hello"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    server = Server(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+        Handler.failures = 0
+
+
+@pytest.fixture(autouse=True)
+def pool(mocker):
+    mocker.patch.object(http, "_settings", return_value={
+        "retries": 2, "retry-backoff-ms": 0, "max-connections-per-host": 4
+    })
+    mocker.patch.object(http, "_pool_manager", None)
+    mocker.patch.object(http, "_adapters", {})
+    mocker.patch.object(http, "_metrics", http._Metrics())
+    mocker.patch.object(http, "_global_sessions", threading.local())
+
+
+def test_sessions_of_all_threads_share_the_connection_pool(server):
+    sessions = []
+
+    def fetch():
+        session = http.session()
+        sessions.append(session)
+        for _ in range(3):
+            assert session.get(server).content == b"hello"
+
+    for _ in range(2):
+        thread = threading.Thread(target=fetch)
+        thread.start()
+        thread.join()
+
+    assert sessions[0] is not sessions[1]
+    assert sessions[0].get_adapter(server).poolmanager is sessions[1].get_adapter(server).poolmanager
+    assert http.metrics() == {"connections_opened": 1, "requests": 6, "bytes_read": 30, "connections_reused": 5}
+
+
+def test_cached_sessions_use_the_same_connections(server):
+    http.session().get(server)
+    http.cached_session().get(server)
+
+    assert http.metrics()["connections_opened"] == 1
+
+
+def test_unavailable_responses_are_retried(server):
+    Handler.failures = 2
+
+    response = http.session().get(server)
+
+    assert response.status_code == 200
+    assert http.metrics()["requests"] == 3
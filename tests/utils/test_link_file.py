@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from poetry.utils.helpers import link_file
+
+
+@pytest.mark.parametrize("mode", ["copy", "hardlink", "reflink"])
+def test_link_file_materializes_the_source(tmp_path, mode):
+    src = tmp_path / "src.txt"
+    src.write_text("content")
+    dst = tmp_path / "dst.txt"
+    dst.write_text("old content")
+
+    used = link_file(src, dst, mode)
+
+    assert dst.read_text() == "content"
+    assert used in {mode, "copy"}
+    assert [path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")] == []
+
+
+def test_hardlinks_share_the_source_inode(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("content")
+    dst = tmp_path / "dst.txt"
+
+    if link_file(src, dst, "hardlink") == "hardlink":
+        assert os.stat(str(dst)).st_ino == os.stat(str(src)).st_ino